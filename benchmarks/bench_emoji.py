@@ -0,0 +1,48 @@
+"""Benchmark of emoji normalization on emoji-heavy, NSMC-like reviews.
+Compares 'EmojiMatcher' to a regex alternation of all emoji sequences, which it replaced.
+
+$ python benchmarks/bench_emoji.py --lines 20000
+"""
+import re
+import time
+import random
+import argparse
+
+from prenlp.data.emoji import EmojiMatcher, load_emoji_sequences
+
+WORDS = ['아', '더빙', '진짜', '짜증나네요', '목소리', '흠', '포스터보고', '초딩영화줄', '오버연기조차', '가볍지', '않구나',
+         '너무재밓었다그래서보는것을추천한다', '교도소', '이야기구먼', '솔직히', '재미는', '없다', '평점', '조정', 'ㅋㅋㅋ', '10점']
+
+def generate_reviews(n_lines: int, emoji_ratio: float, seed: int=0) -> list:
+    rng = random.Random(seed)
+    emojis = load_emoji_sequences()
+    reviews = []
+    for _ in range(n_lines):
+        tokens = [rng.choice(emojis) if rng.random() < emoji_ratio else rng.choice(WORDS)
+                  for _ in range(rng.randint(3, 30))]
+        reviews.append(' '.join(tokens))
+    return reviews
+
+def measure(sub, reviews: list) -> float:
+    start = time.perf_counter()
+    for review in reviews:
+        sub(review)
+    return time.perf_counter() - start
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--lines',       default=20000, type=int,   help='number of generated reviews')
+    parser.add_argument('--emoji_ratio', default=0.2,   type=float, help='ratio of emojis among the tokens')
+    args = parser.parse_args()
+
+    reviews = generate_reviews(args.lines, args.emoji_ratio)
+    sequences = sorted(load_emoji_sequences(), key=len, reverse=True)
+    regex = re.compile('|'.join(re.escape(sequence) for sequence in sequences))
+    matcher = EmojiMatcher(sequences)
+    matcher.pattern # build the trie before measuring
+
+    elapsed_regex = measure(lambda text: regex.sub(' ', text), reviews)
+    elapsed_matcher = measure(lambda text: matcher.sub(' ', text), reviews)
+    print('regex alternation: {:.3f}s ({:.0f} lines/sec)'.format(elapsed_regex, args.lines/elapsed_regex))
+    print('EmojiMatcher     : {:.3f}s ({:.0f} lines/sec)'.format(elapsed_matcher, args.lines/elapsed_matcher))
+    print('speed-up         : {:.1f}x'.format(elapsed_regex/elapsed_matcher))
@@ -0,0 +1,49 @@
+"""Benchmark of Moses tokenization on generated, IMDb-like English reviews.
+Compares 'MosesTokenizer' to 'NLTKMosesTokenizer' when NLTK's Moses tokenizer is available (nltk<3.3),
+and counts the reviews on which their tokens differ.
+
+$ python benchmarks/bench_moses.py --lines 20000
+"""
+import time
+import random
+import argparse
+
+from prenlp.tokenizer import MosesTokenizer
+
+WORDS = ['I', 'this', 'movie', 'film', 'was', 'the', 'a', 'of', 'and', 'to', 'is', 'acting', 'plot', 'Mr.', 'Smith',
+         "didn't", "it's", "can't", "actors'", 'U.S.', 'e.g.', 'No.', '1', '5,300', '9.5', '$10', '50%', 'well-made',
+         'and/or', '(spoilers)', '"great"', 'really...', 'bad!', 'why?', '--', 'Ms.', 'pp.', '<br />', '&', 'café']
+
+def generate_reviews(n_lines: int, seed: int=0) -> list:
+    rng = random.Random(seed)
+    reviews = []
+    for _ in range(n_lines):
+        tokens = [rng.choice(WORDS) for _ in range(rng.randint(5, 60))]
+        reviews.append(' '.join(tokens) + rng.choice(['.', '!', '?', '']))
+    return reviews
+
+def measure(tokenize, reviews: list) -> tuple:
+    start = time.perf_counter()
+    tokens = [tokenize(review) for review in reviews]
+    return time.perf_counter() - start, tokens
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--lines', default=20000, type=int, help='number of generated reviews')
+    args = parser.parse_args()
+
+    reviews = generate_reviews(args.lines)
+    tokenizer = MosesTokenizer()
+    elapsed, tokens = measure(tokenizer.tokenize, reviews)
+    print('MosesTokenizer    : {:.3f}s ({:.0f} lines/sec)'.format(elapsed, args.lines/elapsed))
+
+    try:
+        from nltk.tokenize.moses import MosesTokenizer as NLTKMoses
+        reference = NLTKMoses()
+    except Exception as ex:
+        print('NLTKMosesTokenizer: skipped ({})'.format(ex))
+    else:
+        elapsed_nltk, tokens_nltk = measure(lambda text: reference.tokenize(text, escape=False), reviews)
+        print('NLTKMosesTokenizer: {:.3f}s ({:.0f} lines/sec)'.format(elapsed_nltk, args.lines/elapsed_nltk))
+        print('speed-up          : {:.1f}x'.format(elapsed_nltk/elapsed))
+        print('different outputs : {}'.format(sum(a != b for a, b in zip(tokens, tokens_nltk))))
@@ -0,0 +1,74 @@
+"""Generated corpora for the benchmarks, so that they run offline and reproducibly.
+Line lengths follow long-tailed (log-normal) distributions like those of the datasets they stand for:
+- english: IMDb-like English reviews, 150 tokens median (2 to 2,000)
+- korean: NSMC-like Korean reviews, 8 tokens median (1 to 60)
+- emoji: NSMC-like Korean reviews, a fifth of whose tokens are emoji sequences
+- markup: NamuWiki-like Korean paragraphs, with namu markups, HTML tags, urls and emails among 30 tokens median
+
+$ python benchmarks/corpora.py markup --lines 5
+"""
+import random
+import argparse
+
+from bench_moses import WORDS as ENGLISH_WORDS
+from bench_emoji import WORDS as KOREAN_WORDS
+
+KOREAN_WORDS = KOREAN_WORDS + ['재밌어요', '최고의', '배우들', '연기', '스토리가', '2시간', '아깝다', '...', '!!', '?', '강추', 'ㅠㅠ']
+
+MARKUPS = ["'''{}'''", '[[{}]]', '[[{}|{}]]', '[* {}]', '~~{}~~', '{{{{{{#!html {}}}}}}}', '<br />', '<b>{}</b>',
+           'https://namu.wiki/w/{}', 'user{}@example.com', '||{}||{}||', '[include(틀:{})]']
+
+def _length(rng, median: float, sigma: float, low: int, high: int) -> int:
+    return min(max(int(rng.lognormvariate(0, sigma) * median), low), high)
+
+def english(n_lines: int, seed: int=0) -> list:
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(n_lines):
+        tokens = [rng.choice(ENGLISH_WORDS) for _ in range(_length(rng, 150, 0.75, 2, 2000))]
+        lines.append(' '.join(tokens) + rng.choice(['.', '!', '?', '']))
+    return lines
+
+def korean(n_lines: int, seed: int=0) -> list:
+    rng = random.Random(seed)
+    return [' '.join(rng.choice(KOREAN_WORDS) for _ in range(_length(rng, 8, 0.7, 1, 60))) for _ in range(n_lines)]
+
+def emoji(n_lines: int, seed: int=0, emoji_ratio: float=0.2) -> list:
+    from prenlp.data.emoji import load_emoji_sequences
+
+    rng = random.Random(seed)
+    emojis = load_emoji_sequences()
+    lines = []
+    for _ in range(n_lines):
+        tokens = [rng.choice(emojis) if rng.random() < emoji_ratio else rng.choice(KOREAN_WORDS)
+                  for _ in range(_length(rng, 8, 0.7, 1, 60))]
+        lines.append(' '.join(tokens))
+    return lines
+
+def markup(n_lines: int, seed: int=0, markup_ratio: float=0.3) -> list:
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(n_lines):
+        tokens = []
+        for _ in range(_length(rng, 30, 0.8, 1, 400)):
+            if rng.random() < markup_ratio:
+                tokens.append(rng.choice(MARKUPS).format(rng.choice(KOREAN_WORDS), rng.choice(KOREAN_WORDS)))
+            else:
+                tokens.append(rng.choice(KOREAN_WORDS))
+        lines.append(' '.join(tokens))
+    return lines
+
+CORPORA = {'english': english, 'korean': korean, 'emoji': emoji, 'markup': markup}
+
+def generate(corpus: str, n_lines: int, seed: int=0) -> list:
+    return CORPORA[corpus](n_lines, seed=seed)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('corpus', choices=sorted(CORPORA), help='corpus to be generated')
+    parser.add_argument('--lines', default=10, type=int, help='number of generated lines')
+    parser.add_argument('--seed',  default=0,  type=int, help='seed of the random number generator')
+    args = parser.parse_args()
+
+    for line in generate(args.corpus, args.lines, args.seed):
+        print(line)
@@ -0,0 +1,52 @@
+"""Benchmark of the import time of prenlp modules, measured in fresh interpreters.
+Exits with status 1 if a module pulls in a module it should not (e.g. the download stack for 'prenlp.tokenizer'),
+so that it can be run as a CI check.
+
+$ python benchmarks/import_time.py --repeat 10
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+# Fresh interpreters import the prenlp of this checkout, from any working directory.
+ROOT = str(Path(__file__).resolve().parent.parent)
+
+# Modules which must not be loaded by importing the key module.
+FORBIDDEN = {
+    'prenlp': ['prenlp.data', 'prenlp.tokenizer', 'requests', 'py7zr', 'ijson', 'tqdm'],
+    'prenlp.tokenizer': ['prenlp.data', 'requests', 'py7zr', 'ijson', 'tqdm'],
+    'prenlp.data': ['requests', 'py7zr', 'ijson', 'tqdm', 'multiprocessing'],
+}
+
+SNIPPET = '''
+import sys, time, json
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'elapsed': elapsed, 'modules': sorted(sys.modules)}}))
+'''
+
+def measure(module: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT] + ([os.environ['PYTHONPATH']] if os.environ.get('PYTHONPATH') else [])))
+    output = subprocess.run([sys.executable, '-c', SNIPPET.format(module=module)],
+                            check=True, stdout=subprocess.PIPE, universal_newlines=True, env=env).stdout
+    return json.loads(output)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', default=5, type=int, help='number of fresh interpreters per module')
+    args = parser.parse_args()
+
+    failed = False
+    for module, forbidden in FORBIDDEN.items():
+        results = [measure(module) for _ in range(args.repeat)]
+        elapsed = statistics.median(result['elapsed'] for result in results)
+        loaded = [name for name in forbidden if name in results[0]['modules']]
+        print('{:<20} {:8.1f} ms  {}'.format(module, elapsed*1000, 'loads '+', '.join(loaded) if loaded else 'ok'))
+        failed = failed or bool(loaded)
+
+    sys.exit(1 if failed else 0)
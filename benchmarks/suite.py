@@ -0,0 +1,308 @@
+"""Benchmark suite of the normalizers, tokenizers, dataset loaders and exporters of prenlp, on generated corpora
+(see 'corpora.py'), so that it runs offline. Each benchmark runs in a fresh interpreter, single-core and, for the components
+with a parallel mode, with '--workers' processes, and reports lines/sec, bytes/sec and peak RSS of the main process
+(and of the largest worker). The import times of 'import_time.py' are reported as well.
+Results are saved as JSON, and 'compare' flags regressions against a stored baseline, exiting with status 1
+if any, so that it can be run as a CI check. Benchmarks whose dependencies are not installed are skipped.
+The prenlp of this checkout is measured, whether or not prenlp is installed, from any working directory.
+
+$ python benchmarks/suite.py run --lines 10000 --workers 4 --output baseline.json
+$ python benchmarks/suite.py run --only normalizer moses --output results.json
+$ python benchmarks/suite.py compare baseline.json results.json --threshold 0.1
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+from collections import deque
+
+# The checkout is imported before any installed prenlp, and the other benchmark scripts from this directory.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import corpora
+
+def consume(iterable) -> None:
+    deque(iterable, maxlen=0)
+
+def chunksize(lines: list, workers: int) -> int:
+    """Return a chunk size giving each worker about 4 chunks, capped at the default of 1000 lines,
+    so that parallel modes run in the process pool even on small corpora, which would fit in a single chunk.
+    """
+    return max(1, min(1000, len(lines) // (4*workers)))
+
+# Each setup receives the lines of a corpus, the number of workers and a temporary directory,
+# and returns the function to be measured. It raises ImportError when a dependency is not installed.
+
+def setup_normalizer(lines: list, workers: int, tmp_dir: Path):
+    from prenlp.data import Normalizer
+    from prenlp.utils import imap_ordered
+
+    normalizer = Normalizer()
+    return lambda: consume(imap_ordered(normalizer.normalize, lines, workers=workers, chunksize=chunksize(lines, workers)))
+
+def setup_namu_markup(lines: list, workers: int, tmp_dir: Path):
+    from prenlp.data import NamuMarkupNormalizer
+    from prenlp.utils import imap_ordered
+
+    normalizer = NamuMarkupNormalizer()
+    return lambda: consume(imap_ordered(normalizer.normalize, lines, workers=workers, chunksize=chunksize(lines, workers)))
+
+def _setup_tokenizer(tokenizer, lines: list, workers: int):
+    return lambda: consume(tokenizer.tokenize_parallel(lines, workers=workers, chunksize=chunksize(lines, workers)))
+
+def setup_moses(lines: list, workers: int, tmp_dir: Path):
+    from prenlp.tokenizer import MosesTokenizer
+
+    return _setup_tokenizer(MosesTokenizer(), lines, workers)
+
+def setup_nltk_moses(lines: list, workers: int, tmp_dir: Path):
+    from prenlp.tokenizer import NLTKMosesTokenizer
+
+    return _setup_tokenizer(NLTKMosesTokenizer(), lines, workers)
+
+def setup_mecab(lines: list, workers: int, tmp_dir: Path):
+    from prenlp.tokenizer import Mecab
+
+    return _setup_tokenizer(Mecab(), lines, workers)
+
+def setup_sentencepiece(lines: list, workers: int, tmp_dir: Path):
+    from prenlp.tokenizer import SentencePiece
+
+    # The vocabulary of the generated corpus is small, and so is that of the model.
+    model_prefix = str(tmp_dir/'sentencepiece')
+    SentencePiece.train(input=iter(lines), model_prefix=model_prefix, vocab_size=200, num_threads=1)
+    return _setup_tokenizer(SentencePiece.load(model_prefix+'.model'), lines, workers)
+
+def setup_load_sentiment(lines: list, workers: int, tmp_dir: Path):
+    from prenlp.data.dataset.sentiment import load_sentiment, save_sentiment
+
+    path = tmp_dir/'sentiment.txt'
+    save_sentiment([[line, str(i % 2)] for i, line in enumerate(lines)], path)
+    return lambda: load_sentiment(path)
+
+def setup_load_language_modeling(lines: list, workers: int, tmp_dir: Path):
+    from prenlp.data.dataset.language_modeling import load_language_modeling, save_language_modeling
+
+    path = tmp_dir/'language_modeling.txt'
+    save_language_modeling(lines, path)
+    return lambda: load_language_modeling(path)
+
+def setup_text_file(lines: list, workers: int, tmp_dir: Path):
+    from prenlp.data import TextFile
+    from prenlp.data.dataset.language_modeling import save_language_modeling
+
+    path = tmp_dir/'text_file.txt'
+    save_language_modeling(lines, path)
+    TextFile(path) # build the index before measuring
+    return lambda: consume(TextFile(path, parse=str.strip))
+
+def setup_fasttext_transform(lines: list, workers: int, tmp_dir: Path):
+    from prenlp.data import Normalizer, fasttext_transform
+
+    samples = [(line, i % 2) for i, line in enumerate(lines)]
+    normalizer = Normalizer()
+    return lambda: fasttext_transform(samples, tmp_dir/'fasttext.txt', normalizer=normalizer, workers=workers,
+                                      chunksize=chunksize(lines, workers))
+
+def setup_exact_dedup(lines: list, workers: int, tmp_dir: Path):
+    from prenlp.data import ExactDeduplicator
+
+    return lambda: consume(ExactDeduplicator(spill_dir=tmp_dir)(lines))
+
+def setup_minhash(lines: list, workers: int, tmp_dir: Path):
+    from prenlp.data import MinHashLSH
+
+    lsh = MinHashLSH()
+    return lambda: lsh.duplicates(lsh.signatures(lines, workers=workers, chunksize=min(256, chunksize(lines, workers))))
+
+def setup_bucket_batches(lines: list, workers: int, tmp_dir: Path):
+    from prenlp.data import bucket_batches
+
+    samples = [list(range(len(line.split()))) for line in lines]
+    return lambda: consume(bucket_batches(samples, max_tokens=16384, seed=0))
+
+# name: (corpus, setup, whether it has a parallel mode)
+BENCHMARKS = {
+    'normalizer/english':            ('english', setup_normalizer, True),
+    'normalizer/korean':             ('korean', setup_normalizer, True),
+    'normalizer/emoji':              ('emoji', setup_normalizer, True),
+    'normalizer/markup':             ('markup', setup_normalizer, True),
+    'namu_markup/markup':            ('markup', setup_namu_markup, True),
+    'moses/english':                 ('english', setup_moses, True),
+    'nltk_moses/english':            ('english', setup_nltk_moses, True),
+    'mecab/korean':                  ('korean', setup_mecab, True),
+    'sentencepiece/korean':          ('korean', setup_sentencepiece, True),
+    'load_sentiment/english':        ('english', setup_load_sentiment, False),
+    'load_language_modeling/markup': ('markup', setup_load_language_modeling, False),
+    'text_file/markup':              ('markup', setup_text_file, False),
+    'fasttext_transform/korean':     ('korean', setup_fasttext_transform, True),
+    'exact_dedup/korean':            ('korean', setup_exact_dedup, False),
+    'minhash/markup':                ('markup', setup_minhash, True),
+    'bucket_batches/english':        ('english', setup_bucket_batches, False),
+}
+
+def peak_rss_mb(children: bool=False) -> float:
+    """Return the peak resident set size of this process, or of its largest child, in MB.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None # not available on Windows
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    # in bytes on macOS, in kilobytes elsewhere
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+def measure(name: str, n_lines: int, workers: int, repeat: int, seed: int) -> dict:
+    """Measure a benchmark in this process. The best of 'repeat' runs is reported.
+    """
+    corpus, setup, _ = BENCHMARKS[name]
+    lines = corpora.generate(corpus, n_lines, seed)
+    n_bytes = sum(len(line.encode('utf-8')) for line in lines)
+    with tempfile.TemporaryDirectory(prefix='prenlp-benchmark-') as tmp_dir:
+        try:
+            run = setup(lines, workers, Path(tmp_dir))
+        except ImportError as ex:
+            return {'skipped': str(ex).split('. ')[0]}
+
+        elapsed = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            elapsed.append(time.perf_counter() - start)
+
+    seconds = min(elapsed)
+    result = {'corpus': corpus, 'workers': workers, 'lines': n_lines, 'bytes': n_bytes, 'seconds': seconds,
+              'lines_per_sec': n_lines/seconds, 'bytes_per_sec': n_bytes/seconds,
+              'peak_rss_mb': peak_rss_mb()}
+    if workers > 1:
+        result['peak_worker_rss_mb'] = peak_rss_mb(children=True)
+    return result
+
+def run_isolated(name: str, n_lines: int, workers: int, repeat: int, seed: int) -> dict:
+    """Measure a benchmark in a fresh interpreter, so that its peak RSS is its own.
+    """
+    command = [sys.executable, __file__, 'measure', name, '--lines', str(n_lines), '--workers', str(workers),
+               '--repeat', str(repeat), '--seed', str(seed)]
+    process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    if process.returncode != 0:
+        return {'error': process.stderr.strip().split('\n')[-1]}
+    return json.loads(process.stdout.strip().split('\n')[-1])
+
+def import_times(repeat: int) -> dict:
+    import import_time
+
+    results = {}
+    for module in import_time.FORBIDDEN:
+        seconds = statistics.median(import_time.measure(module)['elapsed'] for _ in range(repeat))
+        results['import/{}'.format(module)] = {'seconds': seconds}
+    return results
+
+def run(args) -> None:
+    import prenlp
+
+    names = [name for name in BENCHMARKS if not args.only or any(name.startswith(prefix) for prefix in args.only)]
+    results = {}
+    for name in names:
+        modes = [1, args.workers] if BENCHMARKS[name][2] and args.workers > 1 else [1]
+        for workers in modes:
+            key = '{}:{}'.format(name, 'single' if workers == 1 else 'parallel')
+            result = results[key] = run_isolated(name, args.lines, workers, args.repeat, args.seed)
+            print(format_result(key, result), flush=True)
+    if not args.only or 'import' in args.only:
+        for key, result in import_times(args.repeat).items():
+            results[key] = result
+            print(format_result(key, result), flush=True)
+
+    report = {'meta': {'prenlp': prenlp.__version__, 'python': platform.python_version(), 'platform': platform.platform(),
+                       'cpus': os.cpu_count(), 'lines': args.lines, 'workers': args.workers, 'repeat': args.repeat,
+                       'seed': args.seed, 'date': time.strftime('%Y-%m-%dT%H:%M:%S')},
+              'results': results}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as writer:
+            json.dump(report, writer, indent=2)
+        print('saved to {}'.format(args.output))
+
+def format_result(key: str, result: dict) -> str:
+    if 'skipped' in result or 'error' in result:
+        return '{:<40} {}'.format(key, 'skipped ({})'.format(result['skipped']) if 'skipped' in result
+                                  else 'error ({})'.format(result['error']))
+    if 'lines_per_sec' not in result:
+        return '{:<40} {:10.1f} ms'.format(key, result['seconds']*1000)
+    rss = '' if result['peak_rss_mb'] is None else '{:8.1f} MB peak RSS'.format(result['peak_rss_mb'])
+    if result.get('peak_worker_rss_mb'):
+        rss += ' ({:.1f} MB per worker)'.format(result['peak_worker_rss_mb'])
+    return '{:<40} {:10.0f} lines/sec {:8.2f} MB/sec {}'.format(key, result['lines_per_sec'], result['bytes_per_sec']/2**20, rss)
+
+def compare(args) -> None:
+    with open(args.baseline, 'r', encoding='utf-8') as reader:
+        baseline = json.load(reader)
+    with open(args.current, 'r', encoding='utf-8') as reader:
+        current = json.load(reader)
+    for key in ['lines', 'workers', 'cpus']:
+        if baseline['meta'].get(key) != current['meta'].get(key):
+            print('warning: {} differ, {} vs. {}'.format(key, baseline['meta'].get(key), current['meta'].get(key)))
+
+    # Only the benchmarks measured in both are compared, e.g. a subset run with '--only'.
+    regressions = 0
+    for key, new in current['results'].items():
+        base = baseline['results'].get(key, {})
+        if 'seconds' not in new:
+            continue
+        if 'seconds' not in base:
+            print('{:<40} not in the baseline'.format(key))
+            continue
+
+        # Throughput is compared as time per run, so that lower is better for every metric.
+        flags = []
+        change = new['seconds']/base['seconds'] - 1
+        if change > args.threshold:
+            flags.append('slower')
+        if base.get('peak_rss_mb') and new.get('peak_rss_mb'):
+            rss_change = new['peak_rss_mb']/base['peak_rss_mb'] - 1
+            if rss_change > args.rss_threshold:
+                flags.append('peak RSS {:+.1%}'.format(rss_change))
+        regressions += bool(flags)
+        print('{:<40} {:+8.1%} time {}'.format(key, change, 'REGRESSION: '+', '.join(flags) if flags else 'ok'))
+
+    print('{} regression(s)'.format(regressions))
+    sys.exit(1 if regressions else 0)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    parser_run = subparsers.add_parser('run', help='run the benchmarks')
+    parser_run.add_argument('--lines',   default=10000, type=int, help='number of generated lines per corpus')
+    parser_run.add_argument('--workers', default=os.cpu_count(), type=int, help='number of worker processes in parallel mode')
+    parser_run.add_argument('--repeat',  default=3, type=int, help='number of runs per benchmark, of which the best is reported')
+    parser_run.add_argument('--seed',    default=0, type=int, help='seed of the generated corpora')
+    parser_run.add_argument('--only',    default=None, nargs='+', help='prefixes of the benchmarks to run, e.g. normalizer import')
+    parser_run.add_argument('--output',  default=None, help='JSON file to save the results to')
+
+    parser_measure = subparsers.add_parser('measure', help='measure one benchmark in this process, as JSON')
+    parser_measure.add_argument('name', choices=sorted(BENCHMARKS))
+    parser_measure.add_argument('--lines',   default=10000, type=int)
+    parser_measure.add_argument('--workers', default=1, type=int)
+    parser_measure.add_argument('--repeat',  default=3, type=int)
+    parser_measure.add_argument('--seed',    default=0, type=int)
+
+    parser_compare = subparsers.add_parser('compare', help='compare results to a baseline, exiting with status 1 on regressions')
+    parser_compare.add_argument('baseline', help='JSON results of the baseline')
+    parser_compare.add_argument('current', help='JSON results to be compared')
+    parser_compare.add_argument('--threshold',     default=0.1, type=float, help='maximum relative increase of time per run')
+    parser_compare.add_argument('--rss_threshold', default=0.2, type=float, help='maximum relative increase of peak RSS')
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        run(args)
+    elif args.command == 'compare':
+        compare(args)
+    else:
+        print(json.dumps(measure(args.name, args.lines, args.workers, args.repeat, args.seed)))
@@ -1,7 +1,7 @@
 import fasttext
 import prenlp
 from prenlp.data import Normalizer
-from prenlp.tokenizer import NLTKMosesTokenizer
+from prenlp.tokenizer import MosesTokenizer
 
 normalizer = Normalizer(emoji_repl=None)
 
@@ -9,16 +9,18 @@ normalizer = Normalizer(emoji_repl=None)
 imdb_train, imdb_test = prenlp.data.IMDB()
 
 # Preprocessing
-tokenizer = NLTKMosesTokenizer()
-for dataset in [imdb_train, imdb_test]:
-    for i, (text, label) in enumerate(dataset):
-        dataset[i][0] = ' '.join(tokenizer(normalizer.normalize(text.strip()))) # both
-        # dataset[i][0] = text.strip() # original
-        # dataset[i][0] = normalizer.normalize(text.strip()) # only normalization
-        # dataset[i][0] = ' '.join(tokenizer(text.strip())) # only tokenization
+tokenizer = MosesTokenizer()
 
-prenlp.data.fasttext_transform(imdb_train, 'imdb.train')
-prenlp.data.fasttext_transform(imdb_test, 'imdb.test')
+def preprocess(sample: list) -> list:
+    text, label = sample
+    return [' '.join(tokenizer(normalizer.normalize(text.strip()))), label] # both
+    # return [text.strip(), label] # original
+    # return [normalizer.normalize(text.strip()), label] # only normalization
+    # return [' '.join(tokenizer(text.strip())), label] # only tokenization
+
+# Samples are normalized and tokenized in 4 processes, as they are written
+prenlp.data.fasttext_transform(imdb_train, 'imdb.train', normalizer=normalizer, tokenizer=tokenizer, workers=4)
+prenlp.data.fasttext_transform(imdb_test, 'imdb.test', normalizer=normalizer, tokenizer=tokenizer, workers=4)
          
 # Train
 model = fasttext.train_supervised(input='imdb.train', epoch=25)
@@ -28,5 +30,6 @@ print(model.test('imdb.train'))
 print(model.test('imdb.test'))
 
 # Inference
-print(imdb_test[0][0])
-print(model.predict(imdb_test[0][0]))
\ No newline at end of file
+text, label = preprocess(imdb_test[0])
+print(text)
+print(model.predict(text))
\ No newline at end of file
@@ -1,5 +1,6 @@
 import fasttext
 import prenlp
+from pathlib import Path
 from prenlp.data import Normalizer
 from prenlp.tokenizer import SentencePiece
 
@@ -9,21 +10,21 @@ normalizer = Normalizer(emoji_repl=None)
 # Data preparation
 imdb_train, imdb_test = prenlp.data.IMDB()
 
-# Corpus preparation for training SentencePiece
-corpus_path = 'corpus.txt'
-with open(corpus_path, 'w', encoding='utf-8') as writer:
-    wikitext2 = prenlp.data.WikiText2()
-    for dataset in wikitext2:
-        for text in dataset:
-            writer.write(normalizer.normalize(text.strip())+'\n')
+# Corpus preparation for training SentencePiece, streamed to the trainer without an intermediate file
+wikitext2 = prenlp.data.WikiText2()
+corpus = (normalizer.normalize(text.strip()) for dataset in wikitext2 for text in dataset)
 
 # Preprocessing
-tokenizer = SentencePiece()
-tokenizer.train(input=corpus_path, model_prefix='sentencepiece', vocab_size=VOCAB_SIZE)
-tokenizer.load('sentencepiece.model')
-for dataset in [imdb_train, imdb_test]:
-    for i, (text, label) in enumerate(dataset):
-        dataset[i][0] = ' '.join(tokenizer(normalizer.normalize(text.strip())))
+if not Path('sentencepiece.model').exists():
+    SentencePiece.train(input=corpus, model_prefix='sentencepiece', vocab_size=VOCAB_SIZE)
+tokenizer = SentencePiece.load('sentencepiece.model')
+
+# Tokenized samples are cached on disk, keyed by the split, the normalizer and the SentencePiece model,
+# so that later runs skip preprocessing
+cache = prenlp.data.PreprocessingCache()
+imdb_train, imdb_test = [[[' '.join(tokens), label] for tokens, label in cache.tokenize(dataset, tokenizer, normalizer)]
+                         for dataset in [imdb_train, imdb_test]]
+print(cache.report())
 
 prenlp.data.fasttext_transform(imdb_train, 'imdb.train')
 prenlp.data.fasttext_transform(imdb_test, 'imdb.test')
@@ -10,15 +10,17 @@ nsmc_train, nsmc_test = prenlp.data.NSMC()
 
 # Preprocessing
 tokenizer = Mecab()
-for dataset in [nsmc_train, nsmc_test]:
-    for i, (text, label) in enumerate(dataset):
-        dataset[i][0] = ' '.join(tokenizer(normalizer.normalize(text.strip()))) # both
-        # dataset[i][0] = text.strip() # original
-        # dataset[i][0] = normalizer.normalize(text.strip()) # only normalization
-        # dataset[i][0] = ' '.join(tokenizer(text.strip())) # only tokenization
 
-prenlp.data.fasttext_transform(nsmc_train, 'nsmc.train')
-prenlp.data.fasttext_transform(nsmc_test, 'nsmc.test')
+def preprocess(sample: list) -> list:
+    text, label = sample
+    return [' '.join(tokenizer(normalizer.normalize(text.strip()))), label] # both
+    # return [text.strip(), label] # original
+    # return [normalizer.normalize(text.strip()), label] # only normalization
+    # return [' '.join(tokenizer(text.strip())), label] # only tokenization
+
+# Samples are preprocessed lazily, as they are written
+prenlp.data.fasttext_transform(nsmc_train.map(preprocess), 'nsmc.train')
+prenlp.data.fasttext_transform(nsmc_test.map(preprocess), 'nsmc.test')
          
 # Train
 model = fasttext.train_supervised(input='nsmc.train', epoch=25)
@@ -28,5 +30,6 @@ print(model.test('nsmc.train'))
 print(model.test('nsmc.test'))
 
 # Inference
-print(nsmc_test[0][0])
-print(model.predict(nsmc_test[0][0]))
\ No newline at end of file
+text, label = preprocess(nsmc_test[0])
+print(text)
+print(model.predict(text))
\ No newline at end of file
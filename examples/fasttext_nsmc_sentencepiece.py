@@ -1,5 +1,6 @@
 import fasttext
 import prenlp
+from pathlib import Path
 from prenlp.data import Normalizer
 from prenlp.tokenizer import SentencePiece
 
@@ -9,20 +10,21 @@ normalizer = Normalizer(emoji_repl=None)
 # Data preparation
 nsmc_train, nsmc_test = prenlp.data.NSMC()
 
-# Corpus preparation for training SentencePiece 
-corpus_path = 'corpus.txt'
-with open(corpus_path, 'w', encoding='utf-8') as writer:
-    wikitexko = prenlp.data.WikiTextKo()
-    for text in wikitexko:
-        writer.write(normalizer.normalize(text.strip())+'\n')
+# Corpus preparation for training SentencePiece, streamed to the trainer without an intermediate file
+wikitexko = prenlp.data.WikiTextKo()
+corpus = (normalizer.normalize(text.strip()) for text in wikitexko)
 
 # Preprocessing
-tokenizer = SentencePiece()
-tokenizer.train(input=corpus_path, model_prefix='sentencepiece', vocab_size=VOCAB_SIZE)
-tokenizer.load('sentencepiece.model')
-for dataset in [nsmc_train, nsmc_test]:
-    for i, (text, label) in enumerate(dataset):
-        dataset[i][0] = ' '.join(tokenizer(normalizer.normalize(text.strip())))
+if not Path('sentencepiece.model').exists():
+    SentencePiece.train(input=corpus, model_prefix='sentencepiece', vocab_size=VOCAB_SIZE)
+tokenizer = SentencePiece.load('sentencepiece.model')
+
+# Tokenized samples are cached on disk, keyed by the split, the normalizer and the SentencePiece model,
+# so that later runs skip preprocessing
+cache = prenlp.data.PreprocessingCache()
+nsmc_train, nsmc_test = [[[' '.join(tokens), label] for tokens, label in cache.tokenize(dataset, tokenizer, normalizer)]
+                         for dataset in [nsmc_train, nsmc_test]]
+print(cache.report())
 
 prenlp.data.fasttext_transform(nsmc_train, 'nsmc.train')
 prenlp.data.fasttext_transform(nsmc_test, 'nsmc.test')
@@ -1,6 +1,21 @@
-from . import data
-from . import tokenizer
+import sys
+import importlib
 
 __version__ = '0.0.12'
 __author__  = 'Hoyeon Lee'
 __email__   = 'lyeoni.g@gmail.com'
+
+_SUBPACKAGES = ('data', 'tokenizer', 'utils', 'vocab')
+
+def __getattr__(name: str):
+    """Import subpackages on first access, so that e.g. 'import prenlp.tokenizer' does not load the dataset stack.
+    """
+    if name in _SUBPACKAGES:
+        return importlib.import_module('.'+name, __name__)
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ (PEP 562) is new in Python 3.7. Subpackages are imported eagerly before it.
+    for _name in _SUBPACKAGES:
+        importlib.import_module('.'+_name, __name__)
+    del _name
\ No newline at end of file
@@ -1,3 +1,6 @@
 from .dataset import *
 from .normalizer import *
-from .utils import *
\ No newline at end of file
+from .utils import *
+from .cache import *
+from .batching import *
+from .dedup import *
\ No newline at end of file
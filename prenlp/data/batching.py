@@ -0,0 +1,89 @@
+import random
+from itertools import islice
+from collections import namedtuple
+
+Batch = namedtuple('Batch', ['ids', 'mask', 'labels'])
+Batch.__doc__ = """Batch of padded samples.
+    ids (numpy.ndarray): int32 ids of shape (batch size, the longest length in the batch), padded with the pad id
+    mask (numpy.ndarray): bool array of the same shape, True for ids and False for padding
+    labels (list): labels of the samples, or None for unlabeled samples
+"""
+
+def bucket_batches(samples, max_tokens: int, pad_id=0, window_size: int=10000, max_batch_size: int=None,
+                   max_length: int=None, shuffle: bool=True, seed: int=None):
+    """Group samples of similar lengths into padded batches of at most 'max_tokens' tokens, padding included.
+    Samples are read by windows of 'window_size' samples, which are sorted by length and cut into batches,
+    so that a batch is padded only to the longest of samples of similar lengths. With shuffling, samples are
+    shuffled before sorting (so that samples of equal lengths are batched at random), and so are the batches of a window.
+    The larger the window, the less padding, and the more samples are kept in memory.
+
+    Args:
+        samples (iterable): ids of each sample (list or numpy array), or (ids, label)
+        max_tokens (int): maximum number of tokens in a batch, counted as batch size * the longest length.
+                          A sample longer than this is batched alone
+        pad_id (int, Vocab, SentencePiece): pad id, or a vocabulary or tokenizer whose pad id is used
+        window_size (int): number of samples sorted by length at once
+        max_batch_size (int): maximum number of samples in a batch. If None, only 'max_tokens' limits it
+        max_length (int): samples are truncated to this length. If None, samples are not truncated
+        shuffle (bool): whether to shuffle the samples and the batches of each window
+        seed (int): seed of the random number generator
+
+    Yields:
+        Batch(ids, mask, labels) of numpy arrays
+    """
+    pad_id = getattr(pad_id, 'pad_id', pad_id)
+    if pad_id < 0:
+        raise ValueError('pad id should not be negative, which means the vocabulary has no pad token: {}'.format(pad_id))
+
+    rng = random.Random(seed)
+    iterator = iter(samples)
+    window = list(islice(iterator, window_size))
+    while window:
+        if shuffle:
+            rng.shuffle(window)
+        window = [_split_sample(sample, max_length) for sample in window]
+        window.sort(key=lambda sample: len(sample[0]))
+
+        batches = list(_cut(window, max_tokens, max_batch_size))
+        if shuffle:
+            rng.shuffle(batches)
+        for batch in batches:
+            yield _pad(batch, pad_id)
+
+        window = list(islice(iterator, window_size))
+
+def _split_sample(sample, max_length: int) -> tuple:
+    """Return (ids, label) of a sample. The label is None for an unlabeled sample.
+    """
+    if isinstance(sample, (list, tuple)) and len(sample) == 2 and hasattr(sample[0], '__len__'):
+        ids, label = sample
+    else:
+        ids, label = sample, None
+    if max_length is not None:
+        ids = ids[:max_length]
+    return ids, label
+
+def _cut(window: list, max_tokens: int, max_batch_size: int):
+    """Cut samples sorted by length into consecutive batches under the token budget.
+    """
+    batch = []
+    for sample in window:
+        # The samples are sorted, so that the new sample is the longest of the batch.
+        if batch and ((len(batch)+1) * len(sample[0]) > max_tokens
+                      or (max_batch_size is not None and len(batch) >= max_batch_size)):
+            yield batch
+            batch = []
+        batch.append(sample)
+    if batch:
+        yield batch
+
+def _pad(batch: list, pad_id: int) -> Batch:
+    import numpy as np
+
+    lengths = np.fromiter((len(ids) for ids, _ in batch), dtype=np.int64, count=len(batch))
+    mask = np.arange(lengths.max(initial=0)) < lengths[:, None]
+    ids = np.full(mask.shape, pad_id, dtype=np.int32)
+    if mask.size:
+        ids[mask] = np.concatenate([np.asarray(ids, dtype=np.int32) for ids, _ in batch])
+    labels = [label for _, label in batch] if batch[0][1] is not None else None
+    return Batch(ids, mask, labels)
@@ -0,0 +1,351 @@
+import os
+import re
+import json
+import time
+import shutil
+import hashlib
+from array import array
+from pathlib import Path
+from types import CodeType, FunctionType, MethodType, ModuleType
+from functools import partial
+
+from .. import __version__
+from .dataset.base import Dataset, Stream, Transforms
+from .dataset.storage import TextFile
+from ..utils import imap_ordered
+
+# Incremented whenever the stored format changes, so that older entries are not read.
+_FORMAT_VERSION = 1
+
+def fingerprint(obj) -> str:
+    """Return the SHA-256 hex digest identifying an object by its contents or configuration, stable across runs.
+    - str, bytes, numbers, None, lists, tuples, dicts, sets and compiled regexes are identified by their values
+    - functions, lambdas included, by their qualified names, code, default arguments and closure variables
+      (not by the globals they refer to), bound methods by their function and object,
+      'functools.partial' by its function and arguments, and classes and builtins by their qualified names
+    - 'TextFile' by its path, size and modification time, so that a rebuilt split gets a new fingerprint,
+      and a streaming dataset by its configuration and the size and modification time of its downloaded archive
+    - other objects, e.g. tokenizers and normalizers, by their class and the state they are pickled with:
+      '__getstate__' if the class defines it, else '__dict__'. The fingerprint of a SentencePiece tokenizer is that of its serialized model
+    A reference to an object being fingerprinted, e.g. from a bound method to its dataset, is identified by its depth.
+
+    Raises:
+        TypeError: if an object has neither '__getstate__' nor '__dict__'
+    """
+    sha256 = hashlib.sha256()
+    _update_fingerprint(sha256, obj, {})
+    return sha256.hexdigest()
+
+_Pattern = type(re.compile(''))
+
+def _update_fingerprint(sha256, obj, parents: dict) -> None:
+    """Update 'sha256' with the fingerprint of 'obj'.
+    'parents' maps the ids of the objects being fingerprinted, which 'obj' is part of, to their depth.
+    """
+    def update(tag: bytes, data: bytes) -> None:
+        sha256.update(tag + len(data).to_bytes(8, 'little') + data)
+
+    def update_file(path: Path) -> None:
+        stat = path.stat()
+        update(b'f', '{}:{}:{}'.format(path.resolve(), stat.st_size, stat.st_mtime_ns).encode('utf-8', 'surrogatepass'))
+
+    if obj is None or obj is Ellipsis or isinstance(obj, (bool, int, float, complex)):
+        update(b'n', repr(obj).encode())
+        return
+    elif isinstance(obj, str):
+        update(b's', obj.encode('utf-8', 'surrogatepass'))
+        return
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        update(b'b', bytes(obj))
+        return
+    elif isinstance(obj, Path):
+        update(b'p', str(obj).encode('utf-8', 'surrogatepass'))
+        return
+    elif id(obj) in parents:
+        # A cycle, e.g. through the bound method generating the samples of a streaming dataset
+        update(b'c', str(parents[id(obj)]).encode())
+        return
+
+    parents[id(obj)] = len(parents)
+    recurse = partial(_update_fingerprint, sha256, parents=parents)
+    if isinstance(obj, (list, tuple)):
+        update(b'l', str(len(obj)).encode())
+        for item in obj:
+            recurse(item)
+    elif isinstance(obj, (set, frozenset)):
+        update(b'e', str(len(obj)).encode())
+        for item in sorted(obj, key=fingerprint):
+            recurse(item)
+    elif isinstance(obj, dict):
+        update(b'd', str(len(obj)).encode())
+        for key in sorted(obj, key=fingerprint):
+            recurse(key)
+            recurse(obj[key])
+    elif isinstance(obj, _Pattern):
+        update(b'x', str(obj.flags).encode())
+        recurse(obj.pattern)
+    elif isinstance(obj, TextFile):
+        update_file(obj.path)
+        recurse(obj.parse)
+    elif isinstance(obj, partial):
+        update(b'a', b'')
+        recurse((obj.func, obj.args, obj.keywords))
+    elif isinstance(obj, FunctionType):
+        update(b'q', '{}.{}'.format(obj.__module__, obj.__qualname__).encode())
+        closure = []
+        for cell in obj.__closure__ or ():
+            try:
+                closure.append(cell.cell_contents)
+            except ValueError:
+                closure.append(Ellipsis) # empty cell, of a variable not assigned yet
+        recurse((obj.__code__, obj.__defaults__, obj.__kwdefaults__, closure))
+    elif isinstance(obj, CodeType):
+        # Nested functions, lambdas and comprehensions are among the constants.
+        update(b'k', obj.co_code)
+        recurse((obj.co_consts, obj.co_names))
+    elif isinstance(obj, MethodType):
+        update(b'm', b'')
+        recurse((obj.__func__, obj.__self__))
+    elif isinstance(obj, type) or (callable(obj) and hasattr(obj, '__qualname__')):
+        # Classes, and functions and methods implemented in C
+        update(b'q', '{}.{}'.format(getattr(obj, '__module__', None), obj.__qualname__).encode())
+        owner = getattr(obj, '__self__', None)
+        if owner is not None and not isinstance(owner, (type, ModuleType)):
+            recurse(owner)
+    else:
+        cls = type(obj)
+        update(b'o', '{}.{}'.format(cls.__module__, cls.__qualname__).encode())
+        # object.__getstate__, new in Python 3.11, is not used, so that the fingerprint is the same on any version.
+        if getattr(cls, '__getstate__', None) not in (None, getattr(object, '__getstate__', None)):
+            recurse(obj.__getstate__())
+        elif hasattr(obj, '__dict__'):
+            recurse(vars(obj))
+        else:
+            raise TypeError('cannot fingerprint {} object: it has neither __getstate__ nor __dict__'.format(cls.__qualname__))
+        if isinstance(obj, Dataset) and isinstance(obj.data, Stream) and hasattr(obj, 'url') and obj.archive_path.exists():
+            # The samples of a streaming dataset are read from its downloaded archive.
+            update_file(obj.archive_path)
+    del parents[id(obj)]
+
+def _preprocess(tokenizer, normalizer, text: str) -> list:
+    text = text.strip()
+    if normalizer is not None:
+        text = normalizer.normalize(text)
+    return tokenizer.tokenize(text)
+
+class TokenizedSplit(Transforms):
+    """Read-only sequence of the tokenized samples of a split, stored by 'PreprocessingCache'.
+    A sample is a list of tokens, or [tokens, label] for labeled datasets, e.g. IMDB.
+    Tokens are stored as ids into 'itos', and the ids of sample i are values[offsets[i]:offsets[i+1]],
+    as returned by 'Vocab.encode_batch'. Both arrays are memory-mapped.
+
+    Args:
+        path (str): directory of a cache entry
+    """
+
+    def __init__(self, path: str):
+        import numpy as np
+
+        self.path = Path(path)
+        with open(self.path/'meta.json', 'r', encoding='utf-8') as reader:
+            self.meta = json.load(reader)
+        with open(self.path/'itos.json', 'r', encoding='utf-8') as reader:
+            tokens = json.load(reader)
+        self.itos = np.empty(len(tokens), dtype=object)
+        self.itos[:] = tokens
+        self.values = self._load('values.npy')
+        self.offsets = self._load('offsets.npy')
+        self.labels = None
+        if self.meta['labels'] is not None:
+            labels = self.meta['labels']
+            self.labels = [labels[id] for id in self._load('labels.npy').tolist()]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError('{} index out of range'.format(type(self).__name__))
+
+        tokens = self.itos[self.values[self.offsets[idx]:self.offsets[idx+1]]].tolist()
+        return tokens if self.labels is None else [tokens, self.labels[idx]]
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def _load(self, filename: str):
+        import numpy as np
+
+        return np.load(self.path/filename, mmap_mode='r')
+
+class PreprocessingCache:
+    """On-disk cache of normalized and tokenized dataset splits, so that repeated runs skip preprocessing.
+    Entries are keyed by the fingerprints (see 'fingerprint') of the split, the tokenizer and the normalizer,
+    and by the version of prenlp. A split, normalizer or tokenizer which changes thus gets a new entry.
+    When the cache exceeds 'max_bytes', the least recently used entries are evicted.
+    'hits' and 'misses' count the splits loaded from the cache and preprocessed.
+
+    Args:
+        root (str): directory of the cache
+        max_bytes (int): maximum size of the cache on disk in bytes. If None, the size is not limited
+
+    Examples:
+    >>> cache = prenlp.data.PreprocessingCache('.data/cache', max_bytes=2**30)
+    >>> nsmc_train, nsmc_test = prenlp.data.NSMC()
+    >>> train = cache.tokenize(nsmc_train, tokenizer, normalizer) # preprocessed on the first run only
+    >>> train[0]
+    [['▁아', '▁더빙', '..', '▁진짜', '▁짜증나네요', '▁목소리'], '0']
+    >>> cache.report()
+    {'hits': 1, 'misses': 0, 'evictions': 0, 'entries': 2, 'bytes': 1733245}
+    """
+
+    def __init__(self, root: str='.data/cache', max_bytes: int=None):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, split, tokenizer, normalizer=None) -> str:
+        """Return the key of the entry of a preprocessed split.
+        """
+        return fingerprint({'format': _FORMAT_VERSION, 'prenlp': __version__,
+                            'split': split, 'tokenizer': tokenizer, 'normalizer': normalizer})
+
+    def tokenize(self, split, tokenizer, normalizer=None, workers: int=1, chunksize: int=1000) -> TokenizedSplit:
+        """Return the tokenized samples of a split, loaded from the cache if they were stored, else preprocessed and stored.
+        A text is preprocessed as tokenizer.tokenize(normalizer.normalize(text.strip())).
+
+        Args:
+            split (iterable): samples, texts or (text, label), e.g. a split of IMDB
+            tokenizer : tokenizer with 'tokenize' method. It should be picklable when workers > 1
+            normalizer : normalizer with 'normalize' method, e.g. Normalizer. If None, texts are not normalized
+            workers (int): number of worker processes preprocessing the texts on a miss
+            chunksize (int): number of texts sent to a worker at once
+        """
+        path = self.root/self.key(split, tokenizer, normalizer)
+        if (path/'meta.json').exists():
+            self.hits += 1
+            # The modification time of the metadata marks the last use of the entry.
+            os.utime(path/'meta.json')
+            return TokenizedSplit(path)
+
+        self.misses += 1
+        self._store(path, split, tokenizer, normalizer, workers, chunksize)
+        self.evict(keep=path)
+        return TokenizedSplit(path)
+
+    def invalidate(self, split, tokenizer, normalizer=None) -> bool:
+        """Remove the entry of a preprocessed split.
+
+        Returns:
+            whether the entry was stored
+        """
+        path = self.root/self.key(split, tokenizer, normalizer)
+        if not path.exists():
+            return False
+        shutil.rmtree(path)
+        return True
+
+    def clear(self) -> None:
+        """Remove all entries. Statistics are kept.
+        """
+        for path, _, _ in self._entries():
+            shutil.rmtree(path, ignore_errors=True)
+
+    def evict(self, max_bytes: int=None, keep: Path=None) -> int:
+        """Remove the least recently used entries until the cache takes at most 'max_bytes' bytes.
+        Args:
+            max_bytes (int): maximum size of the cache in bytes. If None, 'max_bytes' of the cache is used
+            keep (Path): entry which is not removed, e.g. the one just stored
+
+        Returns:
+            number of removed entries
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        if max_bytes is None:
+            return 0
+
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        nbytes = sum(size for _, _, size in entries)
+        evicted = 0
+        for path, _, size in entries:
+            if nbytes <= max_bytes:
+                break
+            if path == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            nbytes -= size
+            evicted += 1
+
+        self.evictions += evicted
+        return evicted
+
+    def report(self) -> dict:
+        """Return the statistics of the cache, and the number of entries and bytes stored.
+        """
+        entries = self._entries()
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'entries': len(entries), 'bytes': sum(size for _, _, size in entries)}
+
+    def _entries(self) -> list:
+        """Return (path, last use, size in bytes) of the stored entries.
+        """
+        if not self.root.exists():
+            return []
+        entries = []
+        for path in self.root.iterdir():
+            try:
+                last_used = (path/'meta.json').stat().st_mtime
+                size = sum(file.stat().st_size for file in path.iterdir())
+            except (FileNotFoundError, NotADirectoryError):
+                continue # not an entry, or removed concurrently
+            entries.append((path, last_used, size))
+        return entries
+
+    def _store(self, path: Path, split, tokenizer, normalizer, workers: int, chunksize: int) -> None:
+        import numpy as np
+
+        labels, label_ids = {}, array('i')
+
+        def texts():
+            for sample in split:
+                if isinstance(sample, str):
+                    yield sample
+                else:
+                    text, label = sample[0], sample[1]
+                    label_ids.append(labels.setdefault(label, len(labels)))
+                    yield text
+
+        # Tokens are numbered in order of appearance.
+        stoi, values, offsets = {}, array('i'), array('q', [0])
+        preprocess = partial(_preprocess, tokenizer, normalizer)
+        for tokens in imap_ordered(preprocess, texts(), workers=workers, chunksize=chunksize):
+            values.extend([stoi.setdefault(token, len(stoi)) for token in tokens])
+            offsets.append(len(values))
+
+        # Written to a temporary directory first, so that a partial entry is never read.
+        tmp_path = path.with_name(path.name + '.{}.tmp'.format(os.getpid()))
+        tmp_path.mkdir(parents=True, exist_ok=True)
+        np.save(tmp_path/'values.npy', np.asarray(values, dtype=np.int32))
+        np.save(tmp_path/'offsets.npy', np.asarray(offsets, dtype=np.int64))
+        if labels:
+            np.save(tmp_path/'labels.npy', np.asarray(label_ids, dtype=np.int32))
+        with open(tmp_path/'itos.json', 'w', encoding='utf-8') as writer:
+            json.dump(list(stoi), writer, ensure_ascii=False)
+        meta = {'format': _FORMAT_VERSION, 'prenlp': __version__, 'num_samples': len(offsets) - 1,
+                'num_tokens': len(values), 'labels': list(labels) if labels else None, 'created': time.time()}
+        with open(tmp_path/'meta.json', 'w', encoding='utf-8') as writer:
+            json.dump(meta, writer, ensure_ascii=False)
+
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            # Stored concurrently by another process
+            shutil.rmtree(tmp_path, ignore_errors=True)
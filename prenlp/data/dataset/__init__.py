@@ -1,3 +1,4 @@
 from .base import *
+from .storage import *
 from .language_modeling import *
-from .sentiment import *
+from .sentiment import *
\ No newline at end of file
@@ -1,15 +1,161 @@
+import random
 from pathlib import Path
+from itertools import islice
+from functools import partial
 
 from ..utils import download_from_url, unzip_archive
+from ..batching import bucket_batches
+from ...utils import imap_ordered, chunked
 
-class Dataset:
+class Transforms:
+    """Mixin of lazy transforms over the samples of an iterable, e.g. a split of a dataset.
+    Each transform returns a 'Pipeline', to which more transforms can be chained. Nothing is evaluated until the pipeline
+    is iterated, and samples then flow through all the transforms one by one, without intermediate copies.
+
+    Examples:
+    >>> imdb_train, imdb_test = prenlp.data.IMDB()
+    >>> pipeline = imdb_train.map(preprocess, workers=8).filter(lambda sample: len(sample[0]) > 0).shuffle(10000, seed=0).batch(32)
+    >>> for batch in pipeline:
+    ...     pass
+    >>> samples = imdb_test.map(preprocess).take(100).collect()
+    >>> for ids, mask, labels in imdb_train.map(encode).bucket_batch(max_tokens=8192, pad_id=vocab):
+    ...     pass
+    """
+
+    def map(self, fn, workers: int=1, chunksize: int=1000) -> 'Pipeline':
+        """Apply 'fn' to each sample. With more than one worker, chunks of samples are processed in a process pool,
+        and the results are yielded in order from a bounded buffer (see 'imap_ordered').
+        Args:
+            fn (callable): function applied to each sample. It should be picklable when workers > 1
+            workers (int): number of worker processes
+            chunksize (int): number of samples sent to a worker at once
+        """
+        return self._pipeline()._then(partial(_map, fn, workers, chunksize))
+
+    def filter(self, fn) -> 'Pipeline':
+        """Keep the samples for which 'fn' returns true.
+        """
+        return self._pipeline()._then(partial(filter, fn))
+
+    def shuffle(self, buffer_size: int, seed: int=None) -> 'Pipeline':
+        """Shuffle samples approximately, in a buffer of 'buffer_size' samples: each sample is drawn at random from the buffer,
+        and replaced by the next sample. The larger the buffer, the closer to a full shuffle.
+        Args:
+            buffer_size (int): number of samples kept in memory
+            seed (int): seed of the random number generator. If given, every iteration yields the same order
+        """
+        return self._pipeline()._then(partial(_shuffle, buffer_size, seed))
+
+    def batch(self, batch_size: int, drop_last: bool=False) -> 'Pipeline':
+        """Group consecutive samples into lists of 'batch_size' samples.
+        Args:
+            batch_size (int): number of samples in a batch
+            drop_last (bool): whether to drop the last batch if it is smaller
+        """
+        return self._pipeline()._then(partial(_batch, batch_size, drop_last))
+
+    def bucket_batch(self, max_tokens: int, pad_id=0, window_size: int=10000, max_batch_size: int=None,
+                     max_length: int=None, shuffle: bool=True, seed: int=None) -> 'Pipeline':
+        """Group samples of ids, or (ids, label), of similar lengths into padded batches under a token budget,
+        yielded as Batch(ids, mask, labels) of numpy arrays (see 'bucket_batches').
+        Args:
+            max_tokens (int): maximum number of tokens in a batch, padding included
+            pad_id (int, Vocab, SentencePiece): pad id, or a vocabulary or tokenizer whose pad id is used
+            window_size (int): number of samples sorted by length at once
+            max_batch_size (int): maximum number of samples in a batch
+            max_length (int): samples are truncated to this length
+            shuffle (bool): whether to shuffle the samples and the batches of each window
+            seed (int): seed of the random number generator
+        """
+        return self._pipeline()._then(partial(bucket_batches, max_tokens=max_tokens, pad_id=pad_id, window_size=window_size,
+                                              max_batch_size=max_batch_size, max_length=max_length, shuffle=shuffle, seed=seed))
+
+    def take(self, n: int) -> 'Pipeline':
+        """Keep the first 'n' samples.
+        """
+        return self._pipeline()._then(partial(_take, n))
+
+    def skip(self, n: int) -> 'Pipeline':
+        """Skip the first 'n' samples.
+        """
+        return self._pipeline()._then(partial(_skip, n))
+
+    def apply(self, stage) -> 'Pipeline':
+        """Apply a function transforming an iterator of samples into another, e.g. an 'ExactDeduplicator'.
+        """
+        return self._pipeline()._then(stage)
+
+    def _pipeline(self) -> 'Pipeline':
+        return Pipeline(self)
+
+class Pipeline(Transforms):
+    """Lazy iterable of the samples of 'source', passed through a chain of transforms (see 'Transforms').
+    Each iteration starts over from the source, which should thus be iterable more than once, e.g. a split or a list.
+
+    Args:
+        source (iterable): samples to be transformed
+        stages (tuple): functions transforming an iterator of samples into another, applied in order
+    """
+
+    def __init__(self, source, stages: tuple=()):
+        self.source = source
+        self.stages = tuple(stages)
+
+    def __iter__(self):
+        iterator = iter(self.source)
+        for stage in self.stages:
+            iterator = stage(iterator)
+        return iterator
+
+    def collect(self) -> list:
+        """Evaluate the pipeline, and return the samples as a list.
+        """
+        return list(self)
+
+    def _pipeline(self) -> 'Pipeline':
+        return self
+
+    def _then(self, stage) -> 'Pipeline':
+        return Pipeline(self.source, self.stages + (stage,))
+
+def _map(fn, workers: int, chunksize: int, iterator):
+    return imap_ordered(fn, iterator, workers=workers, chunksize=chunksize)
+
+def _shuffle(buffer_size: int, seed: int, iterator):
+    rng = random.Random(seed)
+    buffer = list(islice(iterator, max(buffer_size, 1)))
+    for sample in iterator:
+        idx = rng.randrange(len(buffer))
+        yield buffer[idx]
+        buffer[idx] = sample
+    rng.shuffle(buffer)
+    yield from buffer
+
+def _batch(batch_size: int, drop_last: bool, iterator):
+    for batch in chunked(iterator, batch_size):
+        if drop_last and len(batch) < batch_size:
+            return
+        yield batch
+
+def _take(n: int, iterator):
+    return islice(iterator, n)
+
+def _skip(n: int, iterator):
+    return islice(iterator, n, None)
+
+class Dataset(Transforms):
     """Abstract dataset class for dataset-like object, like list and array.
     All datasets(sub-classes) should inherit.
+    Samples can be transformed lazily with 'map', 'filter', 'shuffle', 'batch', 'take' and 'skip' (see 'Transforms').
 
     Args:
         data (list, array, tuple): dataset-like object
     """
 
+    # SHA-256 hex digest of the archive at 'url', verified after download when set.
+    # Left unset for archives which change over time, e.g. a repository's master branch or the latest Wikipedia dump.
+    sha256 = None
+
     def __init__(self, data):
         self.data = data
     
@@ -19,11 +165,42 @@ class Dataset:
     def __getitem__(self, idx):
         return self.data[idx]
 
-    def _download(self, to_path: str) -> None:
+    def __iter__(self):
+        return iter(self.data)
+
+    def _download(self, to_path: str, extract: bool=True) -> Path:
         """Download and unzip an archive.
         Args:
             to_path (str): path to the directory of extracted files
+            extract (bool): whether to extract the archive. If False, it is kept as is, to be read by 'iter_archive'
+
+        Returns:
+            path to the downloaded archive
         """
         download_filename = self.url.split('/')[-1]
-        from_path = download_from_url(self.url, download_filename, to_path)
-        unzip_archive(from_path, to_path)
\ No newline at end of file
+        from_path = download_from_url(self.url, download_filename, to_path, sha256=self.sha256)
+        if extract:
+            unzip_archive(from_path, to_path)
+        return from_path
+
+    @property
+    def archive_path(self) -> Path:
+        """Path of the archive downloaded from 'url', in the dataset's highest level directory.
+        """
+        return self.root/self.url.split('/')[-1]
+
+class Stream(Transforms):
+    """Iterable of samples produced on the fly, for one-pass jobs which need no random access.
+    Samples are not kept, so that memory stays constant, and each iteration starts over from 'offset'.
+
+    Args:
+        generate (callable): function returning an iterator over the samples, from the given offset
+        offset (int): number of samples skipped, e.g. to resume an interrupted pass
+    """
+
+    def __init__(self, generate, offset: int=0):
+        self.generate = generate
+        self.offset = offset
+
+    def __iter__(self):
+        return iter(self.generate(self.offset))
\ No newline at end of file
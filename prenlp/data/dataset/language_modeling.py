@@ -1,14 +1,16 @@
+import io
 import os
-import re
 import json
-import ijson
 import shutil
 from pathlib import Path
-from tqdm import tqdm
+from itertools import islice
+from functools import partial, lru_cache
 
-from .base import Dataset
-from ..utils import download_from_url
-from ..normalizer import Normalizer
+from .base import Dataset, Stream
+from .storage import TextFile, LazySplits
+from ..utils import download_from_url, iter_archive
+from ..normalizer import Normalizer, NamuMarkupNormalizer
+from ...utils import imap_ordered, chunked, prefetch
 
 def load_language_modeling(from_path: str) -> list:
     """Load language modeling dataset.
@@ -27,6 +29,76 @@ def save_language_modeling(dataset: list, to_path: str):
         for text in dataset:
             writer.write('{text}\n'.format(text=text))
 
+@lru_cache(maxsize=None)
+def _json_decoder():
+    """Return a function decoding a JSON document, with orjson if it is installed, which is several times faster than json.
+    Documents orjson rejects (e.g. lone surrogates) are decoded by json, so that the results are always the same.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+
+    def loads(document: str):
+        try:
+            return orjson.loads(document)
+        except orjson.JSONDecodeError:
+            return json.loads(document)
+    return loads
+
+def _iter_wiki_shard(filename: str):
+    """Yield the sentences of the documents in a shard extracted by WikiExtractor.
+    """
+    loads = _json_decoder()
+    with open(filename, 'r', encoding='utf-8') as reader:
+        for line in reader:
+            text = loads(line)['text'].strip()
+            # split document into sentences(len > 0)
+            for sample in text.split('\n'):
+                if len(sample) > 0:
+                    yield sample.strip()
+            # If sample is a document, yield below sample instead.
+            # sample = '\n'.join(list(filter(lambda x: len(x) > 0, text.split('\n'))))
+
+def _extract_wiki_shard(to_dir: Path, shard: tuple) -> Path:
+    """Write the sentences of the i-th shard to '<to_dir>/<i>', and return the path.
+    """
+    i, filename = shard
+    to_path = to_dir/str(i)
+    save_language_modeling(_iter_wiki_shard(filename), to_path=to_path)
+    return to_path
+
+@lru_cache(maxsize=None)
+def _ijson_backend():
+    """Return the fastest ijson backend available. The C extension of yajl2 is an order of magnitude faster than pure Python.
+    """
+    import ijson
+
+    for name in ('yajl2_c', 'yajl2_cffi', 'yajl2', 'python'):
+        try:
+            return ijson.get_backend(name)
+        except ImportError:
+            pass
+    return ijson
+
+def _split_namu_documents(markup_normalizer, normalizer, texts: list) -> list:
+    """Normalize NamuWiki documents and split them into sentences(len > 0).
+    """
+    samples = []
+    for text in texts:
+        text = normalizer.normalize(markup_normalizer.normalize(text)).strip()
+        samples += [sample for sample in text.split('\n') if len(sample) > 0]
+        # If sample is a document, use below sample instead.
+        # sample = '\n'.join(list(filter(lambda x: len(x) > 0, text.split('\n'))))
+    return samples
+
+def _iter_wikitext(reader, skip_empty: bool):
+    """Yield the stripped lines of a WikiText split.
+    """
+    for line in reader:
+        if line.strip() or not skip_empty:
+            yield line.strip()
+
 class WikiText2(Dataset):
     """WikiText-2 word-level dataset for language modeling.
     
@@ -50,6 +122,8 @@ class WikiText2(Dataset):
     = Valkyria Chronicles III =
     """
 
+    sha256 = '92675f1d63015c1c8b51f1656a52d5bdbc33aafa60cc47a218a66e7ee817488c'
+
     def __init__(self, root: str='.data'):
         self.root = Path(root)
         self.url = 'https://s3.amazonaws.com/research.metamind.io/wikitext/wikitext-2-v1.zip'
@@ -58,37 +132,26 @@ class WikiText2(Dataset):
         
         self.skip_empty = True # Whether to skip the empty samples (only for WikiText)
 
-        if not (self.root/self.dirname).exists():
-            super(WikiText2, self)._download(to_path = self.root)
-        
         super(WikiText2, self).__init__(self._get_data())
 
-    def _get_data(self, train: str='wiki.train.tokens', valid: str='wiki.valid.tokens', test: str='wiki.test.tokens') -> list:
+    def _get_data(self, train: str='wiki.train.tokens', valid: str='wiki.valid.tokens', test: str='wiki.test.tokens') -> LazySplits:
         out_path_train = self.root/self.dirname/self.out_filename[0]
         out_path_valid = self.root/self.dirname/self.out_filename[1]
         out_path_test = self.root/self.dirname/self.out_filename[2]
 
-        if out_path_train.exists() and out_path_valid.exists() and out_path_test.exists():
-            train, valid, test = load_language_modeling(out_path_train), load_language_modeling(out_path_valid), load_language_modeling(out_path_test)
-            dataset = [train, valid, test]
-        else:
-            dataset = []
-            for i, data in enumerate([train, valid, test]):
-                filename = self.root/self.dirname/data
-                with open(filename, 'r', encoding='utf-8') as reader:
-                    if self.skip_empty:                    
-                        samples = [line.strip() for line in reader.readlines() if line.strip()]
-                    else:
-                        samples = [line.strip() for line in reader.readlines()]
-                    dataset.append(samples)
-            
-            # Save dataset
-            shutil.rmtree(self.root/self.dirname)
-            (self.root/self.dirname).mkdir()
-            for i, filename in enumerate(self.out_filename):
-                save_language_modeling(dataset[i], to_path=self.root/self.dirname/filename)            
+        if not (out_path_train.exists() and out_path_valid.exists() and out_path_test.exists()):
+            if not self.archive_path.exists():
+                super(WikiText2, self)._download(to_path = self.root, extract=False)
+
+            # The splits are read from the archive, without extracting it.
+            (self.root/self.dirname).mkdir(parents=True, exist_ok=True)
+            out_paths = {self.dirname+'/'+train: out_path_train, self.dirname+'/'+valid: out_path_valid, self.dirname+'/'+test: out_path_test}
+            for name, file in iter_archive(self.archive_path, members=out_paths.__contains__):
+                tmp_path = out_paths[name].with_name(out_paths[name].name+'.tmp')
+                save_language_modeling(_iter_wikitext(io.TextIOWrapper(file, encoding='utf-8'), self.skip_empty), to_path=tmp_path)
+                os.replace(tmp_path, out_paths[name])
 
-        return dataset
+        return LazySplits([out_path_train, out_path_valid, out_path_test], parse=str.strip)
 
 
 class WikiText103(Dataset):
@@ -114,6 +177,8 @@ class WikiText103(Dataset):
     = Valkyria Chronicles III =
     """
 
+    sha256 = '242ba0f20b329cfdf1ccc61e9e9e5b59becf189db7f7a81cd2a0e2fc31539590'
+
     def __init__(self, root: str='.data'):
         self.root = Path(root)
         self.url = 'https://s3.amazonaws.com/research.metamind.io/wikitext/wikitext-103-v1.zip'
@@ -122,37 +187,26 @@ class WikiText103(Dataset):
         
         self.skip_empty = True # whether to skip the empty samples. only for WikiText
 
-        if not (self.root/self.dirname).exists():
-            super(WikiText103, self)._download(to_path = self.root)
-        
         super(WikiText103, self).__init__(self._get_data())
 
-    def _get_data(self, train: str='wiki.train.tokens', valid: str='wiki.valid.tokens', test: str='wiki.test.tokens') -> list:
+    def _get_data(self, train: str='wiki.train.tokens', valid: str='wiki.valid.tokens', test: str='wiki.test.tokens') -> LazySplits:
         out_path_train = self.root/self.dirname/self.out_filename[0]
         out_path_valid = self.root/self.dirname/self.out_filename[1]
         out_path_test = self.root/self.dirname/self.out_filename[2]
 
-        if out_path_train.exists() and out_path_valid.exists() and out_path_test.exists():
-            train, valid, test = load_language_modeling(out_path_train), load_language_modeling(out_path_valid), load_language_modeling(out_path_test)
-            dataset = [train, valid, test]
-        else:
-            dataset = []
-            for i, data in enumerate([train, valid, test]):
-                filename = self.root/self.dirname/data
-                with open(filename, 'r', encoding='utf-8') as reader:
-                    if self.skip_empty:                    
-                        samples = [line.strip() for line in reader.readlines() if line.strip()]
-                    else:
-                        samples = [line.strip() for line in reader.readlines()]
-                    dataset.append(samples)
-                
-            # Save dataset
-            shutil.rmtree(self.root/self.dirname)
-            (self.root/self.dirname).mkdir()
-            for i, filename in enumerate(self.out_filename):
-                save_language_modeling(dataset[i], to_path=self.root/self.dirname/filename)            
+        if not (out_path_train.exists() and out_path_valid.exists() and out_path_test.exists()):
+            if not self.archive_path.exists():
+                super(WikiText103, self)._download(to_path = self.root, extract=False)
 
-        return dataset
+            # The splits are read from the archive, without extracting it.
+            (self.root/self.dirname).mkdir(parents=True, exist_ok=True)
+            out_paths = {self.dirname+'/'+train: out_path_train, self.dirname+'/'+valid: out_path_valid, self.dirname+'/'+test: out_path_test}
+            for name, file in iter_archive(self.archive_path, members=out_paths.__contains__):
+                tmp_path = out_paths[name].with_name(out_paths[name].name+'.tmp')
+                save_language_modeling(_iter_wikitext(io.TextIOWrapper(file, encoding='utf-8'), self.skip_empty), to_path=tmp_path)
+                os.replace(tmp_path, out_paths[name])
+
+        return LazySplits([out_path_train, out_path_valid, out_path_test], parse=str.strip)
 
 
 class WikiTextKo(Dataset):
@@ -164,6 +218,11 @@ class WikiTextKo(Dataset):
     
     Args:
         root (str): path to the dataset's highest level directory
+        streaming (bool): whether to yield sentences as they are parsed from the extracted shards (or read from the built corpus),
+                          without building the corpus nor keeping it in memory. The dataset is then iterable only
+        offset (int): number of sentences skipped in streaming mode, to resume an interrupted pass
+        workers (int): number of worker processes extracting the shards when the corpus is built.
+                       The output is the same for any number of workers
     
     Examples:
     >>> wikitextko = prenlp.data.WikiTextKo()
@@ -173,9 +232,11 @@ class WikiTextKo(Dataset):
     '지미 카터'
     >>> wikitextko[1]
     '제임스 얼 "지미" 카터 주니어(, 1924년 10월 1일 ~ )는 민주당 출신 미국 39번째 대통령 (1977년 ~ 1981년)이다.'
+    >>> for text in prenlp.data.WikiTextKo(streaming=True, offset=1000000):
+    ...     pass
     """
 
-    def __init__(self, root: str='.data'):
+    def __init__(self, root: str='.data', streaming: bool=False, offset: int=0, workers: int=1):
         self.root = Path(root)
         self.url = 'https://dumps.wikimedia.org/kowiki/latest/kowiki-latest-pages-articles.xml.bz2'
         self.dirname = 'wikitext-ko'
@@ -183,18 +244,22 @@ class WikiTextKo(Dataset):
         
         self.url_wikiextractor = 'https://raw.githubusercontent.com/attardi/wikiextractor/master/WikiExtractor.py'
         self.wikiextractor = 'WikiExtractor.py'
+        self.workers = workers
         
         # Download
         if not (self.root/self.dirname).exists():
             self._download(to_path = self.root)
 
-        super(WikiTextKo, self).__init__(self._get_data())
+        if streaming:
+            super(WikiTextKo, self).__init__(Stream(self._stream, offset))
+        else:
+            super(WikiTextKo, self).__init__(self._get_data())
     
     def _download(self, to_path: str) -> None:
         """Override method of 'Dataset' class.
         """
         download_filename = self.url.split('/')[-1]
-        from_path = download_from_url(self.url, download_filename, to_path)
+        from_path = download_from_url(self.url, download_filename, to_path, sha256=self.sha256)
         
         # Extracts and cleans text from a Wikipedia database dump using WikiExtractor.
         wikiextractor_path = download_from_url(self.url_wikiextractor, self.wikiextractor, to_path)
@@ -202,33 +267,62 @@ class WikiTextKo(Dataset):
         
         Path(self.root/self.wikiextractor).unlink()
         
-    def _get_data(self) -> list:
+    def _get_data(self) -> TextFile:
         out_path_train = self.root/self.dirname/self.out_filename
 
-        if out_path_train.exists():
-            train = load_language_modeling(out_path_train)
-            dataset = train
-        else:
-            dataset = []
-            filenames = [filename for filename in (self.root/self.dirname).glob('**/wiki_*')]
-            for filename in tqdm(sorted(filenames)):
-                with open(filename, 'r', encoding='utf-8') as reader:
-                    for line in reader.readlines():
-                        text = json.loads(line)['text'].strip()
-                        samples = list(filter(lambda x: len(x) > 0, text.split('\n'))) # split document into sentences(len > 0)
-                        samples = list(map(lambda x: x.strip(), samples))
-                        dataset += samples 
-                        # If sample is a document, use below code not above two lines.
-                        # sample = '\n'.join(list(filter(lambda x: len(x) > 0, text.split('\n'))))
-                        # dataset.append(sample)            
-            
-            # Save dataset
+        if not out_path_train.exists():
+            # Sentences are written as they are parsed, then the shards are replaced by the corpus.
+            tmp_path = self.root/(self.out_filename+'.tmp')
+            if self.workers > 1:
+                self._extract_parallel(tmp_path)
+            else:
+                save_language_modeling(self._iter_samples(progress=True), to_path=tmp_path)
             shutil.rmtree(self.root/self.dirname)
             (self.root/self.dirname).mkdir()
-            save_language_modeling(dataset, to_path=out_path_train)
+            os.replace(tmp_path, out_path_train)
             
-        return dataset
-        
+        return TextFile(out_path_train, parse=str.strip)
+
+    def _extract_parallel(self, to_path: Path) -> None:
+        """Extract the shards in worker processes, each writing the sentences of a shard to its own file,
+        and concatenate the files in the order of the shards.
+        """
+        from tqdm import tqdm
+
+        shards = self._shards()
+        parts_dir = self.root/(self.out_filename+'.parts')
+        parts_dir.mkdir(exist_ok=True)
+        try:
+            extract = partial(_extract_wiki_shard, parts_dir)
+            with open(to_path, 'wb') as writer:
+                for part_path in tqdm(imap_ordered(extract, enumerate(shards), workers=self.workers, chunksize=1),
+                                      total=len(shards)):
+                    with open(part_path, 'rb') as reader:
+                        shutil.copyfileobj(reader, writer)
+                    part_path.unlink()
+        finally:
+            shutil.rmtree(parts_dir, ignore_errors=True)
+
+    def _stream(self, offset: int):
+        out_path_train = self.root/self.dirname/self.out_filename
+        if out_path_train.exists():
+            train = TextFile(out_path_train, parse=str.strip)
+            return (train[i] for i in range(offset, len(train)))
+        return islice(self._iter_samples(), offset, None)
+
+    def _shards(self) -> list:
+        return sorted(filename for filename in (self.root/self.dirname).glob('**/wiki_*'))
+
+    def _iter_samples(self, progress: bool=False):
+        """Yield the sentences of the documents in the extracted shards.
+        """
+        filenames = self._shards()
+        if progress:
+            from tqdm import tqdm
+            filenames = tqdm(filenames)
+
+        for filename in filenames:
+            yield from _iter_wiki_shard(filename)        
 
 class NamuWikiKo(Dataset):
     """NamuWiki database dump (Korean) for language modeling.
@@ -238,6 +332,12 @@ class NamuWikiKo(Dataset):
     
     Args:
         root (str): path to the dataset's highest level directory
+        streaming (bool): whether to yield sentences as they are parsed from the JSON dump (or read from the built corpus),
+                          without building the corpus nor keeping it in memory. The dataset is then iterable only
+        offset (int): number of sentences skipped in streaming mode, to resume an interrupted pass
+        workers (int): number of worker processes normalizing the documents when the corpus is built.
+                       The output is the same for any number of workers
+        batch_size (int): number of documents sent to a worker at once
     
     Examples:
     >>> namuwikiko = prenlp.data.NamuWikiKo()
@@ -247,74 +347,93 @@ class NamuWikiKo(Dataset):
     (신 세계수의 미궁 2에서 뜬 !!아앗!!)
     >>> namuwikiko[1]
     세계수의 미궁 시리즈에 전통으로 등장하는 대사. 세계수의 미궁 2 제왕의 성배|2편 제왕의 성배부터 등장했으며, 훌륭한 사망 플래그의 예시이다.
+    >>> for text in prenlp.data.NamuWikiKo(streaming=True):
+    ...     pass
     """
 
-    def __init__(self, root: str='.data'):
+    def __init__(self, root: str='.data', streaming: bool=False, offset: int=0, workers: int=1, batch_size: int=256):
         self.root = Path(root)
         self.url = 'https://dataserver.xyz/wikidb/namuwiki190312.7z'
         self.dirname = 'namuwiki_20190312.json'
         self.out_filename = 'namuwiki.train'
+        self.markup_normalizer = NamuMarkupNormalizer()
+        self.normalizer = Normalizer(emoji_repl=None)
+        self.workers = workers
+        self.batch_size = batch_size
 
-        # Download
-        if not (self.root/self.dirname).exists():
-            super(NamuWikiKo, self)._download(to_path = self.root)
+        # Download, unless the dump was already built into the corpus. The dump is read from the archive, without extracting it.
+        if not ((self.root/self.dirname).exists() or self.archive_path.exists() or (self.root/self.out_filename).exists()):
+            super(NamuWikiKo, self)._download(to_path = self.root, extract=False)
         
-        super(NamuWikiKo, self).__init__(self._get_data())
+        if streaming:
+            super(NamuWikiKo, self).__init__(Stream(self._stream, offset))
+        else:
+            super(NamuWikiKo, self).__init__(self._get_data())
         
-    def _get_data(self) -> list:
+    def _get_data(self) -> TextFile:
         out_path_train = self.root/self.out_filename
 
+        if not out_path_train.exists():
+            # Sentences are written as they are parsed, then renamed to the corpus.
+            tmp_path = self.root/(self.out_filename+'.tmp')
+            if self.workers > 1:
+                save_language_modeling(self._iter_samples_parallel(), to_path=tmp_path)
+            else:
+                save_language_modeling(self._iter_samples(progress=True), to_path=tmp_path)
+            if (self.root/self.dirname).exists():
+                # Extracted by an earlier version
+                (self.root/self.dirname).unlink()
+            os.replace(tmp_path, out_path_train)
+            
+        return TextFile(out_path_train, parse=str.strip)
+
+    def _stream(self, offset: int):
+        out_path_train = self.root/self.out_filename
         if out_path_train.exists():
-            train = load_language_modeling(out_path_train)
-            dataset = train
+            train = TextFile(out_path_train, parse=str.strip)
+            return (train[i] for i in range(offset, len(train)))
+        # Stripped as when read from the corpus
+        return (sample.strip() for sample in islice(self._iter_samples(), offset, None))
+
+    def _iter_documents(self):
+        """Yield the raw text of the documents in the JSON dump, parsed by the fastest ijson backend available.
+        The dump is read from the archive, or from the extracted file if any.
+        """
+        if (self.root/self.dirname).exists():
+            with open(self.root/self.dirname, 'rb') as jfile:
+                yield from _ijson_backend().items(jfile, 'item.text')
         else:
-            dataset = []
-            with open(self.root/self.dirname, 'r', encoding='utf-8') as jfile:
-                for item in tqdm(ijson.items(jfile, 'item')):
-                    text = self._normalize(item['text']).strip()
-                    samples = list(filter(lambda x: len(x) > 0, text.split('\n'))) # split document into sentences(len > 0)
-                    dataset += samples
-                    # If sample is a document, use below code not above two lines.
-                    # sample = '\n'.join(list(filter(lambda x: len(x) > 0, text.split('\n'))))
-                    # dataset.append(sample)
-                    
-            # Save dataset
-            (self.root/self.dirname).unlink()
-            save_language_modeling(dataset, to_path=out_path_train)
-            
-        return dataset
+            for _, jfile in iter_archive(self.archive_path, members=self.dirname.__eq__):
+                yield from _ijson_backend().items(jfile, 'item.text')
+
+    def _iter_samples(self, progress: bool=False):
+        """Yield the sentences of the normalized documents in the JSON dump.
+        """
+        documents = self._iter_documents()
+        if progress:
+            from tqdm import tqdm
+            documents = tqdm(documents)
+
+        for text in documents:
+            yield from _split_namu_documents(self.markup_normalizer, self.normalizer, [text])
+
+    def _iter_samples_parallel(self):
+        """Yield the sentences of the normalized documents in the JSON dump, in order.
+        A reader thread parses the dump into batches of 'batch_size' documents, which are normalized and split
+        into sentences by 'workers' processes. At most a few batches per worker are in memory at once.
+        The processes are forked before the reader thread and the progress bar's monitor thread are started.
+        """
+        from tqdm import tqdm
+
+        split = partial(_split_namu_documents, self.markup_normalizer, self.normalizer)
+        batches = prefetch(chunked(self._iter_documents(), self.batch_size), max_prefetch=2*self.workers)
+        results = imap_ordered(split, batches, workers=self.workers, chunksize=1) # starts the pool, not the reader
+        for samples in tqdm(results, unit='batch'):
+            yield from samples
     
-    def _normalize(self, text: str, repl: str='', normalizer=Normalizer(emoji_repl=None)) -> str:
+    def _normalize(self, text: str) -> str:
         """Return the normalized string.
         """
-        regexs = [
-                # macro
-                r'\[+(?:[iI]nclude|youtube|분류|목차|각주|파일).*\]+',
-                r'\#redirect[ \t]*.*', # e.g. #redirect blah
-                # markup
-                r"'''",                 # bold
-                r'~~(?!~).*?~~',        # deletion
-                r'--(?!~).*?--',        # deletion
-                r'\|\|.*\|\|',          # table
-                r'\{\{\{.*?\}\}\}',     # plain text {{{blah}}}
-                r'^(\{\{\{.*)',         # incomplete-plain text {{{blah
-                r'^(\}\}\})',           # }}}
-                r'^([ \t]+\*).*',       # unordered list (*)
-                r'[ \t]1\..*',          # unordered list (1.)
-                r'\|\|',                # quote (multiple)
-                r'\{\{\|',              # quote (multiple)
-                r'\|\}\}',              # quote (multiple)
-                r'^\>',                 # quote (sinlge))
-                r'width=',
-                # special markup - should follow above markup
-                r'(?:\[\[)\S*?\|',      # hyperlink with alias (open)
-                r'(?:\[\[)',            # hyperlink (open)
-                r'(?:\]\])',            # hyperlink (close)
-                r'\[\*(.*?)\]'          # footnote. It should follow the hyperlink patterns.
-                ]
-        for regex in regexs:
-            regex = re.compile(regex, re.MULTILINE)
-            text = regex.sub(repl, text)
-        
-        text = normalizer.normalize(text)
+        text = self.markup_normalizer.normalize(text)
+        text = self.normalizer.normalize(text)
         return text
\ No newline at end of file
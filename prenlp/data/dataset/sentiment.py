@@ -1,7 +1,21 @@
+import io
+import os
 import shutil
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+from functools import partial
 
 from .base import Dataset
+from .storage import LazySplits
+from ..utils import iter_archive
+
+def parse_sentiment(line: str, label_type=str) -> list:
+    """Parse a line of sentiment analysis dataset, '<label>\t<text>', to [text, label].
+    Args:
+        line (str): line of the dataset
+        label_type (callable): type of the labels, e.g. str for IMDb ('pos', 'neg') and int for NSMC (0, 1)
+    """
+    label, text = line.split('\t')
+    return [text.strip(), label_type(label)]
 
 def load_sentiment(from_path: str) -> list:
     """Load sentiment analysis dataset.
@@ -9,8 +23,7 @@ def load_sentiment(from_path: str) -> list:
     dataset = []
     with open(from_path, 'r', encoding='utf-8') as reader:
         for line in reader.readlines():
-            label, text = line.split('\t')
-            dataset.append([text.strip(), label])
+            dataset.append(parse_sentiment(line))
 
     return dataset
 
@@ -29,6 +42,9 @@ class IMDB(Dataset):
     
     Args:
         root (str): path to the dataset's highest level directory
+
+    As before the splits were read from the archive, the positive reviews of a split come before the negative ones.
+    Reviews with the same label are in the order of the archive.
     
     Examples:
     >>> imdb_train, imdb_test = prenlp.data.IMDB()
@@ -38,44 +54,55 @@ class IMDB(Dataset):
     ["Minor Spoilers<br /><br />Alison Parker (Cristina Raines) is a successful top model, living with the lawyer Michael Lerman (Chris Sarandon) in his apartment. She tried to commit suicide twice in the past: the first time, when she was a teenager and saw her father cheating her mother with two women in her home, and then when Michael's wife died. Since then, she left Christ and the Catholic Church behind. Alison wants to live alone in her own apartment and with the help of the real state agent Miss Logan (Ava Gardner), she finds a wonderful furnished old apartment in Brooklyn Heights for a reasonable rental. She sees a weird man in the window in the last floor of the building, and Miss Logan informs that he is Father Francis Matthew Halloran (John Carradine), a blinded priest who lives alone supported by the Catholic Church. Alison moves to her new place, and once there, she receives a visitor: her neighbor Charles Chazen (Burgess Meredith) welcomes her and introduces the new neighbors to her. Then, he invites Alison to his cat Jezebel's birthday party in the night. On the next day, weird things happen with Alison in her apartment and with her health. Alison looks for Miss Logan and is informed that she lives alone with the priest in the building. A further investigation shows that all the persons she knew in the party were dead criminals. Frightened with the situation, Alison embraces Christ again, while Michael investigates the creepy events. Alison realizes that she is living in the gateway to hell. <br /><br />Although underrated in IMDb User Rating, 'The Sentinel' is one of the best horror movies ever. I have seen this film at least six times, being the first time in the 70's, in the movie theater. In 07 September 2002, I bought the imported DVD and saw it again. Yesterday I saw this movie once more. Even after so many years, this film is still terrific. The creepy and lurid story frightens even in the present days. The cast is a constellation of stars and starlets. You can see many actors and actresses, who became famous, in the beginning of career. Fans of horror movie certainly worships 'The Sentinel', and I am one of them. My vote is nine.<br /><br />Title (Brazil): 'A Sentinela dos Malditos' ('The Sentinel of the Damned')<br /><br />Obs.: On 02 September 2007, I saw this movie again.", 'pos']
     """
 
+    sha256 = 'c40f74a18d3b61f90feba1e17730e0d38e8b97c05fde7008942e91923d1658fe'
+
     def __init__(self, root: str='.data'):
         self.root = Path(root)
         self.url = 'https://ai.stanford.edu/~amaas/data/sentiment/aclImdb_v1.tar.gz'
         self.dirname = 'aclImdb'
         self.out_filename = ('imdb.train', 'imdb.test')
 
-        if not (self.root/self.dirname).exists():
-            super(IMDB, self)._download(to_path = self.root)
-                        
         super(IMDB, self).__init__(self._get_data())
 
-    def _get_data(self, train: str='train', test: str='test') -> list:
+    def _get_data(self, train: str='train', test: str='test') -> LazySplits:
         out_path_train = self.root/self.dirname/self.out_filename[0]
         out_path_test = self.root/self.dirname/self.out_filename[1]
 
-        if out_path_train.exists() and out_path_test.exists():
-            train, test = load_sentiment(out_path_train), load_sentiment(out_path_test)
-            dataset = [train, test]
-        else:
-            dataset = []
-            for i, data in enumerate([train, test]):
-                samples = []
-                for label in ['pos', 'neg']:
-                    filenames = (self.root/self.dirname/data/label).glob('*.txt')
-                    for filename in filenames:
-                        with open(filename, 'r', encoding='utf-8') as reader:
-                            text = reader.readline().strip().replace('\t', ' ')
-                            sample = [text, label]
-                            samples.append(sample)
-                dataset.append(samples)
-
-            # Save dataset
-            shutil.rmtree(self.root/self.dirname)
-            (self.root/self.dirname).mkdir()
-            for i, filename in enumerate(self.out_filename):
-                save_sentiment(dataset[i], to_path=self.root/self.dirname/filename)
+        if not (out_path_train.exists() and out_path_test.exists()):
+            if not self.archive_path.exists():
+                super(IMDB, self)._download(to_path = self.root, extract=False)
+
+            # Reviews are read from the archive in one pass, and written to the file of their split and label as they come.
+            # The files of a split are then concatenated, positive reviews first.
+            (self.root/self.dirname).mkdir(parents=True, exist_ok=True)
+            out_paths = {train: out_path_train, test: out_path_test}
+            tmp_paths = {(data, label): out_path.with_name('{}.{}.tmp'.format(out_path.name, label))
+                         for data, out_path in out_paths.items() for label in ('pos', 'neg')}
+            writers = {key: open(tmp_path, 'w', encoding='utf-8') for key, tmp_path in tmp_paths.items()}
+            try:
+                for name, file in iter_archive(self.archive_path, members=partial(_is_imdb_review, splits=(train, test))):
+                    _, data, label, _ = PurePosixPath(name).parts
+                    text = io.TextIOWrapper(file, encoding='utf-8').readline().strip().replace('\t', ' ')
+                    writers[data, label].write('{label}\t{text}\n'.format(label=label, text=text))
+            finally:
+                for writer in writers.values():
+                    writer.close()
+            for data, out_path in out_paths.items():
+                tmp_path = out_path.with_name(out_path.name+'.tmp')
+                with open(tmp_path, 'wb') as writer:
+                    for label in ('pos', 'neg'):
+                        with open(tmp_paths[data, label], 'rb') as reader:
+                            shutil.copyfileobj(reader, writer)
+                        os.remove(tmp_paths[data, label])
+                os.replace(tmp_path, out_path)
         
-        return dataset
+        return LazySplits([out_path_train, out_path_test], parse=parse_sentiment)
+
+def _is_imdb_review(name: str, splits: tuple) -> bool:
+    """Whether a file of the IMDb archive is a review of one of the splits, e.g. 'aclImdb/train/pos/0_9.txt'.
+    """
+    parts = PurePosixPath(name).parts
+    return len(parts) == 4 and parts[1] in splits and parts[2] in ('pos', 'neg') and parts[3].endswith('.txt')
 
 
 class NSMC(Dataset):
@@ -102,34 +129,31 @@ class NSMC(Dataset):
         self.dirname = 'nsmc-master'
         self.out_filename = ('nsmc.train', 'nsmc.test')
         
-        if not (self.root/self.dirname).exists():
-            super(NSMC, self)._download(to_path = self.root)
-        
         super(NSMC, self).__init__(self._get_data())
 
-    def _get_data(self, train: str='ratings_train.txt', test: str='ratings_test.txt') -> list:
+    def _get_data(self, train: str='ratings_train.txt', test: str='ratings_test.txt') -> LazySplits:
         out_path_train = self.root/self.dirname/self.out_filename[0]
         out_path_test = self.root/self.dirname/self.out_filename[1]
 
-        if out_path_train.exists() and out_path_test.exists():
-            train, test = load_sentiment(out_path_train), load_sentiment(out_path_test)
-            dataset = [train, test]
-        else:
-            dataset = []
-            for i, data in enumerate([train, test]):
-                samples = []
-                filename = self.root/self.dirname/data
-                with open(filename, 'r', encoding='utf-8') as reader:
-                    for line in reader.readlines()[1:]: # not include column names
-                        line = line.strip().split('\t')
-                        text, label = line[1].replace('\t', ' '), int(line[2])
-                        samples.append([text, label])
-                dataset.append(samples)
-                
-            # Save dataset
-            shutil.rmtree(self.root/self.dirname)
-            (self.root/self.dirname).mkdir()
-            for i, filename in enumerate(self.out_filename):
-                save_sentiment(dataset[i], to_path=self.root/self.dirname/filename)
-
-        return dataset
\ No newline at end of file
+        if not (out_path_train.exists() and out_path_test.exists()):
+            if not self.archive_path.exists():
+                super(NSMC, self)._download(to_path = self.root, extract=False)
+
+            # The ratings are read from the archive, without extracting the rest of the repository.
+            (self.root/self.dirname).mkdir(parents=True, exist_ok=True)
+            out_paths = {self.dirname+'/'+train: out_path_train, self.dirname+'/'+test: out_path_test}
+            for name, file in iter_archive(self.archive_path, members=out_paths.__contains__):
+                tmp_path = out_paths[name].with_name(out_paths[name].name+'.tmp')
+                save_sentiment(_iter_nsmc(io.TextIOWrapper(file, encoding='utf-8')), to_path=tmp_path)
+                os.replace(tmp_path, out_paths[name])
+
+        return LazySplits([out_path_train, out_path_test], parse=partial(parse_sentiment, label_type=int))
+
+def _iter_nsmc(reader):
+    """Yield [text, label] of the lines of a NSMC ratings file.
+    """
+    next(reader, None) # not include column names
+    for line in reader:
+        line = line.strip().split('\t')
+        text, label = line[1].replace('\t', ' '), int(line[2])
+        yield [text, label]
@@ -0,0 +1,129 @@
+import os
+import mmap
+from pathlib import Path
+
+from .base import Transforms
+
+class TextFile(Transforms):
+    """Read-only, random-access view of the lines of a text file, which is memory-mapped instead of loaded.
+    The byte offsets of the lines are stored in a numpy int64 index next to the file, '<filename>.idx.npy',
+    which is built on first use and rebuilt whenever the file changes. Both are memory-mapped,
+    so that 'len' and indexing cost O(1) memory for any file size, and only the requested line is decoded.
+    Samples are not cached: each access decodes and parses the line again into a new sample, so changes to a sample
+    are not kept. Use 'list(text_file)' for samples to be modified in place.
+    Samples can be transformed lazily, e.g. train.map(fn, workers=8).batch(32) (see 'Transforms').
+
+    Args:
+        path (str): one-sample-per-line text file
+        parse (callable): function converting a decoded line, without the line break, to a sample. If None, lines are returned
+
+    Examples:
+    >>> train = prenlp.data.TextFile('.data/namuwiki.train', parse=str.strip)
+    >>> len(train)
+    16288639
+    >>> train[-1]
+    """
+
+    _CHUNK_SIZE = 1 << 26  # bytes scanned at once for line breaks when building the index
+
+    def __init__(self, path: str, parse=None):
+        self.path = Path(path)
+        self.parse = parse
+        self._open()
+
+    def __getstate__(self):
+        return {'path': self.path, 'parse': self.parse}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError('{} index out of range'.format(type(self).__name__))
+
+        start, end = int(self._offsets[idx]), int(self._offsets[idx+1])
+        line = self._buffer[start:end].decode('utf-8').rstrip('\n')
+        return line if self.parse is None else self.parse(line)
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_name(self.path.name + '.idx.npy')
+
+    def _open(self) -> None:
+        import numpy as np
+
+        size = self.path.stat().st_size
+        index_path = self.index_path
+        offsets = None
+        if index_path.exists() and index_path.stat().st_mtime >= self.path.stat().st_mtime:
+            offsets = np.load(index_path, mmap_mode='r')
+            if len(offsets) == 0 or offsets[-1] != size:
+                offsets = None
+        if offsets is None:
+            self._build_index(index_path)
+            offsets = np.load(index_path, mmap_mode='r')
+
+        if size > 0:
+            with open(self.path, 'rb') as reader:
+                self._buffer = mmap.mmap(reader.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._buffer = b''
+        self._offsets = offsets
+
+    def _build_index(self, index_path: Path) -> None:
+        import numpy as np
+
+        starts = [np.zeros(1, dtype=np.int64)]
+        position, last = 0, b'\n'
+        with open(self.path, 'rb') as reader:
+            chunk = reader.read(self._CHUNK_SIZE)
+            while chunk:
+                breaks = np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == ord('\n'))
+                starts.append(breaks.astype(np.int64) + position + 1)
+                position += len(chunk)
+                last = chunk[-1:]
+                chunk = reader.read(self._CHUNK_SIZE)
+        if last != b'\n':
+            # The last line has no line break.
+            starts.append(np.array([position], dtype=np.int64))
+
+        # Written to a temporary file first, so that a concurrent reader never loads a partial index.
+        tmp_path = index_path.with_name(index_path.name + '.{}.tmp'.format(os.getpid()))
+        with open(tmp_path, 'wb') as writer:
+            np.save(writer, np.concatenate(starts))
+        os.replace(tmp_path, index_path)
+
+class LazySplits:
+    """Sequence of the splits of a dataset (e.g. train, valid, test), each stored in a 'TextFile'.
+    A split is opened only when it is accessed.
+
+    Args:
+        paths (list): text file of each split
+        parse (callable): function converting a line to a sample, shared by the splits
+    """
+
+    def __init__(self, paths: list, parse=None):
+        self.paths = list(paths)
+        self.parse = parse
+        self._splits = [None] * len(self.paths)
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if self._splits[idx] is None:
+            self._splits[idx] = TextFile(self.paths[idx], parse=self.parse)
+        return self._splits[idx]
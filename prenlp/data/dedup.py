@@ -0,0 +1,268 @@
+import os
+import hashlib
+import tempfile
+from pathlib import Path
+from functools import partial
+
+from ..utils import imap_ordered, chunked
+
+def hash64(text: str) -> int:
+    """Return a 64-bit hash of a text (blake2b), stable across processes and runs, unlike 'hash'.
+    """
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=8).digest(), 'little')
+
+class ExactDeduplicator:
+    """Remove exact duplicates from a stream of texts, e.g. sentences of a corpus, keeping the first occurrence.
+    Texts are identified by 64-bit hashes (see 'hash64'), checked by chunks against sorted arrays of the hashes seen so far.
+    When the hashes in memory exceed 'max_bytes', they are spilled to a sorted file in 'spill_dir', which is memory-mapped,
+    so that memory stays bounded for any number of texts. Two different texts collide with a probability of about n^2 / 2^65.
+
+    Args:
+        max_bytes (int): memory budget of the hashes, 8 bytes each
+        spill_dir (str): directory of the spilled hashes. If None, a temporary directory is used
+        chunksize (int): number of texts hashed and checked at once
+        key (callable): function returning the text of a sample, e.g. lambda sample: sample[0] for (text, label).
+                        If None, samples are texts
+
+    Examples:
+    >>> dedup = prenlp.data.ExactDeduplicator(max_bytes=2**28)
+    >>> list(dedup(['안녕하세요', '반갑습니다', '안녕하세요']))
+    ['안녕하세요', '반갑습니다']
+    >>> dedup.report()
+    {'texts': 3, 'removed': 1, 'unique': 2, 'spilled': 0}
+    >>> wikitext_train.apply(prenlp.data.ExactDeduplicator()).map(preprocess) # as a stage of a pipeline
+    """
+
+    def __init__(self, max_bytes: int=2**28, spill_dir: str=None, chunksize: int=10000, key=None):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.chunksize = chunksize
+        self.key = key
+
+        self.texts = 0
+        self.removed = 0
+        self._runs = []         # sorted numpy uint64 arrays of hashes in memory
+        self._spilled = []      # sorted memory-mapped arrays of spilled hashes
+        self._spill_paths = []
+        self._tmp_dir = None
+
+    def __call__(self, samples):
+        """Yield the samples whose texts are seen for the first time, in order.
+        """
+        for chunk in chunked(samples, self.chunksize):
+            keep = self._check(chunk if self.key is None else [self.key(sample) for sample in chunk])
+            for sample, kept in zip(chunk, keep.tolist()):
+                if kept:
+                    yield sample
+
+    def __del__(self):
+        try:
+            self.clear()
+        except Exception:
+            pass # at interpreter shutdown
+
+    def report(self) -> dict:
+        """Return the number of texts read, removed and kept, and of hashes spilled to disk.
+        """
+        return {'texts': self.texts, 'removed': self.removed, 'unique': self.texts - self.removed,
+                'spilled': sum(len(run) for run in self._spilled)}
+
+    def clear(self) -> None:
+        """Forget the hashes seen so far, and remove the spilled files. Statistics are kept.
+        """
+        self._runs, self._spilled = [], []
+        for path in self._spill_paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._spill_paths = []
+        if self._tmp_dir is not None:
+            self._tmp_dir.cleanup()
+            self._tmp_dir = None
+
+    def _check(self, chunk: list):
+        """Return the boolean mask of the texts of a chunk which were not seen, and remember their hashes.
+        """
+        import numpy as np
+
+        hashes = np.fromiter(map(hash64, chunk), dtype=np.uint64, count=len(chunk))
+        # First occurrences within the chunk
+        keep = np.zeros(len(chunk), dtype=bool)
+        keep[np.unique(hashes, return_index=True)[1]] = True
+        for run in self._spilled + self._runs:
+            keep &= ~_contains(run, hashes)
+
+        self.texts += len(chunk)
+        self.removed += len(chunk) - int(keep.sum())
+        self._add(np.sort(hashes[keep]))
+        return keep
+
+    def _add(self, hashes) -> None:
+        import numpy as np
+
+        self._runs.append(hashes)
+        # Runs are merged as they grow, so that a chunk is checked against few arrays.
+        while len(self._runs) > 1 and len(self._runs[-2]) <= 2*len(self._runs[-1]):
+            last = self._runs.pop()
+            self._runs[-1] = np.sort(np.concatenate([self._runs[-1], last]))
+
+        if sum(run.nbytes for run in self._runs) > self.max_bytes:
+            self._spill(np.sort(np.concatenate(self._runs)))
+            self._runs = []
+
+    def _spill(self, hashes) -> None:
+        import numpy as np
+
+        spill_dir = self.spill_dir
+        if spill_dir is None:
+            if self._tmp_dir is None:
+                self._tmp_dir = tempfile.TemporaryDirectory(prefix='prenlp-dedup-')
+            spill_dir = self._tmp_dir.name
+        Path(spill_dir).mkdir(parents=True, exist_ok=True)
+
+        path = Path(spill_dir)/'hashes.{}.{}.{}.npy'.format(os.getpid(), id(self), len(self._spill_paths))
+        np.save(path, hashes)
+        self._spill_paths.append(path)
+        self._spilled.append(np.load(path, mmap_mode='r'))
+
+def _contains(run, hashes):
+    """Return the boolean mask of the hashes in the sorted array 'run'.
+    """
+    import numpy as np
+
+    if len(run) == 0:
+        return np.zeros(len(hashes), dtype=bool)
+    idx = np.searchsorted(run, hashes)
+    idx[idx == len(run)] = 0
+    return run[idx] == hashes
+
+class MinHashLSH:
+    """Find near-duplicate documents with MinHash and LSH banding.
+    A document is represented by its character n-grams (shingles). Its MinHash signature holds, for each of 'num_perm'
+    random hash functions, the minimum hash of its shingles, so that two signatures agree on a function with probability
+    equal to the Jaccard similarity of the shingles. Signatures are cut into 'bands' bands, and documents sharing a band
+    with an earlier document are candidates, kept as near-duplicates if their signatures agree on at least 'threshold'
+    of the functions. The hashing is vectorized with numpy, and signatures are computed in a process pool.
+
+    Args:
+        num_perm (int): number of hash functions
+        bands (int): number of bands, which divides 'num_perm'. More bands find less similar candidates
+        ngram (int): number of characters of a shingle
+        threshold (float): minimum estimated Jaccard similarity of near-duplicates
+        seed (int): seed of the hash functions
+
+    Examples:
+    >>> documents = ['The quick brown fox jumps over the lazy dog near the river bank.',
+    ...              'The quick brown fox jumps over the lazy dog near the river bank!',
+    ...              'An entirely different document about sentence piece tokenizers.']
+    >>> lsh = prenlp.data.MinHashLSH(num_perm=128, bands=16, threshold=0.8)
+    >>> signatures = lsh.signatures(documents, workers=8)
+    >>> lsh.duplicates(signatures) # True for documents near-duplicating an earlier one
+    array([False,  True, False])
+    >>> lsh.report()
+    {'documents': 3, 'candidates': 1, 'removed': 1}
+    """
+
+    def __init__(self, num_perm: int=128, bands: int=16, ngram: int=5, threshold: float=0.8, seed: int=0):
+        import numpy as np
+
+        if num_perm % bands != 0:
+            raise ValueError('bands should divide num_perm, {} does not divide {}'.format(bands, num_perm))
+        self.num_perm = num_perm
+        self.bands = bands
+        self.ngram = ngram
+        self.threshold = threshold
+        self.seed = seed
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(0, 1 << 63, size=num_perm, dtype=np.uint64) << np.uint64(1) | np.uint64(1) # odd
+        self._b = rng.randint(0, 1 << 63, size=num_perm, dtype=np.uint64) << np.uint64(1)
+
+        self.documents = 0
+        self.candidates = 0
+        self.removed = 0
+
+    def signature(self, document: str):
+        """Return the MinHash signature of a document, as a numpy uint32 array of 'num_perm' values.
+        """
+        return _minhash(self.ngram, self._a, self._b, document)
+
+    def signatures(self, documents, workers: int=1, chunksize: int=256):
+        """Return the MinHash signatures of documents, as a numpy uint32 array of shape (number of documents, num_perm).
+        Args:
+            documents (iterable): texts of the documents
+            workers (int): number of worker processes
+            chunksize (int): number of documents sent to a worker at once
+        """
+        import numpy as np
+
+        signatures = imap_ordered(partial(_minhash, self.ngram, self._a, self._b), documents, workers=workers, chunksize=chunksize)
+        return np.array(list(signatures), dtype=np.uint32).reshape(-1, self.num_perm)
+
+    def duplicates(self, signatures):
+        """Return the boolean mask of the documents which near-duplicate an earlier document, given their signatures.
+        The first document of a group of near-duplicates is kept.
+        """
+        import numpy as np
+
+        n = len(signatures)
+        rows = self.num_perm // self.bands
+        candidates = np.zeros(n, dtype=bool)
+        duplicates = np.zeros(n, dtype=bool)
+        for band in range(self.bands):
+            keys = _band_keys(signatures[:, band*rows:(band+1)*rows])
+            # Each document is compared to the first document with the same key.
+            order = np.argsort(keys, kind='stable')
+            sorted_keys = keys[order]
+            starts = np.ones(n, dtype=bool)
+            starts[1:] = sorted_keys[1:] != sorted_keys[:-1]
+            first = order[np.maximum.accumulate(np.where(starts, np.arange(n), 0))] if n else order
+            pairs = np.flatnonzero(first != order)
+            docs, earlier = order[pairs], first[pairs]
+            candidates[docs] = True
+
+            similarity = (signatures[docs] == signatures[earlier]).mean(axis=1) if len(docs) else np.zeros(0)
+            duplicates[docs[similarity >= self.threshold]] = True
+
+        self.documents += n
+        self.candidates += int(candidates.sum())
+        self.removed += int(duplicates.sum())
+        return duplicates
+
+    def report(self) -> dict:
+        """Return the number of documents checked, of candidates sharing a band with an earlier document, and of near-duplicates.
+        """
+        return {'documents': self.documents, 'candidates': self.candidates, 'removed': self.removed}
+
+def _minhash(ngram: int, a, b, document: str):
+    import numpy as np
+
+    codepoints = np.frombuffer(document.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32).astype(np.uint64)
+    n = len(codepoints) - ngram + 1
+    if n <= 0:
+        # A document shorter than a shingle is a shingle.
+        codepoints, n = np.concatenate([codepoints, np.zeros(ngram - len(codepoints), dtype=np.uint64)]), 1
+
+    # Polynomial hash of the shingles, wrapping around 2^64, folded to 32 bits
+    with np.errstate(over='ignore'):
+        shingles = np.zeros(n, dtype=np.uint64)
+        for k in range(ngram):
+            shingles = shingles * np.uint64(1000003) + codepoints[k:k+n]
+    shingles = np.unique(shingles)
+    shingles = (shingles >> np.uint64(32)) ^ (shingles & np.uint64(0xFFFFFFFF))
+    # Multiply-shift hashing: the high 32 bits of a*x + b mod 2^64, for random a and b
+    with np.errstate(over='ignore'):
+        hashes = shingles[:, None] * a[None, :] + b[None, :]
+    return (hashes.min(axis=0) >> np.uint64(32)).astype(np.uint32)
+
+def _band_keys(band):
+    """Return a 64-bit key of each row of a band of signatures.
+    """
+    import numpy as np
+
+    keys = np.zeros(len(band), dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        for column in range(band.shape[1]):
+            keys = keys * np.uint64(0x100000001B3) ^ band[:, column].astype(np.uint64)
+    return keys
@@ -0,0 +1,148 @@
+import re
+from pathlib import Path
+
+EMOJI_SEQUENCES_PATH = Path(__file__).parent/'emoji-sequences.txt'
+
+def load_emoji_sequences(from_path: str=EMOJI_SEQUENCES_PATH) -> list:
+    """Load emoji sequences, one sequence of space-separated code points per line.
+    """
+    sequences = []
+    with open(from_path, 'r', encoding='utf-8') as reader:
+        for line in reader:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                sequences.append(''.join(chr(int(codepoint, 16)) for codepoint in line.split()))
+
+    return sequences
+
+class EmojiMatcher:
+    """EmojiMatcher finds emojis in text with a trie of emoji sequences.
+    A single regex over the first code points of the sequences finds the candidate positions,
+    then the longest sequence (ZWJ sequence, skin tone, flag, keycap, ...) starting there is matched in the trie,
+    so that a multi-codepoint emoji is always replaced as a whole.
+    The trie is built on first use.
+
+    Args:
+        sequences (list): emoji sequences. If None, sequences in 'emoji-sequences.txt' are used
+
+    Examples:
+    >>> matcher = prenlp.data.EmojiMatcher()
+    >>> matcher.sub('[EMOJI]', 'Hello 🤩, I love you 💓 !')
+    'Hello [EMOJI], I love you [EMOJI] !'
+    """
+
+    _END = ''  # key marking the end of a sequence in the trie. No code point is an empty string.
+    _RANGE_GAP = 256  # maximum gap between code points merged into one range of the candidate regex
+
+    def __init__(self, sequences: list=None):
+        self.sequences = sequences
+        self._trie = None
+        self._regex = None
+        self._first = None
+        self._check = None
+
+    @property
+    def pattern(self) -> str:
+        """Regex pattern which matches wherever an emoji sequence starts, and possibly elsewhere.
+        """
+        if self._regex is None:
+            self._build()
+        return self._regex.pattern
+
+    @property
+    def split_pattern(self) -> tuple:
+        """Return the candidate regex split after its first code point, as (first, check):
+        'first' is a character class of the code points starting a candidate,
+        and 'check' is a zero-width regex which, right after such a code point, matches only if it starts a candidate.
+        """
+        if self._regex is None:
+            self._build()
+        return self._first, self._check
+
+    def match(self, text: str, pos: int=0) -> int:
+        """Return the end of the longest emoji starting at 'pos' in 'text', or -1 if no emoji starts there.
+        """
+        if self._trie is None:
+            self._build()
+
+        node, end, end_key = self._trie, -1, self._END
+        for i in range(pos, len(text)):
+            node = node.get(text[i])
+            if node is None:
+                break
+            if end_key in node:
+                end = i + 1
+        return end
+
+    def search(self, text: str, pos: int=0) -> tuple:
+        """Return the (start, end) of the first emoji in 'text' from 'pos', or None if there is no emoji.
+        """
+        if self._regex is None:
+            self._build()
+
+        candidate = self._regex.search(text, pos)
+        while candidate is not None:
+            start = candidate.start()
+            end = self.match(text, start)
+            if end > 0:
+                return start, end
+            candidate = self._regex.search(text, start + 1)
+
+        return None
+
+    def sub(self, repl: str, text: str) -> str:
+        """Return the string obtained by replacing all emojis in 'text' by the replacement 'repl'.
+        Like 're.sub', backslash escapes in 'repl' are processed.
+        """
+        span = self.search(text)
+        if span is None:
+            return text
+
+        if '\\' in repl:
+            repl = re.match('', '').expand(repl)
+        pieces, pos = [], 0
+        while span is not None:
+            start, end = span
+            pieces.append(text[pos:start])
+            pieces.append(repl)
+            pos = end
+            span = self.search(text, pos)
+        pieces.append(text[pos:])
+
+        return ''.join(pieces)
+
+    def _build(self) -> None:
+        sequences = self.sequences if self.sequences is not None else load_emoji_sequences()
+
+        trie = {}
+        for sequence in sequences:
+            node = trie
+            for char in sequence:
+                node = node.setdefault(char, {})
+            node[self._END] = True
+
+        # ASCII code points (keycap bases, e.g. '1' of '1️⃣') only start an emoji when followed by the rest of it,
+        # so they are required to be followed by a possible second code point to avoid stopping at every digit.
+        starts = sorted(char for char in trie if char >= '\x80' or self._END in trie[char])
+        ascii_starts = ''.join(sorted(char for char in trie if char not in starts))
+        ascii_seconds = ''.join(sorted({char for start in ascii_starts for char in trie[start] if char != self._END}))
+
+        # 're' checks a character class with code points beyond the BMP range by range,
+        # so close code points are merged into a few wide ranges. Extra candidates are rejected by the trie.
+        ranges = []
+        for codepoint in map(ord, starts):
+            if ranges and codepoint - ranges[-1][1] <= self._RANGE_GAP:
+                ranges[-1][1] = codepoint
+            else:
+                ranges.append([codepoint, codepoint])
+        ranges = ''.join('{}-{}'.format(re.escape(chr(first)), re.escape(chr(last))) for first, last in ranges)
+        pattern, first, check = '[{}]'.format(ranges), '[{}]'.format(ranges), '(?<=[{}])'.format(ranges)
+        if ascii_starts:
+            ascii_starts, ascii_seconds = re.escape(ascii_starts), re.escape(ascii_seconds)
+            pattern += '|[{}](?=[{}])'.format(ascii_starts, ascii_seconds)
+            first = '[{}{}]'.format(ranges, ascii_starts)
+            check = '(?:{}|(?<=[{}])(?=[{}]))'.format(check, ascii_starts, ascii_seconds)
+
+        self._trie = trie
+        self._regex = re.compile(pattern)
+        self._first, self._check = first, check
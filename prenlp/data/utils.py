@@ -1,44 +1,201 @@
-import requests
+import io
+import os
+import time
+import hashlib
 from pathlib import Path
-import py7zr
+from functools import partial
 import zipfile
 import tarfile
 
-def fasttext_transform(data, filename: str, label_prefix: str='__label__') -> None:
+def fasttext_transform(data, filename: str, label_prefix: str='__label__', normalizer=None, tokenizer=None,
+                       workers: int=1, chunksize: int=1000, num_shards: int=1, buffer_size: int=1<<22) -> list:
     """fastText style data transformation.
+    Samples are streamed from any iterable, e.g. a lazy split or pipeline, and formatted as '<prefix><label> <text>' lines
+    by chunks, optionally normalized and tokenized in a process pool. Each chunk is written at once through a large buffer,
+    to a temporary file renamed once complete. The output is the same for any number of workers and chunk size,
+    compressed output included, which is compressed by blocks of a fixed number of samples.
     Args:
-        data (list, tuple): dataset-like object to be transformed. It should be in following format,
-                            e.g. data[0] = (text, label)
-        filename (str): filename of fasttext style output
+        data (iterable): dataset-like object to be transformed. It should be in following format,
+                         e.g. data[0] = (text, label)
+        filename (str): filename of fasttext style output. If it ends with '.gz', '.bz2' or '.xz', the output is compressed,
+                        by blocks of 10,000 samples in the worker processes (as a multi-stream file, which gzip, bzip2 and xz read as one)
         label_prefix (str): string, which is how fastText recognize what is a label.
+        normalizer : normalizer with 'normalize' method, e.g. Normalizer, applied to the texts. If None, texts are not normalized
+        tokenizer : tokenizer with 'tokenize' method, applied to the texts and joined by spaces. If None, texts are not tokenized
+        workers (int): number of worker processes. The normalizer and tokenizer should be picklable when workers > 1
+        chunksize (int): number of samples formatted and written at once. It is rounded up to whole compression blocks if compressed
+        num_shards (int): number of output files. The i-th sample is written to the shard i % num_shards,
+                          named '<filename>-<shard>-of-<num_shards>' (before the compression extension)
+        buffer_size (int): size of the write buffer of each output file in bytes
+
+    Returns:
+        paths of the output files
+    """
+    from ..utils import imap_ordered, chunked
+
+    path = Path(filename)
+    compression = path.suffix if path.suffix in _COMPRESSIONS else ''
+    if num_shards == 1:
+        paths = [path]
+    else:
+        stem = path.name[:len(path.name)-len(compression)]
+        paths = [path.with_name('{}-{:05d}-of-{:05d}{}'.format(stem, shard, num_shards, compression)) for shard in range(num_shards)]
+
+    if compression:
+        # Chunks of whole blocks, so that blocks start at the same samples for any chunk size.
+        chunksize = -(-chunksize // _COMPRESSION_BLOCK) * _COMPRESSION_BLOCK
+    format_chunk = partial(_format_fasttext_chunk, label_prefix, normalizer, tokenizer, num_shards, compression)
+    chunks = ((i*chunksize, chunk) for i, chunk in enumerate(chunked(data, chunksize)))
+    # Written to temporary files first, so that a partial output is never taken for the complete one.
+    tmp_paths = [path.with_name(path.name + '.{}.tmp'.format(os.getpid())) for path in paths]
+    writers = [open(tmp_path, 'wb', buffering=buffer_size) for tmp_path in tmp_paths]
+    try:
+        for blocks in imap_ordered(format_chunk, chunks, workers=workers, chunksize=1):
+            for writer, block in zip(writers, blocks):
+                writer.write(block)
+    except BaseException:
+        for writer, tmp_path in zip(writers, tmp_paths):
+            writer.close()
+            tmp_path.unlink()
+        raise
+    for writer, tmp_path, path in zip(writers, tmp_paths, paths):
+        writer.close()
+        os.replace(tmp_path, path)
+    return paths
+
+_COMPRESSIONS = ('.gz', '.bz2', '.xz')
+_COMPRESSION_BLOCK = 10000 # number of samples compressed at once
+
+def _compress(compression: str, data: bytes) -> bytes:
+    if compression == '.gz':
+        import gzip
+        buffer = io.BytesIO()
+        # No file name nor timestamp, so that the output is deterministic. gzip.compress takes 'mtime' from Python 3.8 only.
+        with gzip.GzipFile(filename='', mode='wb', compresslevel=6, fileobj=buffer, mtime=0) as writer:
+            writer.write(data)
+        return buffer.getvalue()
+    elif compression == '.bz2':
+        import bz2
+        return bz2.compress(data, compresslevel=9)
+    elif compression == '.xz':
+        import lzma
+        return lzma.compress(data, preset=6)
+    return data
+
+def _format_fasttext_chunk(label_prefix: str, normalizer, tokenizer, num_shards: int, compression: str, chunk: tuple) -> list:
+    """Return the fastText lines of a chunk of samples, (index of the first sample, samples), as a block of bytes per shard.
+    If compressed, the lines of each '_COMPRESSION_BLOCK' samples are compressed separately.
     """
-    with open(filename, 'w', encoding='utf-8') as writer:
-        for _text, _label in data:
-            writer.write('{prefix}{label} {text}\n'.format(
-                prefix=label_prefix, label=_label, text=_text.strip()))
+    start, samples = chunk
+    block_size = _COMPRESSION_BLOCK if compression else max(len(samples), 1)
+    blocks = [[] for _ in range(num_shards)]
+    for block_start in range(0, len(samples), block_size):
+        lines = [[] for _ in range(num_shards)]
+        for i, (text, label) in enumerate(samples[block_start:block_start+block_size], start+block_start):
+            text = text.strip()
+            if normalizer is not None:
+                text = normalizer.normalize(text)
+            if tokenizer is not None:
+                text = ' '.join(tokenizer.tokenize(text))
+            lines[i % num_shards].append(label_prefix + str(label) + ' ' + text + '\n')
+        for shard, shard_lines in zip(blocks, lines):
+            if shard_lines:
+                shard.append(_compress(compression, ''.join(shard_lines).encode('utf-8')))
+    return [b''.join(shard) for shard in blocks]
 
 
-def download_from_url(url: str, filename: str, root: str) -> Path:
+def download_from_url(url: str, filename: str, root: str, sha256: str=None, chunk_size: int=1<<20,
+                      progress=None, retries: int=3, timeout: float=60) -> Path:
     """Download file from url.
+    The file is streamed in chunks to '<filename>.part', which is renamed to 'filename' once complete,
+    so that memory stays constant and a partial file is never taken for the complete one.
+    An interrupted download resumes from the end of '<filename>.part' with an HTTP Range request,
+    on retry or on the next call, and starts over if the server does not support ranges.
     Args:
         url (str): url of the file
         filename (str): filename to be downloaded
         root (str): directory used to store the file in, from url
+        sha256 (str): expected SHA-256 hex digest of the file. If given, an existing file with this digest is not downloaded again,
+                      and a downloaded file with another digest is removed, raising ValueError
+        chunk_size (int): number of bytes read and written at once
+        progress (callable): called after each chunk as progress(downloaded bytes, total bytes or None, bytes per second)
+        retries (int): number of times an interrupted download is resumed before giving up
+        timeout (float): seconds to wait for the server to respond or send data
 
     Returns:
         path to the downloaded files
     """
     root = Path(root)
-    if not root.exists():
-        root.mkdir()
-    
+    root.mkdir(parents=True, exist_ok=True)
+
     filepath = root/filename
-    response = requests.get(url)
-    with open(filepath, 'wb') as file:
-        file.write(response.content)
+    if sha256 is not None and filepath.exists() and _sha256(filepath) == sha256.lower():
+        return filepath
+    
+    import requests
+
+    part_path = root/(filename+'.part')
+    for attempt in range(retries+1):
+        try:
+            _download_part(requests, url, part_path, chunk_size, progress, timeout)
+            break
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError):
+            # The download resumes from the part downloaded so far.
+            if attempt == retries:
+                raise
+
+    if sha256 is not None:
+        digest = _sha256(part_path)
+        if digest != sha256.lower():
+            part_path.unlink()
+            raise ValueError('SHA-256 of {} is {}, not {}'.format(url, digest, sha256))
+    os.replace(part_path, filepath)
 
     return filepath
 
+def _download_part(requests, url: str, part_path: Path, chunk_size: int, progress, timeout: float) -> None:
+    """Download the rest of the file to 'part_path', from its current size.
+    """
+    downloaded = part_path.stat().st_size if part_path.exists() else 0
+    headers = {'Range': 'bytes={}-'.format(downloaded)} if downloaded > 0 else {}
+
+    with requests.get(url, headers=headers, stream=True, timeout=timeout) as response:
+        if response.status_code == 416:
+            # Range not satisfiable: the part is complete if it has the size of the file, else it is started over.
+            total = response.headers.get('Content-Range', '').rpartition('/')[2]
+            if total.isdigit() and int(total) == downloaded:
+                return
+            part_path.unlink()
+            return _download_part(requests, url, part_path, chunk_size, progress, timeout)
+        response.raise_for_status()
+
+        if response.status_code != 206:
+            # The server ignored the range, so that the whole file is sent.
+            downloaded = 0
+        length = response.headers.get('Content-Length')
+        total = downloaded + int(length) if length is not None and length.isdigit() else None
+
+        start, resumed_from = time.perf_counter(), downloaded
+        with open(part_path, 'ab' if downloaded > 0 else 'wb') as file:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                file.write(chunk)
+                downloaded += len(chunk)
+                if progress is not None:
+                    elapsed = time.perf_counter() - start
+                    progress(downloaded, total, (downloaded-resumed_from)/elapsed if elapsed > 0 else 0.0)
+
+    if total is not None and downloaded < total:
+        raise requests.exceptions.ChunkedEncodingError('{} ended after {} of {} bytes'.format(url, downloaded, total))
+
+def _sha256(path: Path, chunk_size: int=1<<20) -> str:
+    """Return the SHA-256 hex digest of a file, read in chunks.
+    """
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as reader:
+        for chunk in iter(partial(reader.read, chunk_size), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
 def unzip_archive(from_path: str, to_path: str) -> Path:
     """Unzip archive.
     Args:
@@ -57,8 +214,196 @@ def unzip_archive(from_path: str, to_path: str) -> Path:
             for tarinfo in tgfile:
                 tgfile.extract(tarinfo, to_path)
     elif extenstion == '.7z':
+        import py7zr
         szfile = py7zr.SevenZipFile(from_path, mode='r')
         szfile.extractall(path=to_path)
         szfile.close()
 
-    return Path(to_path)
\ No newline at end of file
+    return Path(to_path)
+
+def iter_archive(from_path: str, members=None):
+    """Read the files of an archive (zip, tar.gz, tgz, 7z) in one sequential pass, without extracting them.
+    Args:
+        from_path (str): path of the archive
+        members (callable): function selecting the files to be read by their names in the archive. If None, all files are read
+
+    Yields:
+        (name, file) of each selected file, in the order of the archive. 'file' is a binary file object,
+        readable only until the next file is yielded
+    """
+    select = members or (lambda name: True)
+    extenstion = ''.join(Path(from_path).suffixes)
+    if extenstion == '.zip':
+        with zipfile.ZipFile(from_path, 'r') as zfile:
+            # Ordered by position, so that the archive is read sequentially.
+            for zipinfo in sorted(zfile.infolist(), key=lambda zipinfo: zipinfo.header_offset):
+                if not zipinfo.is_dir() and select(zipinfo.filename):
+                    with zfile.open(zipinfo) as file:
+                        yield zipinfo.filename, file
+    elif extenstion == '.tar.gz' or extenstion == '.tgz':
+        # Opened as a stream, which decompresses the archive once, without seeking back.
+        with tarfile.open(from_path, 'r|gz') as tgfile:
+            for tarinfo in tgfile:
+                if tarinfo.isfile() and select(tarinfo.name):
+                    yield tarinfo.name, io.BufferedReader(_StreamReader(tgfile.extractfile(tarinfo)))
+    elif extenstion == '.7z':
+        yield from _iter_7z(from_path, select)
+    else:
+        raise ValueError('archive should be zip, tar.gz, tgz or 7z, not {}'.format(from_path))
+
+class _StreamReader(io.RawIOBase):
+    """Non-seekable view of a file of a tar stream. tarfile's own file objects fail to tell whether they are seekable in stream mode,
+    which 'io.TextIOWrapper' asks.
+    """
+
+    def __init__(self, file):
+        self.file = file
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        return self.file.readinto(b)
+
+_7Z_END = object()
+
+def _iter_7z(from_path: str, select):
+    """Read the files of a 7z archive in one pass. py7zr decompresses in a background thread,
+    writing the data of each file to a bounded queue, from which the yielded file objects read.
+    """
+    import queue
+    import threading
+    import py7zr
+    try:
+        from py7zr.io import Py7zIO, WriterFactory
+    except ImportError:
+        # py7zr<1.0, the only one on Python<3.9, cannot write to file objects of ours.
+        yield from _iter_7z_extracted(from_path, select)
+        return
+
+    chunks = queue.Queue(16)
+    stop = threading.Event()
+
+    class Stopped(Exception):
+        pass
+
+    def put(entry) -> None:
+        while not stop.is_set():
+            try:
+                chunks.put(entry, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+        raise Stopped()
+
+    class QueueWriter(Py7zIO):
+        def __init__(self, filename: str):
+            self.length = 0
+            put((filename, None))
+
+        def write(self, s) -> int:
+            if len(s) > 0:
+                put((None, bytes(s)))
+                self.length += len(s)
+            return len(s)
+
+        def read(self, size=None) -> bytes:
+            return b''
+
+        def seek(self, offset: int, whence: int=0) -> int:
+            return self.length
+
+        def flush(self) -> None:
+            pass
+
+        def size(self) -> int:
+            return self.length
+
+    class QueueWriterFactory(WriterFactory):
+        def create(self, filename: str) -> Py7zIO:
+            return QueueWriter(filename)
+
+    class QueueReader(io.RawIOBase):
+        """Data of a file, until the name of the next file is read from the queue.
+        """
+        def __init__(self):
+            self.buffer, self.next = b'', None
+
+        def readable(self) -> bool:
+            return True
+
+        def readinto(self, b) -> int:
+            while not self.buffer:
+                if self.next is not None:
+                    return 0
+                self._get()
+            size = min(len(b), len(self.buffer))
+            b[:size] = self.buffer[:size]
+            self.buffer = self.buffer[size:]
+            return size
+
+        def skip(self) -> tuple:
+            """Discard the rest of the data, and return the next (name, None) or (_7Z_END, exception).
+            """
+            while self.next is None:
+                self._get()
+            return self.next
+
+        def _get(self) -> None:
+            name, data = chunks.get()
+            if name is None:
+                self.buffer = data
+            else:
+                self.next = (name, data)
+
+    def produce():
+        try:
+            # Opened from a file object, which py7zr decompresses serially, one file after another.
+            # Given a path, it decompresses the folders of the archive in parallel, interleaving their files in the queue.
+            with open(from_path, 'rb') as file, py7zr.SevenZipFile(file, mode='r') as szfile:
+                targets = [fileinfo.filename for fileinfo in szfile.list()
+                           if not fileinfo.is_directory and select(fileinfo.filename)]
+                if targets:
+                    szfile.extract(targets=targets, factory=QueueWriterFactory())
+            put((_7Z_END, None))
+        except Stopped:
+            pass
+        except BaseException as ex:
+            try:
+                put((_7Z_END, ex))
+            except Stopped:
+                pass
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        name, data = chunks.get()
+        while name is not _7Z_END:
+            reader = QueueReader()
+            yield name, io.BufferedReader(reader)
+            name, data = reader.skip()
+        if data is not None:
+            raise data
+    finally:
+        # Let the producer exit if the consumer stops early.
+        stop.set()
+        producer.join()
+
+def _iter_7z_extracted(from_path: str, select):
+    """Read the files of a 7z archive with py7zr<1.0, by extracting them to a temporary directory next to the archive
+    and reading them in the order of the archive. Each file is removed once read.
+    """
+    import tempfile
+    import py7zr
+
+    with tempfile.TemporaryDirectory(dir=str(Path(from_path).parent)) as tmpdir:
+        with open(from_path, 'rb') as file, py7zr.SevenZipFile(file, mode='r') as szfile:
+            targets = [fileinfo.filename for fileinfo in szfile.list()
+                       if not fileinfo.is_directory and select(fileinfo.filename)]
+            if targets:
+                szfile.extract(path=tmpdir, targets=targets)
+        for name in targets:
+            path = Path(tmpdir)/name
+            with open(path, 'rb') as file:
+                yield name, file
+            path.unlink()
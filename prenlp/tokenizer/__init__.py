@@ -1 +1,2 @@
 from .tokenizer import *
+from .moses import *
\ No newline at end of file
@@ -0,0 +1,199 @@
+import re
+from typing import List
+from pathlib import Path
+from functools import lru_cache
+
+from .tokenizer import Tokenizer
+
+MOSES_CHARSETS_PATH = Path(__file__).parent/'moses-charsets.txt'
+NONBREAKING_PREFIXES_DIR = Path(__file__).parent/'nonbreaking_prefixes'
+
+@lru_cache(maxsize=None)
+def load_moses_charsets(from_path: str=MOSES_CHARSETS_PATH) -> dict:
+    """Load the Perl Unicode properties used by the Moses tokenizer, as the contents of regex character classes.
+    Each line holds a property name and ranges of hexadecimal code points.
+    """
+    charsets = {}
+    with open(from_path, 'r', encoding='utf-8') as reader:
+        for line in reader:
+            if line.startswith('#') or not line.strip():
+                continue
+            name, *ranges = line.split()
+            charset = []
+            for first, _, last in (codepoints.partition('-') for codepoints in ranges):
+                charset.append(re.escape(chr(int(first, 16))))
+                if last:
+                    charset.append('-' + re.escape(chr(int(last, 16))))
+            charsets[name] = ''.join(charset)
+
+    return charsets
+
+@lru_cache(maxsize=None)
+def load_nonbreaking_prefixes(lang: str='en') -> tuple:
+    """Load the nonbreaking prefixes of a language, bundled with prenlp.
+    Prefixes which are nonbreaking only before numbers are marked by '#NUMERIC_ONLY#'.
+
+    Returns:
+        (nonbreaking prefixes, numeric only prefixes), as frozensets
+    """
+    path = NONBREAKING_PREFIXES_DIR/'nonbreaking_prefix.{}'.format(lang)
+    if not path.exists():
+        available = sorted(path.suffix[1:] for path in NONBREAKING_PREFIXES_DIR.glob('nonbreaking_prefix.*'))
+        raise ValueError('lang should be one of {}, not {}'.format(', '.join(available), lang))
+
+    with open(path, 'r', encoding='utf-8') as reader:
+        prefixes = [line.strip() for line in reader.read().splitlines() if line.strip() and not line.startswith('#')]
+    numeric_only = [prefix.rpartition(' ')[0] for prefix in prefixes if re.search(r'\s+#NUMERIC_ONLY#', prefix)]
+
+    return frozenset(prefixes), frozenset(numeric_only)
+
+@lru_cache(maxsize=None)
+def _compile_rules() -> dict:
+    charsets = load_moses_charsets()
+    alnum, alpha, number, lower = charsets['IsAlnum'], charsets['IsAlpha'], charsets['IsN'], charsets['IsLower']
+
+    return {
+        'pad_not_alnum': re.compile(r'([^{}\s\.\'\`\,\-])'.format(alnum)),
+        'aggressive_hyphen': (re.compile(r'([{0}])\-(?=[{0}])'.format(alnum)), r'\1 @-@ '),
+        'multidot': (re.compile(r'\.([\.]+)'), r' DOTMULTI\1'),
+        'multidot_next': (re.compile(r'DOTMULTI\.([^\.])'), r'DOTDOTMULTI \1'),
+        'comma': [(re.compile(r'([^{}])[,]'.format(number)), r'\1 , '),
+                  (re.compile(r'[,]([^{}])'.format(number)), r' , \1')],
+        'apostrophe_en': [(re.compile(r"([^{0}])[']([^{0}])".format(alpha)), r"\1 ' \2"),
+                          (re.compile(r"([^{0}{1}])[']([{0}])".format(alpha, number)), r"\1 ' \2"),
+                          (re.compile(r"([{0}])[']([^{0}])".format(alpha)), r"\1 ' \2"),
+                          (re.compile(r"([{0}])[']([{0}])".format(alpha)), r"\1 '\2"),
+                          (re.compile(r"([{}])[']([s])".format(number)), r"\1 '\2")],
+        'apostrophe_fr_it': [(re.compile(r"([^{0}])[']([^{0}])".format(alpha)), r"\1 ' \2"),
+                             (re.compile(r"([^{0}])[']([{0}])".format(alpha)), r"\1 ' \2"),
+                             (re.compile(r"([{0}])[']([^{0}])".format(alpha)), r"\1 ' \2"),
+                             (re.compile(r"([{0}])[']([{0}])".format(alpha)), r"\1' \2")],
+        'alpha': re.compile(r'[{}]+'.format(alpha)),
+        'lower': re.compile(r'[{}]+'.format(lower)),
+    }
+
+# Deletes ASCII control characters, except whitespaces, which are already removed by 'str.split'.
+_ASCII_JUNK = dict.fromkeys(range(0o40))
+_XML_ESCAPES = (('&', '&amp;'), ('|', '&#124;'), ('<', '&lt;'), ('>', '&gt;'), ("'", '&apos;'), ('"', '&quot;'),
+                ('[', '&#91;'), (']', '&#93;'))
+
+class MosesTokenizer(Tokenizer):
+    """Create the Moses Tokenizer, a native port which reproduces the output of the NLTK implementation.
+    All rules are compiled once, the Perl Unicode properties are matched by character classes of code point ranges,
+    and the nonbreaking prefixes are bundled with prenlp, so that no NLTK resource is downloaded.
+    Unlike NLTK, split hyphens are '@-@' and apostrophes of languages other than en, fr and it are "'", without backslashes, as in Moses.
+
+    From:
+        https://github.com/moses-smt/mosesdecoder/blob/master/scripts/tokenizer/tokenizer.perl
+
+    Args:
+        lang (str): language of the nonbreaking prefixes and apostrophe rules, e.g. en, fr, it, de
+        aggressive_dash_splits (bool): whether to split hyphens between alphanumeric characters, e.g. 'foo-bar' -> 'foo @-@ bar'
+        escape (bool): whether to escape XML special characters, e.g. '&' -> '&amp;'
+
+    Examples:
+    >>> tokenizer = prenlp.tokenizer.MosesTokenizer()
+    >>> tokenizer('PreNLP package provides a variety of text preprocessing tools.')
+    ['PreNLP', 'package', 'provides', 'a', 'variety', 'of', 'text', 'preprocessing', 'tools', '.']
+    >>> tokenizer.tokenize("This ain't funny. It's actually hillarious, yet double Ls.")
+    ['This', 'ain', "'t", 'funny', '.', 'It', "'s", 'actually', 'hillarious', ',', 'yet', 'double', 'Ls', '.']
+    """
+
+    def __init__(self, lang: str = 'en', aggressive_dash_splits: bool = False, escape: bool = False):
+        self.lang = lang
+        self.aggressive_dash_splits = aggressive_dash_splits
+        self.escape = escape
+        self.nonbreaking_prefixes, self.numeric_only_prefixes = load_nonbreaking_prefixes(lang)
+        self._rules = _compile_rules()
+
+    def __getstate__(self):
+        return {'lang': self.lang, 'aggressive_dash_splits': self.aggressive_dash_splits, 'escape': self.escape}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def tokenize(self, text: str) -> List[str]:
+        rules = self._rules
+
+        text = ' '.join(text.split())
+        if not text.isprintable():
+            text = text.translate(_ASCII_JUNK).strip()
+
+        # Separate special characters outside of IsAlnum character set.
+        # Joining the pieces split around each character is 'pattern.sub(r' \1 ', text)', without expanding a template per match.
+        text = ' '.join(rules['pad_not_alnum'].split(text))
+        if self.aggressive_dash_splits and '-' in text:
+            pattern, repl = rules['aggressive_hyphen']
+            text = pattern.sub(repl, text)
+
+        # Replace multidots with 'DOTDOTMULTI' literal strings.
+        if '..' in text:
+            pattern, repl = rules['multidot']
+            text = pattern.sub(repl, text)
+        if 'DOTMULTI.' in text:
+            pattern, repl = rules['multidot_next']
+            while 'DOTMULTI.' in text:
+                text = pattern.sub(repl, text)
+                text = text.replace('DOTMULTI.', 'DOTDOTMULTI')
+
+        # Separate out ',' except if within numbers, e.g. 5,300
+        if ',' in text:
+            for pattern, repl in rules['comma']:
+                text = pattern.sub(repl, text)
+
+        # Language-specific apostrophe tokenization.
+        if "'" in text:
+            if self.lang == 'en':
+                for pattern, repl in rules['apostrophe_en']:
+                    text = pattern.sub(repl, text)
+            elif self.lang in ('fr', 'it'):
+                for pattern, repl in rules['apostrophe_fr_it']:
+                    text = pattern.sub(repl, text)
+            else:
+                text = text.replace("'", " ' ")
+
+        tokens = text.split()
+        if '.' in text:
+            tokens = self._handle_nonbreaking_prefixes(tokens)
+
+        # Restore multidots.
+        if 'DOTMULTI' in text:
+            text = ' '.join(tokens)
+            while 'DOTDOTMULTI' in text:
+                text = text.replace('DOTDOTMULTI', 'DOTMULTI.')
+            tokens = text.replace('DOTMULTI', '.').split()
+
+        if self.escape:
+            text = ' '.join(tokens)
+            for char, escaped in _XML_ESCAPES:
+                if char in text:
+                    text = text.replace(char, escaped)
+            tokens = text.split()
+
+        return tokens
+
+    def _handle_nonbreaking_prefixes(self, tokens: List[str]) -> List[str]:
+        """Split the final period of tokens, unless the token is a nonbreaking prefix, e.g. 'Mr.',
+        or is followed by a lowercase word, or is a numeric only prefix followed by a number, e.g. 'No. 1'.
+        """
+        is_alpha, is_lower = self._rules['alpha'].fullmatch, self._rules['lower'].fullmatch
+        nonbreaking_prefixes, numeric_only_prefixes = self.nonbreaking_prefixes, self.numeric_only_prefixes
+
+        num_tokens = len(tokens)
+        split = []
+        for i, token in enumerate(tokens):
+            if len(token) < 2 or token[-1] != '.':
+                split.append(token)
+                continue
+            prefix = token[:-1]
+            if (('.' in prefix and is_alpha(prefix))
+                or (prefix in nonbreaking_prefixes and prefix not in numeric_only_prefixes)
+                or (i != num_tokens-1 and is_lower(tokens[i+1]))):
+                split.append(token)
+            elif prefix in numeric_only_prefixes and i+1 < num_tokens and '0' <= tokens[i+1][0] <= '9':
+                split.append(token)
+            else:
+                split.append(prefix)
+                split.append('.')
+
+        return split
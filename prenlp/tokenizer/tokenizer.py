@@ -1,6 +1,35 @@
+import re
+import sys
 from typing import List
+from itertools import chain
+from pathlib import Path
+from collections import OrderedDict
 
-class NLTKMosesTokenizer:
+from ..utils import imap_ordered, reservoir_sample
+
+class Tokenizer:
+    """Base class of tokenizers. All tokenizers(sub-classes) should inherit and implement 'tokenize'.
+    Tokenizers are picklable by reconstruction, so that they can be sent to worker processes.
+    """
+
+    def __call__(self, text: str) -> List[str]:
+        return self.tokenize(text)
+
+    def tokenize(self, text: str) -> List[str]:
+        raise NotImplementedError
+
+    def tokenize_parallel(self, texts, workers: int = 1, chunksize: int = 1000):
+        """Tokenize texts over a process pool and yield the tokens of each text in input order.
+        The tokenizer is pickled once to each worker, and at most twice as many chunks as workers are in flight,
+        so that memory stays bounded for any corpus size.
+        Args:
+            texts     (iterable): texts to be tokenized
+            workers   (int): number of worker processes. If 1, texts are tokenized in-process
+            chunksize (int): number of texts sent to a worker at once
+        """
+        return imap_ordered(self.tokenize, texts, workers=workers, chunksize=chunksize)
+
+class NLTKMosesTokenizer(Tokenizer):
     """Create the Moses Tokenizer implemented by in NLTK.
 
     From:
@@ -15,21 +44,30 @@ class NLTKMosesTokenizer:
     """
 
     def __init__(self):
+        self.tokenizer = self._load()
+
+    def __getstate__(self):
+        return {}
+
+    def __setstate__(self, state):
+        self.tokenizer = None
+
+    def tokenize(self, text: str) -> List[str]:
+        if self.tokenizer is None:
+            self.tokenizer = self._load()
+        return self.tokenizer.tokenize(text, escape=False)
+
+    @staticmethod
+    def _load():
         try:
             from nltk.tokenize.moses import MosesTokenizer
         except Exception as ex:
             import nltk
             nltk.download('perluniprops')
             nltk.download('nonbreaking_prefixes')
-        self.tokenizer = MosesTokenizer()
-    
-    def __call__(self, text: str) -> List[str]:
-        return self.tokenize(text)
+        return MosesTokenizer()
 
-    def tokenize(self, text: str) -> List[str]:
-        return self.tokenizer.tokenize(text, escape=False)
-
-class Mecab:
+class Mecab(Tokenizer):
     """Create the Mecab morphological analyzer.
 
     From:
@@ -44,6 +82,22 @@ class Mecab:
     """
     
     def __init__(self):
+        self.tokenizer = self._load()
+
+    def __getstate__(self):
+        # The MeCab tagger is a C object. It is re-created in the worker on first use.
+        return {}
+
+    def __setstate__(self, state):
+        self.tokenizer = None
+    
+    def tokenize(self, text: str) -> List[str]:
+        if self.tokenizer is None:
+            self.tokenizer = self._load()
+        return self.tokenizer.morphs(text)
+
+    @staticmethod
+    def _load():
         try:
             from konlpy.tag import Mecab
         except ImportError:
@@ -51,15 +105,9 @@ class Mecab:
                 'Mecab is not installed. '
                 'You can install Mecab with "sh scripts/install_mecab.sh" '
                 'You can refer to the installation guide in https://github.com/lyeoni/prenlp/blob/master/scripts/install_mecab.sh or https://bitbucket.org/eunjeon/mecab-ko-dic/src')
-        self.tokenizer = Mecab()
-    
-    def __call__(self, text: str) -> List[str]:
-        return self.tokenize(text)
-    
-    def tokenize(self, text: str) -> List[str]:
-        return self.tokenizer.morphs(text)
+        return Mecab()
 
-class SentencePiece:
+class SentencePiece(Tokenizer):
     """Create the SentencePiece subword tokenizer.
 
     From:
@@ -87,17 +135,80 @@ class SentencePiece:
         self.sentencepiece = sentencepiece
         self.processor = sentencepiece.SentencePieceProcessor()
 
-    def __call__(self, text: str) -> List[str]:
-        return self.tokenize(text)
+    def __getstate__(self):
+        # The processor is a C++ object. The loaded model is sent as its serialized proto instead.
+        return {'model_proto': self.processor.serialized_model_proto()}
+
+    def __setstate__(self, state):
+        self.__init__()
+        if state['model_proto']:
+            self.processor.LoadFromSerializedProto(state['model_proto'])
     
+    @property
+    def pad_id(self) -> int:
+        """Id of the pad token, or -1 if the model has none.
+        """
+        return self.processor.pad_id()
+
     def tokenize(self, text: str) -> List[str]:
         return self.processor.EncodeAsPieces(text)
     
     def detokenize(self, tokens: List[str]) -> str:
         return self.processor.DecodePieces(tokens)
 
+    def encode_batch(self, texts: List[str], out: str = 'ids', num_threads: int = -1, padding: bool = False):
+        """Encode texts at once with the native batch encoder, which runs on 'num_threads' threads without the GIL.
+        Args:
+            texts       (list): texts to be encoded
+            out         (str): output type. Choose from ids or pieces
+            num_threads (int): number of threads. If -1, all available cores are used
+            padding     (bool): whether to return ids padded with the pad id, instead of ragged ids
+
+        Returns:
+            - out='pieces': list of the pieces of each text
+            - out='ids': (values, offsets) where the ids of texts[i] are values[offsets[i]:offsets[i+1]],
+                         as numpy int32 and int64 arrays
+            - out='ids', padding=True: numpy int32 array of shape (len(texts), the maximum length)
+        """
+        import numpy as np
+
+        if out == 'pieces':
+            return self.processor.encode(texts, out_type=str, num_threads=num_threads)
+        if out != 'ids':
+            raise ValueError('out should be ids or pieces, not {}'.format(out))
+
+        ids = self.processor.encode(texts, out_type=int, num_threads=num_threads)
+        lengths = np.fromiter(map(len, ids), dtype=np.int64, count=len(ids))
+        values = np.fromiter(chain.from_iterable(ids), dtype=np.int32, count=int(lengths.sum()))
+        if not padding:
+            offsets = np.zeros(len(ids)+1, dtype=np.int64)
+            np.cumsum(lengths, out=offsets[1:])
+            return values, offsets
+
+        padded = np.full((len(ids), lengths.max(initial=0)), self.processor.pad_id(), dtype=np.int32)
+        padded[np.arange(padded.shape[1]) < lengths[:, None]] = values
+        return padded
+
+    def decode_batch(self, ids, num_threads: int = -1) -> List[str]:
+        """Decode ids (or pieces) of texts at once with the native batch decoder.
+        Args:
+            ids         : output of 'encode_batch', i.e. (values, offsets), a padded array, or a list of lists of ids or pieces
+            num_threads (int): number of threads. If -1, all available cores are used
+        """
+        import numpy as np
+
+        if isinstance(ids, tuple):
+            values, offsets = ids
+            ids = [values[start:end].tolist() for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+        elif isinstance(ids, np.ndarray):
+            pad_id = self.processor.pad_id()
+            ids = [row[row != pad_id].tolist() for row in ids]
+        if len(ids) == 0:
+            return [] # the native decoder takes an empty list for the ids of a single text, and returns ''
+        return self.processor.decode(ids, num_threads=num_threads)
+
     @classmethod
-    def train(cls, input: str, model_prefix: str, vocab_size: int,
+    def train(cls, input, model_prefix: str, vocab_size: int,
               character_coverage: float = 1.0,
               model_type: str = 'bpe', 
               max_sentence_length :int = 100000,
@@ -109,37 +220,52 @@ class SentencePiece:
               unk_token: str = '[UNK]',
               bos_token: str = '[BOS]',
               eos_token: str = '[EOS]',
-              user_defined_symbols: str = '[SEP],[CLS],[MASK]') -> None:
+              user_defined_symbols: str = '[SEP],[CLS],[MASK]',
+              input_sentence_size: int = 0,
+              shuffle_input_sentence: bool = True,
+              num_threads: int = 16,
+              train_extremely_large_corpus: bool = False,
+              sample_size: int = None,
+              seed: int = None) -> None:
         """Train SentencePiece model.
         Args:
-            input              (str): one-sentence-per-line raw corpus file
+            input              (str, iterable): one-sentence-per-line raw corpus file,
+                                                or an iterable of sentences (e.g. a dataset or a generator), which is streamed to the trainer without an intermediate file
             model_prefix       (str): output model name prefix. <model_prefix>.model and <model_prefix>.vocab are generated
             vocab_size         (int): vocabulary size 
             model_type         (str): model type. Choose from bpe, unigram, char, or word.
                                       The input sentence must be pretokenized when using word type
             character_coverage (float): amount of characters covered by the model, 
                                         good defaults are: 0.9995 for languages with rich character set like Japanse or Chinese and 1.0 for other languages with small character set
+            input_sentence_size          (int): maximum number of sentences the trainer loads. If 0, all sentences are loaded
+            shuffle_input_sentence       (bool): whether to randomly sample 'input_sentence_size' sentences, instead of taking the first ones
+            num_threads                  (int): number of threads for training
+            train_extremely_large_corpus (bool): whether to use 64-bit counters, for corpora with more than about 2 billion characters
+            sample_size                  (int): if given, a uniform random sample of 'sample_size' sentences is drawn from an iterable 'input'
+                                                in one pass (reservoir sampling), so that only the sample is kept in memory
+            seed                         (int): seed of the reservoir sampling
         """
-        template = '--input={} --model_prefix={} --vocab_size={} \
-                   --character_coverage={} \
-                   --model_type={} \
-                   --max_sentence_length={} \
-                   --pad_id={} --pad_piece={} \
-                   --unk_id={} --unk_piece={} \
-                   --bos_id={} --bos_piece={} \
-                   --eos_id={} --eos_piece={} \
-                   --user_defined_symbols={}'
-        cmd = template.format(input, model_prefix, vocab_size,
-                              character_coverage,
-                              model_type,
-                              max_sentence_length,
-                              pad_id, pad_token,
-                              unk_id, unk_token,
-                              bos_id, bos_token,
-                              eos_id, eos_token,
-                              user_defined_symbols)
-
-        cls().sentencepiece.SentencePieceTrainer.train(cmd)
+        kwargs = dict(model_prefix=model_prefix, vocab_size=vocab_size,
+                      character_coverage=character_coverage,
+                      model_type=model_type,
+                      max_sentence_length=max_sentence_length,
+                      pad_id=pad_id, pad_piece=pad_token,
+                      unk_id=unk_id, unk_piece=unk_token,
+                      bos_id=bos_id, bos_piece=bos_token,
+                      eos_id=eos_id, eos_piece=eos_token,
+                      user_defined_symbols=user_defined_symbols,
+                      input_sentence_size=input_sentence_size,
+                      shuffle_input_sentence=shuffle_input_sentence,
+                      num_threads=num_threads,
+                      train_extremely_large_corpus=train_extremely_large_corpus)
+        if isinstance(input, (str, Path)):
+            kwargs['input'] = str(input)
+        else:
+            if sample_size is not None:
+                input = reservoir_sample(input, sample_size, seed=seed)
+            kwargs['sentence_iterator'] = iter(input)
+
+        cls().sentencepiece.SentencePieceTrainer.train(**kwargs)
     
     @classmethod
     def load(cls, model: str) -> 'SentencePiece':
@@ -149,4 +275,89 @@ class SentencePiece:
         """
         sentencepiece = cls()
         sentencepiece.processor.load(model)
-        return sentencepiece
\ No newline at end of file
+        return sentencepiece
+
+class CachedTokenizer(Tokenizer):
+    """Wrap a tokenizer with a bounded LRU cache of tokenized texts, for corpora with many duplicate texts.
+    The least recently used texts are evicted when the cache exceeds 'max_entries' texts or about 'max_bytes' bytes.
+
+    Args:
+        tokenizer           : tokenizer to be wrapped. Any object with 'tokenize' method, e.g. Mecab, NLTKMosesTokenizer
+        max_entries (int)   : maximum number of cached texts. If None, the number is not limited
+        max_bytes   (int)   : maximum size of the cache in bytes, as measured by sys.getsizeof. If None, the size is not limited
+        per_sentence (bool) : whether to split texts into sentences and cache the tokens of each sentence,
+                              so that sentences shared between longer documents hit the cache.
+                              Context-sensitive tokenizers may tokenize the sentence boundaries differently
+    
+    Examples:
+    >>> tokenizer = prenlp.tokenizer.CachedTokenizer(prenlp.tokenizer.Mecab(), max_entries=100000)
+    >>> tokenizer('모든 이야기에는 끝이 있지만, 인생에서의 모든 끝은 새로운 시작을  의미한다.')
+    ['모든', '이야기', '에', '는', '끝', '이', '있', '지만', ',', '인생', '에서', '의', '모든', '끝', '은', '새로운', '시작', '을', '의미', '한다', '.']
+    >>> tokenizer('모든 이야기에는 끝이 있지만, 인생에서의 모든 끝은 새로운 시작을  의미한다.')
+    ['모든', '이야기', '에', '는', '끝', '이', '있', '지만', ',', '인생', '에서', '의', '모든', '끝', '은', '새로운', '시작', '을', '의미', '한다', '.']
+    >>> tokenizer.hits, tokenizer.misses, tokenizer.evictions
+    (1, 1, 0)
+    """
+
+    _SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|\n+')
+
+    def __init__(self, tokenizer, max_entries: int = 100000, max_bytes: int = None, per_sentence: bool = False):
+        self.tokenizer = tokenizer
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.per_sentence = per_sentence
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __getstate__(self):
+        # Cached texts and statistics are not sent to worker processes. Each worker fills its own cache.
+        return {'tokenizer': self.tokenizer, 'max_entries': self.max_entries, 'max_bytes': self.max_bytes,
+                'per_sentence': self.per_sentence}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def tokenize(self, text: str) -> List[str]:
+        if not self.per_sentence:
+            return list(self._tokenize(text))
+
+        tokens = []
+        for sentence in self._SENTENCE_BOUNDARY.split(text):
+            if sentence:
+                tokens += self._tokenize(sentence)
+        return tokens
+
+    def clear(self) -> None:
+        """Remove all cached texts. Statistics are kept.
+        """
+        self._cache.clear()
+        self.nbytes = 0
+
+    def _tokenize(self, text: str) -> tuple:
+        tokens = self._cache.get(text)
+        if tokens is not None:
+            self._cache.move_to_end(text)
+            self.hits += 1
+            return tokens
+
+        self.misses += 1
+        tokens = tuple(self.tokenizer.tokenize(text))
+        self._cache[text] = tokens
+        self.nbytes += self._sizeof(text, tokens)
+        while self._cache and ((self.max_entries is not None and len(self._cache) > self.max_entries)
+                               or (self.max_bytes is not None and self.nbytes > self.max_bytes)):
+            evicted_text, evicted_tokens = self._cache.popitem(last=False)
+            self.nbytes -= self._sizeof(evicted_text, evicted_tokens)
+            self.evictions += 1
+        return tokens
+
+    @staticmethod
+    def _sizeof(text: str, tokens: tuple) -> int:
+        return sys.getsizeof(text) + sys.getsizeof(tokens) + sum(map(sys.getsizeof, tokens))
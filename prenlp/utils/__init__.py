@@ -0,0 +1,3 @@
+from .parallel import *
+from .files import *
+from .sampling import *
\ No newline at end of file
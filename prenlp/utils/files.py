@@ -0,0 +1,39 @@
+import os
+
+def split_file(path: str, n: int) -> list:
+    """Split a file into at most 'n' contiguous byte ranges of about equal size, each starting at the beginning of a line.
+    Args:
+        path (str): file to be split
+        n (int): number of ranges
+
+    Returns:
+        list of (start, end) byte offsets
+    """
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, 'rb') as reader:
+        for i in range(1, n):
+            offset = size * i // n
+            if offset <= bounds[-1]:
+                continue
+            # Move to the beginning of the next line, unless 'offset' is already there.
+            reader.seek(offset - 1)
+            reader.readline()
+            offset = reader.tell()
+            if offset < size:
+                bounds.append(offset)
+    bounds.append(size)
+
+    return [(start, end) for start, end in zip(bounds[:-1], bounds[1:]) if start < end]
+
+def read_lines(path: str, start: int = 0, end: int = None, encoding: str = 'utf-8'):
+    """Yield the lines of a file in the byte range ['start', 'end'), as given by 'split_file'.
+    """
+    with open(path, 'rb') as reader:
+        reader.seek(start)
+        position = start
+        for line in reader:
+            if end is not None and position >= end:
+                break
+            position += len(line)
+            yield line.decode(encoding)
@@ -0,0 +1,129 @@
+from itertools import islice
+from collections import deque
+
+def chunked(iterable, chunksize: int):
+    """Yield lists of 'chunksize' consecutive items from 'iterable'. The last list may be shorter.
+    """
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, chunksize))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunksize))
+
+_worker_fn = None
+
+def _init_worker(fn) -> None:
+    global _worker_fn
+    _worker_fn = fn
+
+def _apply_chunk(chunk: list) -> list:
+    return [_worker_fn(item) for item in chunk]
+
+def imap_ordered(fn, iterable, workers: int=1, chunksize: int=1000, max_pending: int=None):
+    """Apply 'fn' to every item of 'iterable' and return an iterator of the results in input order.
+    With more than one worker, chunks of items are distributed over a process pool,
+    and at most 'max_pending' chunks are in flight at once, so that memory stays bounded for any input length.
+    The pool is started by this call, before 'iterable' is read, so that worker processes are never forked
+    while threads started by the input (e.g. 'prefetch' or an archive reader) are running.
+    It is terminated once the results are exhausted, or when the returned iterator is closed or garbage collected.
+    A sized input fitting in a single chunk is processed in-process, without starting a pool.
+
+    Args:
+        fn (callable): picklable function applied to each item, sent once to each worker
+        iterable (iterable): items to be processed
+        workers (int): number of worker processes. If 1, items are processed in-process
+        chunksize (int): number of items sent to a worker at once
+        max_pending (int): maximum number of chunks in flight. Default is twice the number of workers
+    """
+    if workers <= 1 or (hasattr(iterable, '__len__') and len(iterable) <= chunksize):
+        return map(fn, iterable)
+
+    import multiprocessing
+
+    pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(fn,))
+    return _PoolIterator(pool, _imap_pool(pool, iterable, chunksize, max_pending or 2*workers))
+
+def _imap_pool(pool, iterable, chunksize: int, max_pending: int):
+    pending = deque()
+    for chunk in chunked(iterable, chunksize):
+        pending.append(pool.apply_async(_apply_chunk, (chunk,)))
+        if len(pending) >= max_pending:
+            yield from pending.popleft().get()
+    while pending:
+        yield from pending.popleft().get()
+
+class _PoolIterator:
+    """Iterator of the results of a pool, which terminates the pool when exhausted, closed or garbage collected,
+    even if it was never iterated.
+    """
+    def __init__(self, pool, results):
+        self._pool = pool
+        self._results = results
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._results)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._results.close()
+            self._pool.terminate()
+            self._pool = None
+
+    def __del__(self):
+        self.close()
+
+_PREFETCH_END = object()
+
+def prefetch(iterable, max_prefetch: int=1):
+    """Iterate 'iterable' in a background thread, which runs ahead by at most 'max_prefetch' items,
+    so that producing items (e.g. parsing a file) overlaps with consuming them. Exceptions are re-raised in the consumer.
+
+    Args:
+        iterable (iterable): items to be produced in the background
+        max_prefetch (int): maximum number of items produced but not consumed yet
+    """
+    import queue
+    import threading
+
+    items = queue.Queue(max_prefetch)
+    stop = threading.Event()
+
+    def put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+            put((_PREFETCH_END, None))
+        except BaseException as ex:
+            put((_PREFETCH_END, ex))
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, ex = items.get()
+            if item is _PREFETCH_END:
+                if ex is not None:
+                    raise ex
+                return
+            yield item
+    finally:
+        # Let the producer exit if the consumer stops early.
+        stop.set()
+        producer.join()
@@ -0,0 +1,33 @@
+import math
+import random
+from itertools import islice
+
+def reservoir_sample(iterable, k: int, seed: int = None) -> list:
+    """Draw a uniform random sample of 'k' items from an iterable of unknown length in one pass,
+    keeping only 'k' items in memory (reservoir sampling, Algorithm L).
+    Items between the sampled ones are skipped without drawing a random number for each.
+    If the iterable has 'k' items or less, all of them are returned in order.
+
+    Args:
+        iterable (iterable): items to be sampled
+        k (int): sample size
+        seed (int): seed of the random number generator
+    """
+    rng = random.Random(seed)
+    iterator = iter(iterable)
+    reservoir = list(islice(iterator, k))
+    if len(reservoir) < k or k <= 0:
+        return reservoir
+
+    w = math.exp(math.log(1.0 - rng.random()) / k)
+    while w < 1.0:
+        skip = int(math.log(1.0 - rng.random()) / math.log(1.0 - w))
+        item = next(islice(iterator, skip, None), _EXHAUSTED)
+        if item is _EXHAUSTED:
+            break
+        reservoir[rng.randrange(k)] = item
+        w *= math.exp(math.log(1.0 - rng.random()) / k)
+
+    return reservoir
+
+_EXHAUSTED = object()
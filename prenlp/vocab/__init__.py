@@ -0,0 +1,2 @@
+from .vocab import *
+from .counter import *
\ No newline at end of file
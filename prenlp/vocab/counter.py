@@ -0,0 +1,75 @@
+import heapq
+from collections import Counter
+
+class HeavyHitters:
+    """Count tokens approximately in bounded memory, keeping only the most frequent ones (Misra-Gries summary).
+    When more than 2 * 'capacity' tokens are counted, the (capacity+1)-th largest count is subtracted from all counts
+    and tokens whose counts drop to zero are removed, so that at most 'capacity' tokens survive each reduction.
+
+    Counts are never overestimated, and each count is underestimated by at most 'error',
+    which is itself at most total / (capacity+1). Any token occurring more than 'error' times is kept.
+    Summaries of disjoint streams can be merged, and the errors add up.
+
+    Args:
+        capacity (int): number of tokens kept after each reduction
+
+    Examples:
+    >>> counter = prenlp.vocab.HeavyHitters(capacity=100000)
+    >>> counter.update(tokens)
+    >>> counter.most_common(10)
+    >>> counter.error, counter.bound
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError('capacity should be positive, not {}'.format(capacity))
+        self.capacity = capacity
+        self.counts = Counter()
+        self.total = 0
+        self.error = 0
+
+    def __len__(self):
+        return len(self.counts)
+
+    @property
+    def bound(self) -> float:
+        """Worst-case underestimation of a count, total / (capacity+1).
+        """
+        return self.total / (self.capacity + 1)
+
+    def update(self, tokens) -> None:
+        """Count tokens in an iterable.
+        """
+        if not isinstance(tokens, (list, tuple)):
+            tokens = list(tokens)
+        self.counts.update(tokens)
+        self.total += len(tokens)
+        if len(self.counts) > 2*self.capacity:
+            self._reduce()
+
+    def merge(self, other: 'HeavyHitters') -> None:
+        """Add the counts of the summary of another stream.
+        """
+        self.counts.update(other.counts)
+        self.total += other.total
+        self.error += other.error
+        if len(self.counts) > 2*self.capacity:
+            self._reduce()
+
+    def most_common(self, n: int = None) -> list:
+        return self.counts.most_common(n)
+
+    def report(self) -> dict:
+        """Summary of the accuracy of the counts.
+        """
+        return {'total': self.total,
+                'tokens': len(self.counts),
+                'capacity': self.capacity,
+                'error': self.error,
+                'bound': self.bound}
+
+    def _reduce(self) -> None:
+        counts = self.counts
+        decrement = heapq.nlargest(self.capacity+1, counts.values())[-1]
+        self.counts = Counter({token: count-decrement for token, count in counts.items() if count > decrement})
+        self.error += decrement
@@ -0,0 +1,200 @@
+from typing import List
+from itertools import chain, repeat
+from functools import partial
+from collections import Counter, OrderedDict
+
+from .counter import HeavyHitters
+from ..utils import imap_ordered, split_file, read_lines
+
+class Vocab:
+    """Defines a vocabulary object that will be used to numericalize text.
+    Tokens are mapped to ids with a dict, and ids are mapped back to tokens with a dense array,
+    so that a whole batch is converted at once instead of token by token.
+
+    Args:
+        vocab_size (int)    : the maximum size of the vocabulary
+        pad_token  (str)    : token that indicates 'padding'
+        unk_token  (str)    : token that indicates 'unknown word'
+        bos_token  (str)    : token that indicates 'beginning of sentence'
+        eos_token  (str)    : token that indicates 'end of sentence'
+
+    Examples:
+    >>> vocab = prenlp.vocab.Vocab.load('wikitext103.vocab')
+    >>> vocab.encode(['Time', 'is', 'the', 'most', 'valuable', 'thing', 'a', 'man', 'can', 'spend', '.'])
+    array([ 1712,    26,     4,   113,  4329,   747,    10,   204,    76, 11385,     6], dtype=int32)
+    >>> values, offsets = vocab.encode_batch(tokenized_texts)
+    >>> ids = vocab.encode_batch(tokenized_texts, padding=True)
+    >>> vocab.decode_batch(ids)
+    """
+
+    def __init__(self, vocab_size: int = 16000, pad_token: str = '[PAD]', unk_token: str = '[UNK]',
+                 bos_token: str = '[BOS]', eos_token: str = '[EOS]'):
+        self.vocab_size = vocab_size
+        self.pad_token = pad_token
+        self.unk_token = unk_token
+        self.bos_token = bos_token
+        self.eos_token = eos_token
+        self.special_tokens = [pad_token, unk_token, bos_token, eos_token]
+        self.freqs = Counter()
+        self.vocab = OrderedDict()
+        self._itos = None
+
+        # Initialize vocabulary with special tokens
+        for special_token in self.special_tokens:
+            self.vocab[special_token] = len(self.vocab)
+
+    def __len__(self):
+        return len(self.vocab)
+
+    def __contains__(self, token: str) -> bool:
+        return token in self.vocab
+
+    @property
+    def pad_id(self) -> int:
+        return self.vocab[self.pad_token]
+
+    @property
+    def unk_id(self) -> int:
+        return self.vocab[self.unk_token]
+
+    @property
+    def itos(self):
+        """Dense numpy array of tokens, indexed by id.
+        """
+        if self._itos is None or len(self._itos) != len(self.vocab):
+            import numpy as np
+
+            itos = np.empty(len(self.vocab), dtype=object)
+            itos[list(self.vocab.values())] = list(self.vocab.keys())
+            self._itos = itos
+        return self._itos
+
+    def build(self, corpus, tokenizer, max_sentence_length=100000, min_freq: int = 1, workers: int = 1,
+              max_entries: int = None) -> dict:
+        """Build vocabulary with given corpus and tokenizer.
+        The corpus is streamed line by line. With more than one worker, it is split into byte ranges
+        which are counted in worker processes, and the counts are merged.
+        Args:
+            corpus              (str): one-sentence-per-line corpus file
+            tokenizer           : tokenizer with 'tokenize' method. It should be picklable when workers > 1
+            max_sentence_length (int): lines longer than this are truncated
+            min_freq            (int): minimum frequency of a token in the vocabulary
+            workers             (int): number of worker processes
+            max_entries         (int): if given, tokens are counted approximately in bounded memory,
+                                       keeping about 'max_entries' most frequent tokens per worker (see HeavyHitters)
+
+        Returns:
+            report of the counts. 'error' is the maximum underestimation of a frequency, 0 when counted exactly
+        """
+        count = partial(_count_lines, corpus, tokenizer, max_sentence_length, max_entries)
+        freqs = Counter() if max_entries is None else HeavyHitters(max_entries)
+        for counts in imap_ordered(count, split_file(corpus, workers), workers=workers, chunksize=1):
+            if max_entries is None:
+                freqs.update(counts)
+            else:
+                freqs.merge(counts)
+
+        if max_entries is None:
+            report = {'total': sum(freqs.values()), 'tokens': len(freqs), 'capacity': None, 'error': 0, 'bound': 0}
+        else:
+            report = freqs.report()
+            freqs = freqs.counts
+        self.freqs.update(freqs)
+
+        for token, freq in self.freqs.most_common():
+            if len(self.vocab) >= self.vocab_size or freq < min_freq:
+                break
+            if token not in self.vocab:
+                self.vocab[token] = len(self.vocab)
+
+        return report
+
+    def save(self, path, postfix='.vocab'):
+        """Save vocabulary.
+        """
+        with open(path+postfix, 'w', encoding='utf-8') as writer:
+            for token, id in self.vocab.items():
+                writer.write('{token}\t{id}\n'.format(token=token, id=id))
+
+    @classmethod
+    def load(cls, path: str, pad_token: str = '[PAD]', unk_token: str = '[UNK]',
+             bos_token: str = '[BOS]', eos_token: str = '[EOS]') -> 'Vocab':
+        """Load the vocabulary saved by 'save'.
+        Args:
+            path (str): vocabulary file, one 'token<tab>id' per line
+        """
+        vocab = cls(pad_token=pad_token, unk_token=unk_token, bos_token=bos_token, eos_token=eos_token)
+        vocab.vocab = OrderedDict()
+        with open(path, 'r', encoding='utf-8') as reader:
+            for line in reader:
+                token, id = line.rstrip('\n').rsplit('\t', 1)
+                vocab.vocab[token] = int(id)
+
+        for special_token in vocab.special_tokens:
+            if special_token not in vocab.vocab:
+                raise ValueError('special token {} is not in {}'.format(special_token, path))
+        vocab.vocab_size = len(vocab.vocab)
+        return vocab
+
+    def encode(self, tokens: List[str]):
+        """Convert tokens to a numpy int32 array of ids. Unknown tokens are mapped to the unk id.
+        """
+        import numpy as np
+
+        return np.fromiter(map(self.vocab.get, tokens, repeat(self.unk_id)), dtype=np.int32, count=len(tokens))
+
+    def encode_batch(self, batch: List[List[str]], padding: bool = False):
+        """Convert tokens of texts to ids at once. Unknown tokens are mapped to the unk id.
+        Args:
+            batch   (list): list of tokens of each text
+            padding (bool): whether to return ids padded with the pad id, instead of ragged ids
+
+        Returns:
+            - padding=False: (values, offsets) where the ids of batch[i] are values[offsets[i]:offsets[i+1]],
+                             as numpy int32 and int64 arrays
+            - padding=True: numpy int32 array of shape (len(batch), the maximum length)
+        """
+        import numpy as np
+
+        lengths = np.fromiter(map(len, batch), dtype=np.int64, count=len(batch))
+        values = np.fromiter(map(self.vocab.get, chain.from_iterable(batch), repeat(self.unk_id)),
+                             dtype=np.int32, count=int(lengths.sum()))
+        if not padding:
+            offsets = np.zeros(len(batch)+1, dtype=np.int64)
+            np.cumsum(lengths, out=offsets[1:])
+            return values, offsets
+
+        padded = np.full((len(batch), lengths.max(initial=0)), self.pad_id, dtype=np.int32)
+        padded[np.arange(padded.shape[1]) < lengths[:, None]] = values
+        return padded
+
+    def decode(self, ids) -> List[str]:
+        """Convert ids (list or numpy array) to tokens.
+        """
+        return self.itos[ids].tolist()
+
+    def decode_batch(self, ids) -> List[List[str]]:
+        """Convert ids of texts to tokens at once.
+        Args:
+            ids : output of 'encode_batch', i.e. (values, offsets), a padded array whose pad ids are removed, or a list of lists of ids
+        """
+        import numpy as np
+
+        if isinstance(ids, tuple):
+            values, offsets = ids
+            tokens = self.itos[values].tolist()
+            return [tokens[start:end] for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+        if isinstance(ids, np.ndarray):
+            tokens = self.itos[ids]
+            mask = ids != self.pad_id
+            return [row[row_mask].tolist() for row, row_mask in zip(tokens, mask)]
+        return [self.itos[row].tolist() if len(row) else [] for row in ids]
+
+def _count_lines(corpus: str, tokenizer, max_sentence_length: int, max_entries: int, byte_range: tuple):
+    freqs = Counter() if max_entries is None else HeavyHitters(max_entries)
+    for line in read_lines(corpus, *byte_range):
+        if len(line) >= max_sentence_length:
+            line = line[:max_sentence_length]
+        freqs.update(tokenizer.tokenize(line.strip()))
+
+    return freqs
@@ -17,9 +17,12 @@ setuptools.setup(
     install_requires                = [
         'nltk==3.2.5', 'konlpy', 'sentencepiece',   # Tokenizer
         'fasttext',                                 # Model
-        'ijson', 'py7zr==0.5b5'                     # Utils
+        'numpy', 'ijson',                           # Utils
+        'py7zr>=1.0; python_version >= "3.9"',      # streaming 7z reads, else extracted to a temporary directory
+        'py7zr; python_version < "3.9"'
     ],
-    package_data                    = {},
+    package_data                    = {'prenlp.data': ['emoji-sequences.txt'],
+                                       'prenlp.tokenizer': ['moses-charsets.txt', 'nonbreaking_prefixes/*']},
     keywords                        = [
         'nlp',
         'text-preprocessing'
@@ -0,0 +1,58 @@
+import io
+import os
+import zipfile
+import tarfile
+
+import pytest
+
+from prenlp.data.utils import iter_archive
+
+# Large enough to be decompressed in several chunks, and distinct for every file.
+FILES = {'data/a.txt': b''.join(b'a%07d\n' % i for i in range(100000)),
+         'data/b.txt': b''.join(b'b%07d\n' % i for i in range(100000)),
+         'data/c.txt': b'c\n',
+         'data/d.txt': b''}
+
+def read_archive(path, members=None) -> dict:
+    return {name: file.read() for name, file in iter_archive(str(path), members=members)}
+
+def test_iter_zip(tmp_path):
+    path = tmp_path/'data.zip'
+    with zipfile.ZipFile(str(path), 'w', compression=zipfile.ZIP_DEFLATED) as zfile:
+        for name, data in FILES.items():
+            zfile.writestr(name, data)
+    assert read_archive(path) == FILES
+    assert read_archive(path, members=lambda name: name.endswith('b.txt')) == {'data/b.txt': FILES['data/b.txt']}
+
+def test_iter_tar_gz(tmp_path):
+    path = tmp_path/'data.tar.gz'
+    with tarfile.open(str(path), 'w:gz') as tgfile:
+        for name, data in FILES.items():
+            tarinfo = tarfile.TarInfo(name)
+            tarinfo.size = len(data)
+            tgfile.addfile(tarinfo, io.BytesIO(data))
+    assert read_archive(path) == FILES
+    assert read_archive(path, members=lambda name: name.endswith('b.txt')) == {'data/b.txt': FILES['data/b.txt']}
+
+def test_iter_7z_multiple_folders(tmp_path, monkeypatch):
+    py7zr = pytest.importorskip('py7zr')
+
+    path = tmp_path/'data.7z'
+    names = sorted(FILES)
+    # Each write appending to the archive compresses its files in a folder of their own.
+    for i, name in enumerate(names):
+        with py7zr.SevenZipFile(str(path), mode='w' if i == 0 else 'a') as szfile:
+            szfile.writestr(FILES[name], name)
+    with py7zr.SevenZipFile(str(path), mode='r') as szfile:
+        assert len(szfile.header.main_streams.unpackinfo.folders) > 1
+
+    # Folders would be decompressed by several threads at once.
+    monkeypatch.setattr(os, 'cpu_count', lambda: 4)
+    assert read_archive(path) == FILES
+    assert read_archive(path, members=lambda name: name.endswith('b.txt')) == {'data/b.txt': FILES['data/b.txt']}
+
+    # Stopping early lets the reader thread exit.
+    for name, file in iter_archive(str(path)):
+        assert file.read(8) == FILES[name][:8]
+        break
+    assert os.listdir(str(tmp_path)) == ['data.7z']
@@ -0,0 +1,82 @@
+import random
+from collections import Counter
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from prenlp.data.batching import bucket_batches, _cut
+
+def generate_samples(n_samples: int, seed: int=0) -> list:
+    rng = random.Random(seed)
+    return [([rng.randrange(1, 100) for _ in range(rng.choice([0, 1, 2, 5, 17, 40, 120]) + rng.randrange(3))], i)
+            for i in range(n_samples)]
+
+def unpad(batch) -> list:
+    return [(row[row_mask].tolist(), label) for row, row_mask, label in zip(batch.ids, batch.mask, batch.labels)]
+
+@pytest.mark.parametrize('shuffle', [False, True])
+def test_bucket_batches_mask_matches_lengths(shuffle):
+    samples = generate_samples(1000)
+    batches = list(bucket_batches(samples, max_tokens=256, pad_id=0, window_size=300, shuffle=shuffle, seed=0))
+    for batch in batches:
+        assert batch.ids.dtype == np.int32 and batch.mask.dtype == bool
+        assert batch.ids.shape == batch.mask.shape
+        lengths = [len(samples[label][0]) for label in batch.labels]
+        assert batch.mask.sum(axis=1).tolist() == lengths
+        assert batch.mask.shape[1] == max(lengths)
+        # Masks are prefixes, and padding is the pad id.
+        assert (batch.mask == (np.arange(batch.mask.shape[1]) < np.array(lengths)[:, None])).all()
+        assert (batch.ids[~batch.mask] == 0).all()
+    assert sorted(sample for batch in batches for sample in unpad(batch)) == sorted(samples)
+
+@pytest.mark.parametrize('max_batch_size', [None, 8])
+def test_bucket_batches_respect_bounds(max_batch_size):
+    samples = generate_samples(1000, seed=1)
+    window_size = 250
+    batches = list(bucket_batches(samples, max_tokens=256, pad_id=3, window_size=window_size,
+                                  max_batch_size=max_batch_size, shuffle=False))
+    for batch in batches:
+        n_samples, length = batch.ids.shape
+        assert n_samples * length <= 256 or n_samples == 1
+        assert max_batch_size is None or n_samples <= max_batch_size
+        assert (batch.ids[~batch.mask] == 3).all()
+
+    # Without shuffling, the batches of a window are cut from its samples sorted by length, in order.
+    seen = 0
+    for batch in batches:
+        labels = batch.labels
+        assert labels and {label // window_size for label in labels} == {seen // window_size}
+        seen += len(labels)
+    for previous, batch in zip(batches, batches[1:]):
+        if previous.labels[0] // window_size == batch.labels[0] // window_size:
+            assert previous.mask.sum(axis=1).max() <= batch.mask.sum(axis=1).min()
+
+def test_bucket_batches_truncate_and_batch_long_samples_alone():
+    samples = [[1] * 10, [2] * 300, [3] * 50, [4] * 3]
+    batches = list(bucket_batches(samples, max_tokens=100, shuffle=False))
+    assert [batch.ids.shape for batch in batches] == [(2, 10), (1, 50), (1, 300)]
+    assert all(batch.labels is None for batch in batches)
+
+    batches = list(bucket_batches(samples, max_tokens=100, max_length=40, shuffle=False))
+    assert [batch.ids.shape for batch in batches] == [(2, 10), (2, 40)]
+    assert batches[1].ids.tolist() == [[2] * 40, [3] * 40]
+    assert batches[1].mask.all()
+
+def test_cut():
+    window = [([0] * length, None) for length in [1, 2, 2, 3, 5, 9, 30]]
+    cut = [[len(ids) for ids, _ in batch] for batch in _cut(window, max_tokens=10, max_batch_size=None)]
+    assert cut == [[1, 2, 2], [3, 5], [9], [30]]
+    cut = [[len(ids) for ids, _ in batch] for batch in _cut(window, max_tokens=10, max_batch_size=2)]
+    assert cut == [[1, 2], [2, 3], [5], [9], [30]]
+    assert list(_cut([], max_tokens=10, max_batch_size=None)) == []
+
+def test_bucket_batches_pad_id():
+    class Vocab:
+        pad_id = 7
+
+    batch = next(bucket_batches([([1, 2], 'a'), ([3], 'b')], max_tokens=100, pad_id=Vocab(), shuffle=False))
+    assert batch.ids.tolist() == [[3, 7], [1, 2]]
+    assert Counter(batch.labels) == Counter(['a', 'b'])
+    with pytest.raises(ValueError):
+        next(bucket_batches([[1]], max_tokens=100, pad_id=-1))
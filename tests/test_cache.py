@@ -0,0 +1,70 @@
+import os
+import sys
+import subprocess
+from functools import partial
+
+import pytest
+
+from prenlp.data import Normalizer, NamuMarkupNormalizer, WikiTextKo
+from prenlp.data.cache import fingerprint
+
+def add(x: int, y: int=1) -> int:
+    return x + y
+
+def multiplier(k: int):
+    def multiply(x: int) -> int:
+        return x * k
+    return multiply
+
+def define(source: str):
+    namespace = {}
+    exec(source, namespace)
+    return namespace['f']
+
+def test_fingerprint_is_stable_across_processes():
+    code = ('from functools import partial\n'
+            'from prenlp.data import Normalizer\n'
+            'from prenlp.data.cache import fingerprint\n'
+            'from test_cache import add\n'
+            'print(fingerprint([partial(add, y=2), Normalizer().normalize, str.strip, {"a", "b"}]))')
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.dirname(__file__), os.getcwd()]))
+    fingerprints = {subprocess.check_output([sys.executable, '-c', code], env=dict(env, PYTHONHASHSEED=str(seed))).strip()
+                    for seed in range(3)}
+    assert len(fingerprints) == 1
+
+def test_fingerprint_functions_by_code():
+    assert fingerprint(lambda x: x + 1) != fingerprint(lambda x: x + 2)
+    assert fingerprint(define('def f(x): return x + 1')) == fingerprint(define('def f(x): return x + 1'))
+    assert fingerprint(define('def f(x): return x + 1')) != fingerprint(define('def f(x): return x - 1'))
+    assert fingerprint(define('def f(x, y=1): return x + y')) != fingerprint(define('def f(x, y=2): return x + y'))
+    assert fingerprint(multiplier(2)) == fingerprint(multiplier(2))
+    assert fingerprint(multiplier(2)) != fingerprint(multiplier(3))
+
+def test_fingerprint_partials_and_methods():
+    assert fingerprint(partial(add, y=2)) == fingerprint(partial(add, y=2))
+    assert fingerprint(partial(add, y=2)) != fingerprint(partial(add, y=3))
+    assert fingerprint(Normalizer().normalize) == fingerprint(Normalizer().normalize)
+    assert fingerprint(Normalizer().normalize) != fingerprint(Normalizer(url_repl='[URL]').normalize)
+    assert fingerprint(NamuMarkupNormalizer()) != fingerprint(NamuMarkupNormalizer(' '))
+
+def test_fingerprint_cycles(tmp_path):
+    items = [1]
+    items.append(items)
+    assert fingerprint(items) == fingerprint(items)
+
+    # The samples of a streaming dataset are generated by a bound method of the dataset.
+    (tmp_path/'wikitext-ko').mkdir()
+    key = fingerprint(WikiTextKo(root=str(tmp_path), streaming=True))
+    assert key == fingerprint(WikiTextKo(root=str(tmp_path), streaming=True))
+    assert key != fingerprint(WikiTextKo(root=str(tmp_path), streaming=True, offset=10))
+
+    archive_path = tmp_path/'kowiki-latest-pages-articles.xml.bz2'
+    archive_path.write_bytes(b'dump')
+    assert key != fingerprint(WikiTextKo(root=str(tmp_path), streaming=True))
+
+def test_fingerprint_requires_state():
+    class Slotted:
+        __slots__ = ('value',)
+
+    with pytest.raises(TypeError):
+        fingerprint(Slotted())
@@ -0,0 +1,110 @@
+import os
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from prenlp.data import ExactDeduplicator, MinHashLSH
+
+WORDS = ['time', 'is', 'the', 'most', 'valuable', 'thing', 'a', 'man', 'can', 'spend', '영화', '진짜', '더빙', 'river',
+         'bank', 'quick', 'brown', 'fox', 'lazy', 'dog', 'over', 'near', 'jumps', 'sentence', 'piece', 'token']
+
+def generate_texts(n_texts: int, n_distinct: int, seed: int=0) -> list:
+    rng = random.Random(seed)
+    distinct = [' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 6))) + str(i) for i in range(n_distinct)]
+    return [rng.choice(distinct) for _ in range(n_texts)]
+
+def first_occurrences(texts: list) -> list:
+    seen = set()
+    return [text for text in texts if not (text in seen or seen.add(text))]
+
+@pytest.mark.parametrize('chunksize', [1, 7, 10000])
+def test_exact_deduplicator(chunksize):
+    texts = generate_texts(5000, 1200)
+    dedup = ExactDeduplicator(chunksize=chunksize)
+    assert list(dedup(texts)) == first_occurrences(texts)
+    assert dedup.report() == {'texts': 5000, 'removed': 5000 - len(set(texts)), 'unique': len(set(texts)), 'spilled': 0}
+
+    # Texts seen by a previous call are removed.
+    assert list(dedup(texts[:100] + ['new'])) == ['new']
+
+def test_exact_deduplicator_key():
+    samples = [(text, i) for i, text in enumerate(generate_texts(1000, 300))]
+    dedup = ExactDeduplicator(chunksize=64, key=lambda sample: sample[0])
+    kept = list(dedup(samples))
+    assert [text for text, _ in kept] == first_occurrences([text for text, _ in samples])
+    assert all(samples[i] == (text, i) for text, i in kept)
+
+def test_exact_deduplicator_spills(tmp_path):
+    texts = generate_texts(20000, 5000, seed=1)
+    # 50 hashes in memory at most
+    dedup = ExactDeduplicator(max_bytes=8*50, spill_dir=str(tmp_path/'spill'), chunksize=100)
+    assert list(dedup(texts)) == first_occurrences(texts)
+    report = dedup.report()
+    assert report['unique'] == len(set(texts))
+    assert 0 < report['spilled'] <= report['unique']
+    assert len(os.listdir(str(tmp_path/'spill'))) > 1
+
+    dedup.clear()
+    assert os.listdir(str(tmp_path/'spill')) == []
+    assert list(dedup(texts[:3])) == first_occurrences(texts[:3])
+
+    # Without a spill directory, a temporary one is removed with the hashes.
+    dedup = ExactDeduplicator(max_bytes=8*50, chunksize=100)
+    assert list(dedup(texts)) == first_occurrences(texts)
+    spill_dir = dedup._tmp_dir.name
+    assert os.listdir(spill_dir)
+    dedup.clear()
+    assert not os.path.exists(spill_dir)
+
+def generate_documents(n_documents: int, n_words: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [' '.join(rng.choice(WORDS) + str(rng.randrange(1000)) for _ in range(n_words)) for _ in range(n_documents)]
+
+def near_duplicate(document: str, rng: random.Random) -> str:
+    words = document.split()
+    words[rng.randrange(len(words))] = 'changed'
+    return ' '.join(words)
+
+def test_minhash_lsh_finds_near_duplicates():
+    rng = random.Random(0)
+    originals = generate_documents(200, 60, seed=1)
+    copies = [near_duplicate(document, rng) for document in originals[:50]]
+    documents = originals + copies + [originals[3]]
+
+    lsh = MinHashLSH(num_perm=128, bands=16, threshold=0.8)
+    signatures = lsh.signatures(documents)
+    assert signatures.shape == (251, 128) and signatures.dtype == np.uint32
+    duplicates = lsh.duplicates(signatures)
+    assert duplicates.tolist() == [False] * 200 + [True] * 51
+    report = lsh.report()
+    assert report['documents'] == 251 and report['removed'] == 51
+    assert report['candidates'] >= 51
+
+def test_minhash_lsh_keeps_unrelated_documents():
+    documents = generate_documents(500, 40, seed=2) + ['short', 'shorter', '', 'a']
+    lsh = MinHashLSH(num_perm=64, bands=8)
+    signatures = lsh.signatures(documents)
+    assert not lsh.duplicates(signatures).any()
+    assert lsh.report()['removed'] == 0
+
+def test_minhash_signature_similarity():
+    rng = random.Random(3)
+    lsh = MinHashLSH(num_perm=256, bands=16, ngram=5)
+    document = generate_documents(1, 80, seed=4)[0]
+    shingles = lambda text: {text[i:i+5] for i in range(len(text) - 4)}
+    for _ in range(5):
+        other = near_duplicate(near_duplicate(document, rng), rng)
+        jaccard = len(shingles(document) & shingles(other)) / len(shingles(document) | shingles(other))
+        agreement = (lsh.signature(document) == lsh.signature(other)).mean()
+        assert abs(agreement - jaccard) < 0.1
+
+def test_minhash_signatures_in_parallel():
+    documents = generate_documents(600, 20, seed=5)
+    lsh = MinHashLSH(num_perm=32, bands=4)
+    assert (lsh.signatures(documents, workers=2, chunksize=50) == lsh.signatures(documents)).all()
+    assert lsh.signatures([]).shape == (0, 32)
+
+    with pytest.raises(ValueError):
+        MinHashLSH(num_perm=100, bands=16)
@@ -0,0 +1,107 @@
+import hashlib
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+
+import pytest
+
+pytest.importorskip('requests')
+
+from prenlp.data.utils import download_from_url
+
+DATA = bytes(range(256)) * 40
+SHA256 = hashlib.sha256(DATA).hexdigest()
+
+class Handler(BaseHTTPRequestHandler):
+    """Serve DATA, honoring 'Range: bytes=<start>-' if 'server.ranges' is set.
+    The first 'server.drops' responses are cut after 'server.drop_after' bytes, closing the connection.
+    """
+    def do_GET(self):
+        self.server.requests.append(self.headers.get('Range'))
+        start = 0
+        if self.server.ranges and self.headers.get('Range'):
+            start = int(self.headers['Range'][len('bytes='):].rstrip('-'))
+        if start >= len(DATA) and start > 0:
+            self.send_response(416)
+            self.send_header('Content-Range', 'bytes */{}'.format(len(DATA)))
+            self.end_headers()
+            return
+
+        self.send_response(206 if start > 0 else 200)
+        if start > 0:
+            self.send_header('Content-Range', 'bytes {}-{}/{}'.format(start, len(DATA)-1, len(DATA)))
+        self.send_header('Content-Length', str(len(DATA)-start))
+        self.end_headers()
+        if self.server.drops > 0:
+            self.server.drops -= 1
+            self.wfile.write(DATA[start:start+self.server.drop_after])
+            return
+        self.wfile.write(DATA[start:])
+
+    def log_message(self, format, *args):
+        pass
+
+class Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+@pytest.fixture
+def server():
+    server = Server(('127.0.0.1', 0), Handler)
+    server.requests, server.ranges, server.drops, server.drop_after = [], True, 0, 0
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    server.url = 'http://127.0.0.1:{}/data.bin'.format(server.server_address[1])
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def test_download(server, tmp_path):
+    progress = []
+    path = download_from_url(server.url, 'data.bin', tmp_path, sha256=SHA256, chunk_size=1000,
+                             progress=lambda downloaded, total, speed: progress.append((downloaded, total)))
+    assert path.read_bytes() == DATA
+    assert progress[-1] == (len(DATA), len(DATA))
+    assert not (tmp_path/'data.bin.part').exists()
+
+    # A file with the expected digest is not downloaded again.
+    download_from_url(server.url, 'data.bin', tmp_path, sha256=SHA256)
+    assert server.requests == [None]
+
+def test_download_resumes_on_retry(server, tmp_path):
+    server.drops, server.drop_after = 2, 3000
+    path = download_from_url(server.url, 'data.bin', tmp_path, sha256=SHA256, chunk_size=1000, retries=2)
+    assert path.read_bytes() == DATA
+    assert server.requests == [None, 'bytes=3000-', 'bytes=6000-']
+
+def test_download_resumes_on_next_call(server, tmp_path):
+    import requests
+
+    server.drops, server.drop_after = 1, 4000
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        download_from_url(server.url, 'data.bin', tmp_path, sha256=SHA256, chunk_size=1000, retries=0)
+    assert (tmp_path/'data.bin.part').read_bytes() == DATA[:4000]
+    assert not (tmp_path/'data.bin').exists()
+
+    path = download_from_url(server.url, 'data.bin', tmp_path, sha256=SHA256, chunk_size=1000, retries=0)
+    assert path.read_bytes() == DATA
+    assert server.requests == [None, 'bytes=4000-']
+
+def test_download_starts_over_without_range_support(server, tmp_path):
+    server.ranges, server.drops, server.drop_after = False, 1, 5000
+    path = download_from_url(server.url, 'data.bin', tmp_path, sha256=SHA256, chunk_size=1000, retries=1)
+    assert path.read_bytes() == DATA
+    assert server.requests == [None, 'bytes=5000-']
+
+def test_download_completes_complete_part(server, tmp_path):
+    (tmp_path/'data.bin.part').write_bytes(DATA)
+    path = download_from_url(server.url, 'data.bin', tmp_path, sha256=SHA256)
+    assert path.read_bytes() == DATA
+    assert server.requests == ['bytes={}-'.format(len(DATA))]
+
+def test_download_checksum_mismatch(server, tmp_path):
+    server.drops, server.drop_after = 1, 2000
+    with pytest.raises(ValueError):
+        download_from_url(server.url, 'data.bin', tmp_path, sha256='0'*64, chunk_size=1000, retries=1)
+    assert server.requests == [None, 'bytes=2000-']
+    assert not (tmp_path/'data.bin').exists()
+    assert not (tmp_path/'data.bin.part').exists()
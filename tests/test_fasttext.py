@@ -0,0 +1,25 @@
+import bz2
+import gzip
+import lzma
+
+import pytest
+
+from prenlp.data import fasttext_transform
+
+SAMPLES = [('text number {} '.format(i) * (i % 7 + 1), i % 3) for i in range(25003)]
+
+LINES = ['__label__{} {}\n'.format(label, text.strip()) for text, label in SAMPLES]
+
+DECOMPRESS = {'': bytes, '.gz': gzip.decompress, '.bz2': bz2.decompress, '.xz': lzma.decompress}
+
+@pytest.mark.parametrize('compression', sorted(DECOMPRESS))
+def test_output_does_not_depend_on_workers_nor_chunksize(tmp_path, compression):
+    outputs = set()
+    for workers, chunksize in [(1, 1000), (1, 25003), (2, 777), (2, 20000)]:
+        paths = fasttext_transform(SAMPLES, str(tmp_path/('train.txt'+compression)), workers=workers,
+                                   chunksize=chunksize, num_shards=2)
+        outputs.add(tuple(path.read_bytes() for path in paths))
+    assert len(outputs) == 1
+
+    shards = [DECOMPRESS[compression](data).decode('utf-8') for data in outputs.pop()]
+    assert shards == [''.join(LINES[0::2]), ''.join(LINES[1::2])]
@@ -0,0 +1,42 @@
+"""Parity of 'MosesTokenizer' with the NLTK 3.2.5 port of the Moses tokenizer.
+The reference tokens in 'data/moses.json' were produced by 'nltk.tokenize.moses.MosesTokenizer(lang).tokenize(text,
+agressive_dash_splits=..., escape=...)' with NLTK 3.2.5, for en, fr and de texts covering nonbreaking and numeric only
+prefixes, multidots, apostrophes, commas within numbers, XML escapes and control characters.
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+from prenlp.tokenizer import MosesTokenizer
+
+with open(str(Path(__file__).parent/'data'/'moses.json'), 'r', encoding='utf-8') as reader:
+    CASES = json.load(reader)
+
+def moses_tokens(nltk_tokens: list) -> list:
+    # NLTK keeps the backslashes of Perl replacements, in split hyphens and in the apostrophes of languages
+    # other than en, fr and it. They are dropped as in Moses (see 'MosesTokenizer').
+    return [token.replace(r'\@-\@', '@-@').replace(r'\&apos;', '&apos;').replace(r"\'", "'") for token in nltk_tokens]
+
+@pytest.mark.parametrize('case', CASES, ids=lambda case: '{lang}-{aggressive_dash_splits:d}{escape:d}'.format(**case))
+def test_moses_matches_nltk(case):
+    tokenizer = MosesTokenizer(case['lang'], aggressive_dash_splits=case['aggressive_dash_splits'], escape=case['escape'])
+    assert tokenizer.tokenize(case['text']) == moses_tokens(case['tokens'])
+
+def test_cases_cover_options():
+    options = {(case['lang'], case['aggressive_dash_splits'], case['escape']) for case in CASES}
+    assert options == {(lang, dash, escape) for lang in ['en', 'fr', 'de'] for dash in [False, True] for escape in [False, True]}
+
+def test_nonbreaking_prefixes():
+    tokenizer = MosesTokenizer('en')
+    assert tokenizer('Mr. Smith arrived.') == ['Mr.', 'Smith', 'arrived', '.']
+    assert tokenizer('See No. 5 now.') == ['See', 'No.', '5', 'now', '.']
+    assert tokenizer('The answer is No. Five.') == ['The', 'answer', 'is', 'No', '.', 'Five', '.']
+    assert tokenizer('It ends. then lowercase') == ['It', 'ends.', 'then', 'lowercase']
+    # As in NLTK, a prefix with periods is never alphabetic, so its final period is split unless it is listed.
+    assert tokenizer('U.S.A. Today') == ['U.S.A', '.', 'Today']
+    assert tokenizer('Wait... What....') == ['Wait', '...', 'What', '....']
+
+def test_unknown_lang():
+    with pytest.raises(ValueError):
+        MosesTokenizer('xx')
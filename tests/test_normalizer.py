@@ -0,0 +1,159 @@
+"""Equivalence of 'Normalizer' and 'NamuMarkupNormalizer' with the sequential regex passes they replaced,
+on generated and edge-case inputs.
+"""
+import re
+import random
+from pathlib import Path
+
+import pytest
+
+from prenlp.data import Normalizer, NamuMarkupNormalizer
+from prenlp.data.emoji import load_emoji_sequences
+
+# Regexes of the sequential Normalizer, applied one by one in this order.
+# The emoji alternation is pinned in 'data/emoji_pattern.txt', as it was before the trie matcher (commit 8c42f3e).
+SEQUENTIAL_PATTERNS = [
+    ('url', r'(https?|ftp|www)\S+'),
+    ('tag', r'<[^>]*>'),
+    ('emoji', None),
+    ('email', r'[a-zA-Z0-9.!#$%&\'*+/=?^_`{|}~-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9.]+'),
+    ('tel', r'[()+\d.\-]*[ ]?\d{2,4}[-. ]+\d{3,4}[-. ]+\d{3,4}'),
+    ('image', r'\S+.(jpg|jpeg|png|gif)'),
+]
+
+# Rules of the sequential namu markup normalization, applied one by one in this order.
+SEQUENTIAL_NAMU_RULES = [
+    r'\[+(?:[iI]nclude|youtube|분류|목차|각주|파일).*\]+',
+    r'\#redirect[ \t]*.*',
+    r"'''",
+    r'~~(?!~).*?~~',
+    r'--(?!~).*?--',
+    r'\|\|.*\|\|',
+    r'\{\{\{.*?\}\}\}',
+    r'^(\{\{\{.*)',
+    r'^(\}\}\})',
+    r'^([ \t]+\*).*',
+    r'[ \t]1\..*',
+    r'\|\|',
+    r'\{\{\|',
+    r'\|\}\}',
+    r'^\>',
+    r'width=',
+    r'(?:\[\[)\S*?\|',
+    r'(?:\[\[)',
+    r'(?:\]\])',
+    r'\[\*(.*?)\]',
+]
+
+EMOJIS = load_emoji_sequences()
+
+WORDS = ['아', '더빙', '진짜', '영화', 'movie', 'the', 'Mr.', '10점', '2008년', 'ㅋㅋ', 'café', '...', '!', '?']
+
+FRAGMENTS = ['http://a.b/c', 'https://namu.wiki/w/영화', 'www.example.com', 'ftp://x', 'http', 'www', '<br />', '<b>', '</b>',
+             '<', '>', '<a href="http://a.b">', 'user@example.com', 'a.b+c@d-e.co.kr', '@', 'x@y', '010-1234-5678',
+             '(02) 123-4567', '+82 10 1234 5678', '12 345 6789', '1234', '2020.01.01', 'cat.jpg', 'a.png', 'x.gif',
+             'photo.jpeg', 'jpg', '1️⃣', '#️⃣', '*️⃣', '⃣', '️', '‍',
+             '\U0001f3fb', '\U0001f1f0\U0001f1f7', '\U0001f1f0', '\U0001f469‍❤️‍\U0001f48b‍\U0001f468',
+             '\U0001f44d\U0001f3fd', '❤', '©', '\n', '\t', '-', '.', ' ']
+
+NAMU_FRAGMENTS = ["'''", "''", '~~', '~~~', '--', '---', '||', '|', '{{{', '}}}', '{{{#!html', '{{|', '|}}', '>', '\n>', '\n',
+                  '\n{{{', '\n}}}', '\n *', '\n  * item', ' 1.', '\t1.', 'width=', 'width=100', '[[', ']]', '[[a|b]]',
+                  '[[링크]]', '[[파일:a.png|width=100]]', '[*', '[* 주석]', ']', '[include(틀:a)]', '[[include]]',
+                  '[youtube(x)]', '[분류:a]', '[목차]', '[각주]', '#redirect', '#redi', 'rect', '#redirect 문서', ' ', '\t']
+
+def sequential_normalize(text: str, repls: dict) -> str:
+    for name, pattern in SEQUENTIAL_PATTERNS:
+        if repls[name] is not None:
+            text = sequential_regex(name, pattern).sub(repls[name], text)
+    return text
+
+_regexes = {}
+
+def baseline_emoji_pattern() -> str:
+    pattern = (Path(__file__).parent/'data'/'emoji_pattern.txt').read_text(encoding='utf-8')
+    # The keycaps '#' and '*' were escaped twice, so that the baseline matched them as backslashes and left the
+    # '#' or '*' before the variation selector and the enclosing keycap it replaced.
+    # This is the one fix made by the trie matcher (see test_emoji_keycaps).
+    return pattern.replace(r'\\#', '#').replace(r'\\*', r'\*')
+
+def sequential_regex(name: str, pattern: str):
+    if name not in _regexes:
+        if pattern is None:
+            pattern = baseline_emoji_pattern()
+        _regexes[name] = re.compile(pattern)
+    return _regexes[name]
+
+def sequential_namu_normalize(text: str, repl: str) -> str:
+    for rule in SEQUENTIAL_NAMU_RULES:
+        text = re.compile(rule, re.MULTILINE).sub(repl, text)
+    return text
+
+def generate_texts(n_texts: int, fragments: list, seed: int=0) -> list:
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n_texts):
+        pieces = []
+        for _ in range(rng.randint(0, 12)):
+            choice = rng.random()
+            if choice < 0.4:
+                pieces.append(rng.choice(fragments))
+            elif choice < 0.5:
+                pieces.append(rng.choice(EMOJIS))
+            else:
+                pieces.append(rng.choice(WORDS))
+        # Fragments are glued together as often as separated, so that matches can overlap or be created by replacements.
+        texts.append(''.join(piece + rng.choice(['', ' ']) for piece in pieces))
+    return texts
+
+EDGE_CASES = ['', ' ', '\n', 'a', '<>', '<<>>', '@.', 'a@b.c', 'http', 'https://', '1', '12-345-678', '010-1234-5678',
+              'a.jpg', '.jpg', 'jpg.jpg', '<http://a.b>', 'http://a.b<c>', 'x <b>010</b>-1234-5678 y',
+              'http://a 010-1234-5678', '1 http://a 234-5678', '#⃣', '#️⃣', '1⃣', '⃣⃣',
+              '\U0001f3fb\U0001f3fb', '\U0001f1f0\U0001f1f7\U0001f1f0', '‍‍', 'user@example.com.jpg',
+              'a' * 1000, '\U0001f600' * 100]
+
+REPL_CONFIGS = [
+    {},
+    {'url_repl': '', 'tag_repl': '', 'emoji_repl': '', 'email_repl': '', 'tel_repl': '', 'image_repl': ''},
+    {'url_repl': 'X', 'tag_repl': '<b>', 'emoji_repl': '1', 'email_repl': '@', 'tel_repl': 'T', 'image_repl': '.jpg'},
+    {'url_repl': None, 'tag_repl': ' ', 'emoji_repl': None, 'email_repl': ' ', 'tel_repl': None, 'image_repl': ' '},
+    {'emoji_repl': None, 'fused': False},
+]
+
+@pytest.mark.parametrize('config', REPL_CONFIGS)
+def test_normalizer_matches_sequential_passes(config):
+    normalizer = Normalizer(**config)
+    repls = {name: config.get(name+'_repl', ' ') for name, _ in SEQUENTIAL_PATTERNS}
+    for text in EDGE_CASES + generate_texts(3000, FRAGMENTS, seed=len(config)):
+        assert normalizer.normalize(text) == sequential_normalize(text, repls), repr(text)
+
+def test_emoji_keycaps():
+    baseline = re.compile((Path(__file__).parent/'data'/'emoji_pattern.txt').read_text(encoding='utf-8'))
+    for keycap in ['#\ufe0f\u20e3', '*\ufe0f\u20e3']:
+        assert baseline.sub(' ', keycap) == keycap[0] + ' '
+        assert Normalizer(emoji_repl=' ').normalize(keycap) == ' '
+
+def test_normalize_batch_matches_normalize():
+    normalizer = Normalizer()
+    texts = generate_texts(2500, FRAGMENTS, seed=1)
+    expected = [normalizer.normalize(text) for text in texts]
+    assert normalizer.normalize_batch(texts) == expected
+    assert normalizer.normalize_batch(texts, workers=2, chunksize=500) == expected
+
+@pytest.mark.parametrize('repl', ['', ' ', 'X', '|', '['])
+def test_namu_markup_normalizer_matches_sequential_rules(repl):
+    normalizer = NamuMarkupNormalizer(repl)
+    texts = ['', '#redi[include]rect', '{{{a\n}}}', '\n{{{a}}}\n}}}', '[[[[a|b]]]]', '[* [[a|b]]]', '>a\n>b',
+             "'''''", '-----', '~~~~', '||a||b||'] + generate_texts(3000, NAMU_FRAGMENTS, seed=len(repl))
+    for text in texts:
+        assert normalizer.normalize(text) == sequential_namu_normalize(text, repl), repr(text)
+
+def test_normalizer_stats_are_opt_in():
+    texts = ['a', 'user@example.com', 'http://a.b <b>']
+    normalizer = Normalizer()
+    normalizer.normalize_batch(texts)
+    assert normalizer.num_normalized == 0 and not normalizer.skipped
+
+    normalizer = Normalizer(stats=True)
+    normalizer.normalize_batch(texts)
+    assert normalizer.num_normalized == 3
+    assert normalizer.skipped == {'url': 2, 'tag': 2, 'emoji': 3, 'email': 2, 'tel': 3, 'image': 3}
@@ -0,0 +1,47 @@
+import os
+import threading
+import multiprocessing
+
+import pytest
+
+from prenlp.utils import chunked, imap_ordered, prefetch
+
+def square(x: int) -> int:
+    return x * x
+
+def test_imap_ordered_keeps_order():
+    items = list(range(1000))
+    expected = [square(x) for x in items]
+    assert list(imap_ordered(square, items)) == expected
+    assert list(imap_ordered(square, iter(items), workers=2, chunksize=7, max_pending=3)) == expected
+    assert list(imap_ordered(square, iter([]), workers=2)) == []
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork', reason='workers are not forked')
+def test_imap_ordered_forks_before_reading_input(monkeypatch):
+    fork = os.fork
+    thread_counts = []
+
+    def counting_fork():
+        thread_counts.append(threading.active_count())
+        return fork()
+
+    monkeypatch.setattr(os, 'fork', counting_fork)
+    threads = threading.active_count()
+    batches = prefetch(chunked(range(1000), 10), max_prefetch=4)
+    results = imap_ordered(sum, batches, workers=2, chunksize=1)
+    assert list(results) == [sum(range(i, i+10)) for i in range(0, 1000, 10)]
+    assert thread_counts == [threads, threads]
+
+def test_imap_ordered_terminates_unused_pool():
+    children = len(multiprocessing.active_children())
+    results = imap_ordered(square, iter(range(100)), workers=2, chunksize=7)
+    assert len(multiprocessing.active_children()) == children + 2
+    del results
+    assert len(multiprocessing.active_children()) == children
+
+    results = imap_ordered(square, iter(range(100)), workers=2, chunksize=7)
+    assert next(results) == 0
+    results.close()
+    assert len(multiprocessing.active_children()) == children
+    with pytest.raises(StopIteration):
+        next(results)
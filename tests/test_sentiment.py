@@ -0,0 +1,37 @@
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from prenlp.data import IMDB, NSMC
+
+# Reviews in archive order, labels interleaved.
+IMDB_REVIEWS = [('train', 'neg', 'boring'), ('train', 'pos', 'great'), ('test', 'pos', 'fine\tmovie'),
+                ('train', 'neg', 'awful'), ('test', 'neg', 'bad'), ('train', 'pos', 'superb')]
+
+def test_imdb_keeps_positive_reviews_first(tmp_path):
+    with tarfile.open(str(tmp_path/'aclImdb_v1.tar.gz'), 'w:gz') as tgfile:
+        for i, (data, label, text) in enumerate(IMDB_REVIEWS):
+            content = text.encode('utf-8')
+            tarinfo = tarfile.TarInfo('aclImdb/{}/{}/{}_7.txt'.format(data, label, i))
+            tarinfo.size = len(content)
+            tgfile.addfile(tarinfo, io.BytesIO(content))
+
+    for _ in range(2): # built from the archive, then reopened
+        train, test = IMDB(root=str(tmp_path))
+        assert list(train) == [['great', 'pos'], ['superb', 'pos'], ['boring', 'neg'], ['awful', 'neg']]
+        assert list(test) == [['fine movie', 'pos'], ['bad', 'neg']]
+    assert not list((tmp_path/'aclImdb').glob('*.tmp'))
+
+def test_nsmc_labels_are_int(tmp_path):
+    with zipfile.ZipFile(str(tmp_path/'master.zip'), 'w') as zfile:
+        zfile.writestr('nsmc-master/ratings_train.txt', 'id\tdocument\tlabel\n1\t아 더빙.. 진짜 짜증나네요 목소리\t0\n2\t재밌다\t1\n')
+        zfile.writestr('nsmc-master/ratings_test.txt', 'id\tdocument\tlabel\n3\t최고\t1\n')
+
+    for _ in range(2): # built from the archive, then reopened
+        train, test = NSMC(root=str(tmp_path))
+        assert list(train) == [['아 더빙.. 진짜 짜증나네요 목소리', 0], ['재밌다', 1]]
+        assert test[0] == ['최고', 1]
@@ -0,0 +1,80 @@
+import pickle
+
+import pytest
+
+from prenlp.tokenizer import SentencePiece, NLTKMosesTokenizer, Mecab, MosesTokenizer, CachedTokenizer
+
+TEXTS = ['hello world, this is sentence number {}. It\'s "quoted" & 3.5 U.S. dollars.'.format(i) for i in range(2500)]
+
+@pytest.fixture(scope='module')
+def tokenizer(tmp_path_factory):
+    pytest.importorskip('numpy')
+    pytest.importorskip('sentencepiece')
+
+    model_prefix = str(tmp_path_factory.mktemp('sentencepiece')/'sentencepiece')
+    corpus = ['hello world, this is sentence number {}'.format(i) for i in range(500)]
+    SentencePiece.train(input=iter(corpus), model_prefix=model_prefix, vocab_size=60, num_threads=1)
+    return SentencePiece.load(model_prefix+'.model')
+
+def test_batch_round_trip(tokenizer):
+    texts = ['hello world', '', 'this is sentence number 7']
+    assert tokenizer.decode_batch(tokenizer.encode_batch(texts)) == texts
+    assert tokenizer.decode_batch(tokenizer.encode_batch(texts, padding=True)) == texts
+    assert tokenizer.decode_batch(tokenizer.encode_batch(texts, out='pieces')) == texts
+
+def test_decode_empty_batch(tokenizer):
+    assert tokenizer.decode_batch([]) == []
+    assert tokenizer.decode_batch(tokenizer.encode_batch([])) == []
+    assert tokenizer.decode_batch(tokenizer.encode_batch([], padding=True)) == []
+
+def test_sentencepiece_pickle_round_trip(tokenizer):
+    restored = pickle.loads(pickle.dumps(tokenizer))
+    assert restored.processor.serialized_model_proto() == tokenizer.processor.serialized_model_proto()
+    assert restored.pad_id == tokenizer.pad_id
+    assert [restored.tokenize(text) for text in TEXTS[:10]] == [tokenizer.tokenize(text) for text in TEXTS[:10]]
+
+    # A tokenizer without a loaded model has an empty proto.
+    assert pickle.loads(pickle.dumps(SentencePiece())).processor.serialized_model_proto() == b''
+
+def test_nltk_moses_pickle_round_trip():
+    pytest.importorskip('nltk.tokenize.moses')
+    nltk = pytest.importorskip('nltk')
+    try:
+        nltk.data.find('misc/perluniprops')
+        nltk.data.find('corpora/nonbreaking_prefixes')
+    except LookupError:
+        pytest.skip('NLTK resources are not downloaded')
+
+    tokenizer = NLTKMosesTokenizer()
+    restored = pickle.loads(pickle.dumps(tokenizer))
+    assert restored.tokenizer is None
+    assert [restored.tokenize(text) for text in TEXTS[:10]] == [tokenizer.tokenize(text) for text in TEXTS[:10]]
+
+def test_mecab_pickle_round_trip():
+    pytest.importorskip('konlpy')
+    try:
+        tokenizer = Mecab()
+    except Exception as ex:
+        pytest.skip('Mecab is not installed ({})'.format(ex))
+
+    restored = pickle.loads(pickle.dumps(tokenizer))
+    assert restored.tokenizer is None
+    text = '모든 이야기에는 끝이 있지만, 인생에서의 모든 끝은 새로운 시작을  의미한다.'
+    assert restored.tokenize(text) == tokenizer.tokenize(text)
+
+def test_moses_pickle_round_trip():
+    tokenizer = MosesTokenizer(lang='fr', aggressive_dash_splits=True, escape=True)
+    restored = pickle.loads(pickle.dumps(tokenizer))
+    assert [restored.tokenize(text) for text in TEXTS[:10]] == [tokenizer.tokenize(text) for text in TEXTS[:10]]
+
+@pytest.mark.parametrize('name', ['moses', 'cached', 'sentencepiece'])
+def test_tokenize_parallel_matches_serial(request, name):
+    if name == 'sentencepiece':
+        tokenizer = request.getfixturevalue('tokenizer')
+    else:
+        tokenizer = MosesTokenizer(aggressive_dash_splits=True)
+        if name == 'cached':
+            tokenizer = CachedTokenizer(tokenizer, max_entries=100)
+    expected = [tokenizer.tokenize(text) for text in TEXTS]
+    assert list(tokenizer.tokenize_parallel(iter(TEXTS), workers=2, chunksize=300)) == expected
+    assert list(tokenizer.tokenize_parallel(TEXTS, workers=1)) == expected
@@ -0,0 +1,131 @@
+import random
+from collections import Counter
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from prenlp.vocab import Vocab, HeavyHitters
+
+class WhitespaceTokenizer:
+    def tokenize(self, text: str) -> list:
+        return text.split()
+
+# Token 'a' occurs 6 times, 'b' 5 times, ..., 'f' once.
+LINES = [' '.join('abcdef'[:i]) for i in range(6, 0, -1)]
+
+@pytest.fixture
+def corpus(tmp_path):
+    path = tmp_path/'corpus.txt'
+    path.write_text(''.join(line + '\n' for line in LINES), encoding='utf-8')
+    return str(path)
+
+def zipf_tokens(n_tokens: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return ['t{}'.format(int(rng.paretovariate(1.0))) for _ in range(n_tokens)]
+
+@pytest.fixture
+def vocab(corpus):
+    vocab = Vocab()
+    vocab.build(corpus, WhitespaceTokenizer())
+    return vocab
+
+def test_encode_maps_unknown_tokens(vocab):
+    assert list(vocab.vocab) == ['[PAD]', '[UNK]', '[BOS]', '[EOS]', 'a', 'b', 'c', 'd', 'e', 'f']
+    ids = vocab.encode(['a', 'x', 'f', '[PAD]', ''])
+    assert ids.dtype == np.int32
+    assert ids.tolist() == [4, vocab.unk_id, 9, vocab.pad_id, vocab.unk_id]
+    assert vocab.decode(ids) == ['a', '[UNK]', 'f', '[PAD]', '[UNK]']
+    assert vocab.encode([]).tolist() == []
+
+def test_encode_batch(vocab):
+    batch = [['a', 'b'], [], ['x', 'c', 'd']]
+    values, offsets = vocab.encode_batch(batch)
+    assert values.tolist() == [4, 5, vocab.unk_id, 6, 7]
+    assert offsets.tolist() == [0, 2, 2, 5]
+    assert vocab.decode_batch((values, offsets)) == [['a', 'b'], [], ['[UNK]', 'c', 'd']]
+
+    padded = vocab.encode_batch(batch, padding=True)
+    assert padded.tolist() == [[4, 5, 0], [0, 0, 0], [1, 6, 7]]
+    assert vocab.decode_batch(padded) == [['a', 'b'], [], ['[UNK]', 'c', 'd']]
+    assert vocab.decode_batch([[4, 5], []]) == [['a', 'b'], []]
+    assert vocab.encode_batch([], padding=True).shape == (0, 0)
+
+def test_save_load_round_trip(vocab, tmp_path):
+    vocab.vocab['tab\tin token'] = len(vocab.vocab)
+    vocab.save(str(tmp_path/'corpus'))
+    loaded = Vocab.load(str(tmp_path/'corpus.vocab'))
+    assert loaded.vocab == vocab.vocab
+    assert len(loaded) == loaded.vocab_size == len(vocab)
+    assert loaded.encode(['a', 'tab\tin token', 'x']).tolist() == [4, 10, loaded.unk_id]
+
+    # Special tokens may be renamed, but must be in the file.
+    with pytest.raises(ValueError):
+        Vocab.load(str(tmp_path/'corpus.vocab'), unk_token='<unk>')
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_build_cutoffs_and_report(corpus, workers):
+    vocab = Vocab(vocab_size=100)
+    report = vocab.build(corpus, WhitespaceTokenizer(), min_freq=3, workers=workers)
+    assert report == {'total': 21, 'tokens': 6, 'capacity': None, 'error': 0, 'bound': 0}
+    assert vocab.freqs == Counter({'a': 6, 'b': 5, 'c': 4, 'd': 3, 'e': 2, 'f': 1})
+    assert list(vocab.vocab)[4:] == ['a', 'b', 'c', 'd']
+
+    vocab = Vocab(vocab_size=7)
+    vocab.build(corpus, WhitespaceTokenizer(), workers=workers)
+    assert list(vocab.vocab)[4:] == ['a', 'b', 'c']
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_build_with_max_entries(tmp_path, workers):
+    tokens = zipf_tokens(20000, seed=workers)
+    path = tmp_path/'corpus.txt'
+    path.write_text(''.join(' '.join(tokens[i:i+10]) + '\n' for i in range(0, len(tokens), 10)), encoding='utf-8')
+    counts = Counter(tokens)
+
+    vocab = Vocab(vocab_size=1000)
+    report = vocab.build(str(path), WhitespaceTokenizer(), workers=workers, max_entries=20)
+    assert report['total'] == len(tokens) and report['capacity'] == 20
+    assert 0 < report['error'] <= report['bound'] == len(tokens) / 21
+    for token, count in counts.items():
+        assert count - report['error'] <= vocab.freqs[token] <= count
+        if count > report['error']:
+            assert token in vocab
+    assert len(vocab.freqs) <= 2 * 20
+
+def test_heavy_hitters_guarantee():
+    for capacity in [1, 5, 50]:
+        for seed in range(3):
+            tokens = zipf_tokens(5000, seed)
+            # Distinct tokens in round-robin order are the worst case, forcing a reduction every 2 * capacity tokens.
+            tokens += ['u{}'.format(i % (2*capacity+1)) for i in range(5000)]
+            counts = Counter(tokens)
+            counter = HeavyHitters(capacity)
+            for i in range(0, len(tokens), 7):
+                counter.update(tokens[i:i+7])
+
+            n = len(tokens)
+            assert counter.total == n and counter.error <= counter.bound == n / (capacity+1)
+            for token, count in counts.items():
+                assert count - counter.error <= counter.counts[token] <= count
+                if count > n / (capacity+1):
+                    assert token in counter.counts
+
+def test_heavy_hitters_merge():
+    streams = [zipf_tokens(3000, seed) for seed in range(4)]
+    counts = Counter(token for stream in streams for token in stream)
+    merged = HeavyHitters(10)
+    for stream in streams:
+        counter = HeavyHitters(10)
+        counter.update(stream)
+        merged.merge(counter)
+
+    assert merged.total == 12000 and merged.error <= merged.bound
+    assert merged.report() == {'total': 12000, 'tokens': len(merged), 'capacity': 10, 'error': merged.error,
+                               'bound': merged.bound}
+    for token, count in counts.items():
+        assert count - merged.error <= merged.counts[token] <= count
+        if count > merged.bound:
+            assert token in merged.counts
+
+    with pytest.raises(ValueError):
+        HeavyHitters(0)